@@ -0,0 +1,56 @@
+import hashlib
+from collections import OrderedDict
+from fastapi import Request, Response, status
+from typing import Hashable, Optional, Tuple
+
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def weak_etag(etag: str) -> str:
+    return etag if etag.startswith("W/") else "W/" + etag
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2): opaque tags are compared with any W/ prefix ignored on both sides."""
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """200 with `body`, or an empty 304 when the client already holds `etag`."""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """Small LRU of serialized response bodies and their ETags.
+
+    Keys start with the catalog version, so a bump simply makes older
+    entries unreachable until they age out.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[bytes, str]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[bytes, str]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, body: bytes) -> Tuple[bytes, str]:
+        entry = (body, strong_etag(body))
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
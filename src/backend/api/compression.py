@@ -0,0 +1,207 @@
+import os
+import zlib
+from typing import Callable, Dict, Iterable, Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.backend.api.caching import weak_etag
+
+try:
+    import brotli
+except ImportError:  # optional: br is simply not offered
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd is simply not offered
+    zstandard = None
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+# Chunks at least this large are compressed on a worker thread, off the event loop.
+COMPRESSION_THREAD_MINIMUM_SIZE = int(os.getenv("COMPRESSION_THREAD_MINIMUM_SIZE", str(128 * 1024)))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+
+# Media types that are already compressed or must not be buffered.
+_SKIPPED_MEDIA_PREFIXES = (
+    "image/", "video/", "audio/", "font/woff",
+    "application/gzip", "application/x-gzip", "application/zip", "application/zstd",
+    "text/event-stream",
+)
+
+
+class _Encoder:
+    """Incremental compressor: `compress` for middle chunks, `finish` for the last one."""
+
+    def __init__(self, compress: Callable[[bytes], bytes], flush: Callable[[], bytes], finish: Callable[[], bytes]):
+        self._compress, self._flush, self._finish = compress, flush, finish
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        return self._compress(chunk) + (self._finish() if final else self._flush())
+
+
+def _gzip(level: int) -> _Encoder:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return _Encoder(compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush)
+
+
+def _brotli(quality: int) -> _Encoder:
+    compressor = brotli.Compressor(quality=quality)
+    return _Encoder(compressor.process, compressor.flush, compressor.finish)
+
+
+def _zstd(level: int) -> _Encoder:
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return _Encoder(
+        compressor.compress,
+        lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH),
+    )
+
+
+def available_encodings() -> Dict[str, Callable[[], _Encoder]]:
+    """Supported Content-Encodings in server preference order."""
+    encodings = {}
+    if zstandard is not None:
+        encodings["zstd"] = lambda: _zstd(ZSTD_LEVEL)
+    if brotli is not None:
+        encodings["br"] = lambda: _brotli(BROTLI_QUALITY)
+    encodings["gzip"] = lambda: _gzip(GZIP_LEVEL)
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, supported: Iterable[str]) -> Optional[str]:
+    """Pick the client's highest-q encoding among `supported`; ties go to server order."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in supported:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """gzip / br / zstd negotiation for responses of at least `minimum_size` bytes.
+
+    Streaming responses are compressed chunk by chunk with a sync flush, so
+    clients see data as it is produced. Responses that already carry a
+    Content-Encoding, partial and bodiless responses, and already-compressed
+    media types pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        coding = negotiate_encoding(request_headers.get("accept-encoding", ""), self.encodings)
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(
+            send, coding, self.encodings[coding], self.minimum_size, request_headers.get("if-none-match", "")
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    def __init__(
+        self, send: Send, coding: str, make_encoder: Callable[[], _Encoder], minimum_size: int, if_none_match: str = ""
+    ):
+        self._send = send
+        self.if_none_match = if_none_match
+        self.coding = coding
+        self.make_encoder = make_encoder
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            if message["status"] == 304:
+                self._match_revalidated_etag()
+            if (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or media_type.startswith(_SKIPPED_MEDIA_PREFIXES)
+            ):
+                await self._start_passthrough(message)
+        elif message["type"] != "http.response.body":
+            await self._send(message)
+        elif self.encoder is None:
+            body, more_body = message.get("body", b""), message.get("more_body", False)
+            if not more_body and len(body) < self.minimum_size:
+                await self._start_passthrough(message)
+                return
+            self.encoder = self.make_encoder()
+            data = await self._compress(body, more_body)
+            self._mark_compressed(content_length=None if more_body else len(data))
+            await self._send(self.start)
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+        else:
+            more_body = message.get("more_body", False)
+            data = await self._compress(message.get("body", b""), more_body)
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _match_revalidated_etag(self) -> None:
+        # A client revalidating with the weak tag holds the compressed
+        # representation; hand back the tag in the form it stored.
+        headers = MutableHeaders(raw=self.start["headers"])
+        etag = headers.get("etag")
+        if etag and weak_etag(etag) in {tag.strip() for tag in self.if_none_match.split(",")}:
+            headers["ETag"] = weak_etag(etag)
+
+    async def _start_passthrough(self, message: Message) -> None:
+        self.passthrough = True
+        if message is not self.start:
+            await self._send(self.start)
+        await self._send(message)
+
+    async def _compress(self, body: bytes, more_body: bool) -> bytes:
+        if len(body) >= COMPRESSION_THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self.encoder.compress, body, not more_body)
+        return self.encoder.compress(body, not more_body)
+
+    def _mark_compressed(self, content_length: Optional[int]) -> None:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.coding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            if "content-length" in headers:
+                del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # The encoded bytes differ from the identity ones, so a strong
+        # validator would be wrong; If-None-Match compares weakly anyway.
+        etag = headers.get("etag")
+        if etag:
+            headers["ETag"] = weak_etag(etag)
@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List, Annotated
-from src.backend.database.configure import get_db
+from datetime import date
+from typing import Dict, List, Annotated, Literal, Optional
+from src.backend.api.caching import ResponseCache, etag_response, strong_etag
+from src.backend.database.async_configure import get_db
 from src.backend.models.auth_user import AuthUser
 from src.backend.models.enums import ExerciseGroup
-from src.backend.models.exercise import Exercise
-from src.backend.schemas.exercise import ExerciseCreate, ExerciseOut, ExerciseUpdate
+from src.backend.schemas.exercise import ExerciseCreate, ExerciseHistoryPoint, ExerciseOut, ExerciseUpdate, LastPerformanceOut
+from src.backend.schemas.pagination import Page
+from src.backend.crud.catalog import EXERCISE_CATALOG, get_catalog_version
+from src.backend.crud.exercise_performance import MAX_LAST_PERFORMANCE_IDS, get_last_performances
+from src.backend.crud.exercise_volume import get_exercise_history
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.backend.crud.user import get_user_by_username
 from src.backend.auth.util import (
     get_current_active_user
 )
@@ -14,64 +22,134 @@ from src.backend.crud.exercise import (
     create_batch_exercise,
     create_exercise,
     delete_exercise,
-    get_all_exercises,
+    get_exercises_page,
     get_all_exercises_categorized,
     get_exercise_by_id,
+    get_exercise_by_name,
+    resolve_exercise_names,
     update_exercise,
 )
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ExerciseOut])
-def get_exercises(name: str = None, db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
-    exercises = get_all_exercises(db, current_user)
-    if name:
-        exercises = [e for e in exercises if e.name.lower() == name.lower()]
-    return exercises
+# Catalog reads are cached per (catalog version, visibility scope, query) and
+# revalidated with ETags; every exercise write bumps the version.
+catalog_cache = ResponseCache()
+_page_adapter = TypeAdapter(Page[ExerciseOut])
+_categorized_adapter = TypeAdapter(Dict[str, List[ExerciseOut]])
+_categories_body = TypeAdapter(List[str]).dump_json([group.value for group in ExerciseGroup])
+_categories_etag = strong_etag(_categories_body)
 
-@router.get("/categorized")
-def get_exercises_categorized(db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
-    return get_all_exercises_categorized(db, current_user)
+def _visibility_scope(current_user: AuthUser) -> str:
+    # Admins see everything; other users see the global catalog plus their own.
+    return "admin" if current_user.is_admin else f"user:{current_user.id}"
+
+@router.get("/", response_model=Page[ExerciseOut])
+async def get_exercises(
+    request: Request,
+    name: str = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_active_user)
+):
+    version = await get_catalog_version(db, EXERCISE_CATALOG)
+    key = (version, _visibility_scope(current_user), "page", name, cursor, limit)
+    cached = catalog_cache.get(key)
+    if cached is None:
+        exercises, next_cursor = await get_exercises_page(db, current_user, cursor, limit, name=name)
+        page = {"items": exercises, "next_cursor": next_cursor, "limit": limit}
+        cached = catalog_cache.put(key, _page_adapter.dump_json(_page_adapter.validate_python(page)))
+    return etag_response(request, *cached)
+
+@router.get("/categorized", response_model=Dict[str, List[ExerciseOut]])
+async def get_exercises_categorized(request: Request, db: AsyncSession = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
+    version = await get_catalog_version(db, EXERCISE_CATALOG)
+    key = (version, _visibility_scope(current_user), "categorized")
+    cached = catalog_cache.get(key)
+    if cached is None:
+        grouped = await get_all_exercises_categorized(db, current_user)
+        cached = catalog_cache.put(key, _categorized_adapter.dump_json(_categorized_adapter.validate_python(grouped)))
+    return etag_response(request, *cached)
 
 @router.get("/categories", response_model=List[str])
-def get_exercise_categories():
-    return [group.value for group in ExerciseGroup]
+async def get_exercise_categories(request: Request):
+    return etag_response(request, _categories_body, _categories_etag)
+
+# Declared before /{exercise_id} so the literal path is not parsed as an id
+@router.get("/last-performance", response_model=List[LastPerformanceOut])
+async def get_last_performance_handler(
+    ids: str = Query(..., description="Comma-separated exercise ids"),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_active_user)
+):
+    try:
+        exercise_ids = [UUID(value.strip()) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(422, "ids must be comma-separated exercise UUIDs")
+    if len(exercise_ids) > MAX_LAST_PERFORMANCE_IDS:
+        raise HTTPException(422, f"At most {MAX_LAST_PERFORMANCE_IDS} exercise ids per request")
+    return await get_last_performances(db, current_user.id, exercise_ids)
 
 @router.get("/{exercise_id}", response_model=ExerciseOut)
-def get_exercise_by_id_handler(exercise_id: UUID, db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
-    exercise = get_exercise_by_id(db, exercise_id, current_user)
+async def get_exercise_by_id_handler(exercise_id: UUID, db: AsyncSession = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
+    exercise = await get_exercise_by_id(db, exercise_id, current_user)
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
     return exercise
 
+@router.get("/{exercise_id}/history", response_model=List[ExerciseHistoryPoint])
+async def get_exercise_history_handler(
+    exercise_id: UUID,
+    user: Optional[str] = None,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    bucket: Literal["week", "month"] = "week",
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_active_user)
+):
+    if not await get_exercise_by_id(db, exercise_id, current_user):
+        raise HTTPException(404, "Exercise not found")
+    if user is None or user == current_user.username:
+        user_id = current_user.id
+    elif not current_user.is_admin:
+        raise HTTPException(403, "Forbidden")
+    else:
+        owner = await get_user_by_username(db, user)
+        if not owner:
+            raise HTTPException(404, "User not found")
+        user_id = owner.id
+    return await get_exercise_history(db, user_id, exercise_id, start, end, bucket)
+
 @router.post("/", response_model=ExerciseOut)
-def create_exercise_handler(exercise: ExerciseCreate, db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
-    existing = db.query(Exercise).filter(Exercise.name == exercise.name).first()
-    if existing:
+async def create_exercise_handler(exercise: ExerciseCreate, db: AsyncSession = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
+    existing, _ = await resolve_exercise_names(db, [exercise.name])
+    # The catalog index may still hold a name another worker just freed; confirm before refusing.
+    if existing and await get_exercise_by_name(db, exercise.name):
         raise HTTPException(status_code=409, detail=f"Exercise '{exercise.name}' already exists")
-    return create_exercise(db, exercise, current_user)
+    return await create_exercise(db, exercise, current_user)
 
 @router.post("/batch", response_model=List[ExerciseOut])
-def create_batch_exercise_handler(exercises: List[ExerciseCreate], db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
-    return create_batch_exercise(db, exercises, current_user)
+async def create_batch_exercise_handler(exercises: List[ExerciseCreate], db: AsyncSession = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
+    return await create_batch_exercise(db, exercises, current_user)
 
 @router.patch("/{exercise_id}", response_model=ExerciseOut)
-def update_exercise_handler(exercise_id: UUID, updates: ExerciseUpdate, db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
+async def update_exercise_handler(exercise_id: UUID, updates: ExerciseUpdate, db: AsyncSession = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
     # 1) Existence + visibility check
-    existing = get_exercise_by_id(db, exercise_id, current_user)
+    existing = await get_exercise_by_id(db, exercise_id, current_user)
     if not existing:
         raise HTTPException(404, "Exercise not found")
     # 2) Ownership/admin check + update
-    updated = update_exercise(db, exercise_id, updates, current_user)
+    updated = await update_exercise(db, exercise_id, updates, current_user)
     if not updated:
         raise HTTPException(403, "Forbidden")
     return updated
 
 @router.delete("/{exercise_id}", status_code=204)
-def delete_exercise_handler(exercise_id: UUID, db: Session = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
-    existing = get_exercise_by_id(db, exercise_id, current_user)
+async def delete_exercise_handler(exercise_id: UUID, db: AsyncSession = Depends(get_db), current_user: AuthUser = Depends(get_current_active_user)):
+    existing = await get_exercise_by_id(db, exercise_id, current_user)
     if not existing:
         raise HTTPException(404, "Exercise not found")
-    if not delete_exercise(db, exercise_id, current_user):
+    if not await delete_exercise(db, exercise_id, current_user):
         raise HTTPException(403, "Forbidden")
     return
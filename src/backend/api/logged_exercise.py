@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import List
 
-from src.backend.database.configure import get_db
+from src.backend.database.async_configure import get_db
 from src.backend.schemas.logged_exercise import LoggedExerciseCreate, LoggedExerciseOut
 from src.backend.crud.logged_exercise import (
     log_exercise,
@@ -14,16 +14,16 @@ from src.backend.crud.logged_exercise import (
 router = APIRouter()
 
 @router.post("/{workout_id}/log", response_model=LoggedExerciseOut, status_code=status.HTTP_201_CREATED)
-def create_logged_exercise(workout_id: UUID, entry: LoggedExerciseCreate, db: Session = Depends(get_db)):
-    return log_exercise(db, entry, workout_id)
+async def create_logged_exercise(workout_id: UUID, entry: LoggedExerciseCreate, db: AsyncSession = Depends(get_db)):
+    return await log_exercise(db, entry, workout_id)
 
 @router.get("/{workout_id}/entries", response_model=List[LoggedExerciseOut])
-def read_logged_exercises_by_workout(workout_id: UUID, db: Session = Depends(get_db)):
-    return get_logged_exercises_by_workout(db, workout_id)
+async def read_logged_exercises_by_workout(workout_id: UUID, db: AsyncSession = Depends(get_db)):
+    return await get_logged_exercises_by_workout(db, workout_id)
 
 @router.delete("/{workout_id}/entry/{exercise_id}", status_code=status.HTTP_204_NO_CONTENT)
-def remove_logged_exercise(workout_id: UUID, exercise_id: UUID, db: Session = Depends(get_db)):
-    success = delete_logged_exercise(db, workout_id, exercise_id)
+async def remove_logged_exercise(workout_id: UUID, exercise_id: UUID, db: AsyncSession = Depends(get_db)):
+    success = await delete_logged_exercise(db, workout_id, exercise_id)
     if not success:
         raise HTTPException(status_code=404, detail="Logged exercise not found")
     return None
\ No newline at end of file
@@ -0,0 +1,15 @@
+import orjson
+from fastapi import Response
+from typing import Any
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson, which handles UUID, datetime and Enum natively.
+
+    For payloads that are already plain dicts (see the crud row-tuple paths),
+    so there is no Pydantic model for FastAPI's own serializer to work from.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
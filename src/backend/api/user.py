@@ -1,75 +1,102 @@
-from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import Annotated, List
+from typing import Annotated, Optional, Union
 
-from src.backend.database.configure import get_db
+from src.backend.database.async_configure import get_db
 from src.backend.schemas.auth_user import (
     AuthUserCreate,
     AuthUserUpdate,
     AuthUserOut,
+    AuthUserWithToken,
+    RefreshRequest,
     Token
 )
+from src.backend.schemas.pagination import Page
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.backend.crud.user import (
     create_user,
     get_user_by_id,
     get_user_by_username,
-    get_all_users,
+    get_users_page,
     delete_user,
     update_user
 )
 from src.backend.models.auth_user import AuthUser
+from src.backend.auth.refresh import create_refresh_token, rotate_refresh_token
 from src.backend.auth.util import (
-    ACCESS_TOKEN_EXPIRE_MINUTES,
     authenticate_user,
-    create_access_token,
+    create_user_token,
     get_current_active_user
 )
 
 router = APIRouter()
 
-@router.post("/", response_model=AuthUserOut, status_code=status.HTTP_200_OK)
-async def create_user_handler(user: AuthUserCreate, db: Session = Depends(get_db)):
-    existing = get_user_by_username(db, user.username)
+
+async def _issue_tokens(db: AsyncSession, user: AuthUser) -> Token:
+    refresh_token = await create_refresh_token(db, user.id)
+    await db.commit()
+    return Token(access_token=create_user_token(user), token_type="bearer", refresh_token=refresh_token)
+
+
+@router.post("/", response_model=Union[AuthUserWithToken, AuthUserOut], status_code=status.HTTP_200_OK)
+async def create_user_handler(
+    user: AuthUserCreate,
+    issue_token: bool = False,
+    db: AsyncSession = Depends(get_db)
+):
+    existing = await get_user_by_username(db, user.username)
     if existing:
         raise HTTPException(status_code=409, detail="Username already exists")
-    return create_user(db, user)
+    created = await create_user(db, user)
+    if not issue_token:
+        return created
+    # Saves the client a /token round-trip and a second bcrypt verify.
+    token = await _issue_tokens(db, created)
+    return AuthUserWithToken(**AuthUserOut.model_validate(created).model_dump(), token=token)
 
 
 @router.get("/{user_id}", response_model=AuthUserOut)
-async def get_user_by_id_handler(user_id: UUID, db: Session = Depends(get_db)):
-    user = get_user_by_id(db, user_id)
+async def get_user_by_id_handler(user_id: UUID, db: AsyncSession = Depends(get_db)):
+    user = await get_user_by_id(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
-@router.get("/all/", response_model=List[AuthUserOut])
-async def get_all_users_handler(db: Session = Depends(get_db)):
-    return get_all_users(db)
+@router.get("/all/", response_model=Page[AuthUserOut])
+async def get_all_users_handler(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    items, next_cursor = await get_users_page(db, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
 
 
-@router.get("/all/auth/", response_model=List[AuthUserOut])
+@router.get("/all/auth/", response_model=Page[AuthUserOut])
 async def get_all_users_handler_with_auth(
     _: Annotated[AuthUser, Depends(get_current_active_user)],
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
 ):
-    return get_all_users(db)
+    items, next_cursor = await get_users_page(db, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
 
 
 @router.delete("/{user_id}", response_model=bool)
-async def delete_user_handler(user_id: UUID, db: Session = Depends(get_db)):
-    success = delete_user(db, user_id)
+async def delete_user_handler(user_id: UUID, db: AsyncSession = Depends(get_db)):
+    success = await delete_user(db, user_id)
     if not success:
         raise HTTPException(status_code=404, detail="User not found")
     return success
 
 
 @router.patch("/{user_id}", response_model=AuthUserOut)
-async def update_user_handler(user_id: UUID, updates: AuthUserUpdate, db: Session = Depends(get_db)):
-    updated = update_user(db, user_id, updates)
+async def update_user_handler(user_id: UUID, updates: AuthUserUpdate, db: AsyncSession = Depends(get_db)):
+    updated = await update_user(db, user_id, updates)
     if not updated:
         raise HTTPException(status_code=404, detail="User not found or not updated")
     return updated
@@ -78,21 +105,29 @@ async def update_user_handler(user_id: UUID, updates: AuthUserUpdate, db: Sessio
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.username},
-        expires_delta=access_token_expires
-    )
-    return Token(access_token=access_token, token_type="bearer")
+    return await _issue_tokens(db, user)
+
+
+@router.post("/token/refresh", response_model=Token)
+async def refresh_access_token(body: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    rotated = await rotate_refresh_token(db, body.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user, refresh_token = rotated
+    return Token(access_token=create_user_token(user), token_type="bearer", refresh_token=refresh_token)
 
 import asyncio
 
@@ -1,76 +1,116 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Dict, Optional
 
-from src.backend.database.configure import get_db
-from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate, WorkoutOut
+from src.backend.api.responses import ORJSONResponse
+from src.backend.database.async_configure import get_db
+from src.backend.schemas.workout import (
+    PersonalRecordHit,
+    WorkoutCreatedOut,
+    WorkoutCreateSimple,
+    WorkoutOut,
+    WorkoutStats,
+    WorkoutUpdate,
+)
+from src.backend.schemas.pagination import Page
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.backend.crud.workout import (
-    create_workout,
+    create_workout_with_records,
     get_workout_by_workout_id,
-    get_all_workouts,
+    get_workout_payloads_page,
     delete_workout,
     get_last_workout,
     get_last_workout_based_on_username_and_type,
-    get_all_workouts_by_name,
     update_workout,
     calculate_num_workouts_by_month,
-    calculate_num_workouts_by_type
+    calculate_num_workouts_by_type,
+    calculate_num_workouts_by_all_types,
+    get_workout_stats,
+    MOST_COMMON_EXERCISES_LIMIT,
 )
 
 router = APIRouter()
 
-@router.get("/", response_model=List[WorkoutOut])
-def get_all_workouts_handler(db: Session = Depends(get_db)):
-    return get_all_workouts(db)
+@router.get("/", response_model=Page[WorkoutOut])
+async def get_all_workouts_handler(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    items, next_cursor = await get_workout_payloads_page(db, cursor, limit)
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor, "limit": limit})
 
 @router.get("/{workout_id}", response_model=WorkoutOut)
-def get_workout_by_id_handler(workout_id: UUID, db: Session = Depends(get_db)):
-    workout = get_workout_by_workout_id(db, workout_id)
+async def get_workout_by_id_handler(workout_id: UUID, db: AsyncSession = Depends(get_db)):
+    workout = await get_workout_by_workout_id(db, workout_id)
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
     return workout
 
-@router.get("/user/{username}", response_model=List[WorkoutOut])
-def get_workouts_by_user_handler(username: str, db: Session = Depends(get_db)):
-    return get_all_workouts_by_name(username, db)
+@router.get("/user/{username}", response_model=Page[WorkoutOut])
+async def get_workouts_by_user_handler(
+    username: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    items, next_cursor = await get_workout_payloads_page(db, cursor, limit, username=username)
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor, "limit": limit})
 
 @router.get("/user/{username}/latest", response_model=WorkoutOut)
-def get_latest_workout_by_user_handler(username: str, db: Session = Depends(get_db)):
-    workout = get_last_workout(username, db)
+async def get_latest_workout_by_user_handler(username: str, db: AsyncSession = Depends(get_db)):
+    workout = await get_last_workout(username, db)
     if not workout:
         raise HTTPException(status_code=404, detail="No workouts found for this user")
     return workout
 
 @router.get("/user/{username}/latest/{workout_type}", response_model=WorkoutOut)
-def get_latest_workout_by_type_handler(username: str, workout_type: str, db: Session = Depends(get_db)):
-    workout = get_last_workout_based_on_username_and_type(username, workout_type, db)
+async def get_latest_workout_by_type_handler(username: str, workout_type: str, db: AsyncSession = Depends(get_db)):
+    workout = await get_last_workout_based_on_username_and_type(username, workout_type, db)
     if not workout:
         raise HTTPException(status_code=404, detail="No workouts of this type found for this user")
     return workout
 
-@router.post("/", response_model=WorkoutOut, status_code=status.HTTP_201_CREATED)
-def create_workout_handler(workout: WorkoutCreateSimple, db: Session = Depends(get_db)):
-    return create_workout(db, workout)
+@router.post("/", response_model=WorkoutCreatedOut, status_code=status.HTTP_201_CREATED)
+async def create_workout_handler(workout: WorkoutCreateSimple, db: AsyncSession = Depends(get_db)):
+    created, records = await create_workout_with_records(db, workout)
+    hits = [
+        PersonalRecordHit(set_id=s.id, exercise_id=le.exercise_id, records=records[s.id])
+        for le in created.logged_exercises for s in le.sets if s.id in records
+    ]
+    return WorkoutCreatedOut.model_validate(created).model_copy(update={"personal_records": hits})
 
 @router.patch("/{workout_id}", response_model=WorkoutOut)
-def update_workout_handler(workout_id: UUID, updates: WorkoutUpdate, db: Session = Depends(get_db)):
-    updated = update_workout(db, workout_id, updates)
+async def update_workout_handler(workout_id: UUID, updates: WorkoutUpdate, db: AsyncSession = Depends(get_db)):
+    updated = await update_workout(db, workout_id, updates)
     if not updated:
         raise HTTPException(status_code=404, detail="Workout not found or not updated")
     return updated
 
 @router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_workout_handler(workout_id: UUID, db: Session = Depends(get_db)):
-    success = delete_workout(db, workout_id)
+async def delete_workout_handler(workout_id: UUID, db: AsyncSession = Depends(get_db)):
+    success = await delete_workout(db, workout_id)
     if not success:
         raise HTTPException(status_code=404, detail="Workout not found")
     return None
 
+@router.get("/user/{username}/stats", response_model=WorkoutStats)
+async def get_workout_stats_handler(
+    username: str,
+    top: int = Query(MOST_COMMON_EXERCISES_LIMIT, ge=1, le=50),
+    db: AsyncSession = Depends(get_db)
+):
+    return await get_workout_stats(username, db, top_exercises=top)
+
+@router.get("/user/{username}/frequency", response_model=Dict[str, int])
+async def get_workout_frequency_by_all_types(username: str, db: AsyncSession = Depends(get_db)):
+    return await calculate_num_workouts_by_all_types(username, db)
+
 @router.get("/user/{username}/frequency/month")
-def get_workout_frequency_by_month(username: str, db: Session = Depends(get_db)):
-    return calculate_num_workouts_by_month(username, db)
+async def get_workout_frequency_by_month(username: str, db: AsyncSession = Depends(get_db)):
+    return await calculate_num_workouts_by_month(username, db)
 
 @router.get("/user/{username}/frequency/{workout_type}")
-def get_workout_frequency_by_type(username: str, workout_type: str, db: Session = Depends(get_db)):
-    return calculate_num_workouts_by_type(username, workout_type, db)
\ No newline at end of file
+async def get_workout_frequency_by_type(username: str, workout_type: str, db: AsyncSession = Depends(get_db)):
+    return await calculate_num_workouts_by_type(username, workout_type, db)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import Executor
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from src.backend.config import load_env
+from typing import Callable, Optional, Tuple, TypeVar
+
+load_env()
+
+PASSWORD_HASH_SCHEME = os.getenv("SCHEME", "bcrypt")
+# Pin the cost with the value printed by `python -m src.backend.auth.passwords`.
+PASSWORD_HASH_ROUNDS = os.getenv("PASSWORD_HASH_ROUNDS")
+PASSWORD_HASH_TARGET_MS = float(os.getenv("PASSWORD_HASH_TARGET_MS", "250"))
+
+# Calibration range of each scheme's cost knob: log2 for bcrypt, linear for argon2.
+_COST_BOUNDS = {"bcrypt": (4, 31), "argon2": (1, 64)}
+
+def build_context(scheme: str, rounds: Optional[int] = None) -> CryptContext:
+    """CryptContext for `scheme`; with `rounds`, hashes at any other cost need updating."""
+    settings = {}
+    if rounds is not None:
+        settings = {
+            f"{scheme}__default_rounds": rounds,
+            f"{scheme}__min_rounds": rounds,
+            f"{scheme}__max_rounds": rounds,
+        }
+    return CryptContext(schemes=[scheme], deprecated="auto", **settings)
+
+# Kept free of database imports: spawned pool workers import this module.
+pwd_context = build_context(
+    PASSWORD_HASH_SCHEME, int(PASSWORD_HASH_ROUNDS) if PASSWORD_HASH_ROUNDS else None
+)
+
+# 0 workers runs hashing inline, for hosts without multiprocessing (e.g. Lambda).
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+PASSWORD_HASH_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASH_MAX_PENDING", str(max(PASSWORD_HASH_WORKERS, 1) * 8))
+)
+
+T = TypeVar("T")
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify, and return a replacement hash when `pwd_context.needs_update` says so."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+def _verify_seconds(scheme: str, rounds: int, samples: int = 3) -> float:
+    context = build_context(scheme, rounds)
+    hashed = context.hash("calibration")
+    best = math.inf
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration", hashed)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def calibrate_rounds(scheme: str = PASSWORD_HASH_SCHEME, target_ms: float = PASSWORD_HASH_TARGET_MS) -> int:
+    """Highest cost whose verify time on this machine stays within `target_ms`."""
+    if scheme not in _COST_BOUNDS:
+        raise ValueError(f"Cannot calibrate scheme {scheme!r}; expected one of {sorted(_COST_BOUNDS)}")
+    low, high = _COST_BOUNDS[scheme]
+    best = low
+    for rounds in range(low, high + 1):
+        if _verify_seconds(scheme, rounds) * 1000 > target_ms:
+            break
+        best = rounds
+    return best
+
+
+class PasswordHashPool:
+    """Runs bcrypt off the event loop on a bounded process pool.
+
+    At most `max_pending` calls may be queued or running; beyond that callers
+    get a 503 straight away instead of piling up behind a login burst.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._pool: Optional[Executor] = None
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            # Deferred: only processes that actually hash pay for these imports.
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn, not fork: the parent runs DB driver threads.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-ins, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            if self.workers <= 0:
+                return fn(*args)
+            return await asyncio.get_running_loop().run_in_executor(self._executor(), fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+password_pool = PasswordHashPool()
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_pool.run(get_password_hash, password)
+
+async def verify_and_update_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return await password_pool.run(verify_and_update, plain_password, hashed_password)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pick a password-hash cost for this machine.")
+    parser.add_argument("--scheme", default=PASSWORD_HASH_SCHEME)
+    parser.add_argument("--target-ms", type=float, default=PASSWORD_HASH_TARGET_MS)
+    args = parser.parse_args()
+    rounds = calibrate_rounds(args.scheme, args.target_ms)
+    verify_ms = _verify_seconds(args.scheme, rounds) * 1000
+    print(f"SCHEME={args.scheme} PASSWORD_HASH_ROUNDS={rounds}  # verify ~{verify_ms:.0f} ms")
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import secrets
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+from uuid import UUID
+
+from src.backend.models.auth_user import AuthUser
+from src.backend.models.refresh_token import RefreshToken
+
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+
+
+def _hash_token(token: str) -> str:
+    # The token is 256 random bits, so a fast unsalted hash is enough; what
+    # matters is that a leaked table cannot be replayed.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything is stored as UTC.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+async def create_refresh_token(db: AsyncSession, user_id: UUID) -> str:
+    """Store a new refresh token for `user_id` and return its plaintext. Committed by the caller."""
+    token = secrets.token_urlsafe(32)
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=_hash_token(token),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return token
+
+async def delete_refresh_tokens(db: AsyncSession, user_id: UUID) -> None:
+    await db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+
+async def prune_refresh_tokens(db: AsyncSession, user_id: Optional[UUID] = None) -> int:
+    """Delete expired tokens (used or not) of `user_id`, or of every user; returns rows removed.
+
+    Used tokens are kept until they expire so a replay is still recognised.
+    Committed by the caller.
+    """
+    stale = delete(RefreshToken).where(RefreshToken.expires_at <= datetime.now(timezone.utc))
+    if user_id is not None:
+        stale = stale.where(RefreshToken.user_id == user_id)
+    result = await db.execute(stale.execution_options(synchronize_session=False))
+    return result.rowcount
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> Optional[Tuple[AuthUser, str]]:
+    """Consume `token` and return its user with a replacement token.
+
+    Returns None for unknown or expired tokens. Presenting an already used
+    token means it was copied, and a disabled user may not refresh at all;
+    in both cases every refresh token of that user is dropped. The token is claimed with a
+    conditional UPDATE, so of two concurrent refreshes only one succeeds.
+    """
+    result = await db.execute(
+        select(RefreshToken, AuthUser)
+        .join(AuthUser, AuthUser.id == RefreshToken.user_id)
+        .where(RefreshToken.token_hash == _hash_token(token))
+    )
+    row = result.first()
+    if row is None:
+        return None
+    stored, user = row
+    if user.disabled:
+        await delete_refresh_tokens(db, user.id)
+        await db.commit()
+        return None
+
+    now = datetime.now(timezone.utc)
+    if stored.used_at is None and _aware(stored.expires_at) <= now:
+        return None
+
+    claimed = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == stored.id, RefreshToken.used_at.is_(None))
+        .values(used_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.rowcount == 0:
+        await delete_refresh_tokens(db, user.id)
+        await db.commit()
+        return None
+
+    await prune_refresh_tokens(db, user.id)
+    replacement = await create_refresh_token(db, user.id)
+    await db.commit()
+    return user, replacement
+
+
+async def _prune_and_commit(db: AsyncSession) -> int:
+    removed = await prune_refresh_tokens(db)
+    await db.commit()
+    return removed
+
+
+if __name__ == "__main__":
+    from src.backend.database.async_configure import run_with_session
+
+    print(f"Pruned {run_with_session(_prune_and_commit)} expired refresh token(s).")
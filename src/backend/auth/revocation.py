@@ -0,0 +1,76 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+from typing import Dict
+
+from src.backend.auth.refresh import delete_refresh_tokens
+from src.backend.models.token_revocation import TokenRevocation
+
+TOKEN_REVOCATION_REFRESH_SECONDS = float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "5"))
+
+
+def _timestamp(value: datetime) -> float:
+    # SQLite hands back naive datetimes; everything is stored as UTC.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class RevocationList:
+    """In-process mirror of `token_revocations`: user id -> revoked-before timestamp.
+
+    Only revocations younger than the token lifetime matter (older tokens are
+    expired anyway), so the mirror stays as small as the set of users changed
+    in that window. It is re-read at most every `refresh_seconds`, which
+    bounds how long another worker keeps honouring a revoked token.
+    """
+
+    def __init__(self, retention: timedelta, refresh_seconds: float = TOKEN_REVOCATION_REFRESH_SECONDS):
+        self.retention = retention
+        self.refresh_seconds = refresh_seconds
+        self._revoked_before: Dict[UUID, float] = {}
+        self._next_refresh = 0.0
+        self._lock = asyncio.Lock()
+
+    def revoke_locally(self, user_id: UUID, revoked_at: float) -> None:
+        self._revoked_before[user_id] = max(revoked_at, self._revoked_before.get(user_id, 0.0))
+
+    def is_revoked(self, user_id: UUID, issued_at: float) -> bool:
+        return issued_at <= self._revoked_before.get(user_id, float("-inf"))
+
+    def invalidate(self) -> None:
+        """Force the next `refresh_if_stale` call to hit the database."""
+        self._next_refresh = 0.0
+
+    async def refresh_if_stale(self, db: AsyncSession) -> None:
+        if time.monotonic() < self._next_refresh:
+            return
+        async with self._lock:
+            if time.monotonic() < self._next_refresh:
+                return
+            cutoff = datetime.now(timezone.utc) - self.retention
+            result = await db.execute(
+                select(TokenRevocation.user_id, TokenRevocation.revoked_at)
+                .where(TokenRevocation.revoked_at > cutoff)
+            )
+            local_only = {
+                user_id: revoked_at
+                for user_id, revoked_at in self._revoked_before.items()
+                if revoked_at > cutoff.timestamp()
+            }
+            self._revoked_before = local_only
+            for user_id, revoked_at in result.all():
+                self.revoke_locally(user_id, _timestamp(revoked_at))
+            self._next_refresh = time.monotonic() + self.refresh_seconds
+
+
+async def revoke_user_tokens(db: AsyncSession, revocations: RevocationList, user_id: UUID) -> None:
+    """Invalidate every access and refresh token issued to `user_id` so far. Committed by the caller."""
+    now = datetime.now(timezone.utc)
+    await delete_refresh_tokens(db, user_id)
+    await db.merge(TokenRevocation(user_id=user_id, revoked_at=now))
+    revocations.revoke_locally(user_id, now.timestamp())
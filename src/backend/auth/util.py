@@ -1,51 +1,80 @@
 import os
 import jwt
 from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
-from passlib.context import CryptContext
 from typing import Annotated, Optional
+from uuid import UUID
 
-from sqlalchemy.orm import Session
-from src.backend.database.configure import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.backend.config import load_env
+from src.backend.auth.passwords import (
+    get_password_hash,
+    get_password_hash_async,
+    pwd_context,
+    verify_and_update_async,
+    verify_password,
+)
+from src.backend.auth.revocation import RevocationList
+from src.backend.database.async_configure import get_db
 from src.backend.models.auth_user import AuthUser, TokenData
 
-load_dotenv()
+load_env()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "testsecret")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=[os.getenv("SCHEME", "bcrypt")], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/users/token")
+revocation_list = RevocationList(retention=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def get_user(db: AsyncSession, username: str) -> Optional[AuthUser]:
+    result = await db.execute(select(AuthUser).where(AuthUser.username == username))
+    return result.scalars().first()
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
-def get_user(db: Session, username: str) -> Optional[AuthUser]:
-    return db.query(AuthUser).filter(AuthUser.username == username).first()
-
-def authenticate_user(db: Session, username: str, password: str) -> Optional[AuthUser]:
-    user = get_user(db, username)
-    if not user or not verify_password(password, user.hashed_password):
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[AuthUser]:
+    user = await get_user(db, username)
+    if not user:
+        return None
+    valid, new_hash = await verify_and_update_async(password, user.hashed_password)
+    if not valid:
         return None
+    if new_hash is not None:
+        # Hash predates the current cost settings; upgrade it while we have the password.
+        user.hashed_password = new_hash
+        await db.commit()
     return user
 
+def user_claims(user: AuthUser) -> dict:
+    """Claims that let `get_current_user` authorize without loading the user."""
+    return {
+        "sub": user.username,
+        "uid": str(user.id),
+        "adm": bool(user.is_admin),
+        "dis": bool(user.disabled),
+    }
+
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=15))
-    to_encode.update({"exp": expire})
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=15))
+    # Sub-second iat so a token minted right after a revocation is not caught by it.
+    to_encode.update({"exp": expire, "iat": now.timestamp()})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def create_user_token(user: AuthUser) -> str:
+    """Login-lifetime access token carrying `user_claims(user)`."""
+    return create_access_token(
+        data=user_claims(user),
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> AuthUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,13 +87,27 @@ async def get_current_user(
         if username is None:
             raise credentials_exception
         token_data = TokenData(username=username)
-    except InvalidTokenError:
+        user_id = UUID(payload["uid"]) if "uid" in payload else None
+    except (InvalidTokenError, ValueError):
         raise credentials_exception
 
-    user = get_user(db, username=token_data.username)
-    if user is None:
+    if user_id is None:
+        # Tokens issued before claims were embedded still resolve through the DB.
+        user = await get_user(db, username=token_data.username)
+        if user is None:
+            raise credentials_exception
+        return user
+
+    await revocation_list.refresh_if_stale(db)
+    if revocation_list.is_revoked(user_id, payload.get("iat", 0)):
         raise credentials_exception
-    return user
+    # Transient principal: never added to a session, carries only what the claims say.
+    return AuthUser(
+        id=user_id,
+        username=token_data.username,
+        is_admin=bool(payload.get("adm", False)),
+        disabled=bool(payload.get("dis", False)),
+    )
 
 async def get_current_active_user(
     current_user: Annotated[AuthUser, Depends(get_current_user)],
@@ -0,0 +1,12 @@
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Read .env into the process environment, once per process.
+
+    Modules that read settings with os.getenv at import call this first;
+    only the first call touches the filesystem.
+    """
+    load_dotenv()
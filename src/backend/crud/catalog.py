@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import os
+import time
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from src.backend.models.catalog_version import CatalogVersion
+from src.backend.models.exercise import Exercise
+
+logger = logging.getLogger(__name__)
+
+EXERCISE_CATALOG = "exercises"
+EXERCISE_CATALOG_REFRESH_SECONDS = float(os.getenv("EXERCISE_CATALOG_REFRESH_SECONDS", "30"))
+
+
+async def get_catalog_version(db: AsyncSession, name: str) -> int:
+    result = await db.execute(select(CatalogVersion.version).where(CatalogVersion.name == name))
+    return result.scalar_one_or_none() or 0
+
+
+async def bump_catalog_version(db: AsyncSession, name: str) -> None:
+    """Increment the counter inside the caller's transaction, creating the row on first use."""
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name in ("postgresql", "sqlite"):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(CatalogVersion).values(name=name, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CatalogVersion.name],
+            set_={"version": CatalogVersion.version + 1},
+        )
+        await db.execute(stmt)
+        return
+
+    result = await db.execute(
+        update(CatalogVersion)
+        .where(CatalogVersion.name == name)
+        .values(version=CatalogVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.add(CatalogVersion(name=name, version=1))
+
+
+class ExerciseCatalogIndex:
+    """Process-local copy of the exercise catalog's name -> id mapping.
+
+    Local exercise writes call `invalidate()`; writes from other processes
+    are noticed by comparing the catalog version at most every
+    `refresh_seconds`. Names missing from memory are looked up in the DB,
+    so a stale index can only delay, never hide, a newly created exercise.
+    A deleted or renamed exercise can linger for up to `refresh_seconds`;
+    writers that trip over its dead id invalidate and retry.
+    """
+
+    def __init__(self, refresh_seconds: float = EXERCISE_CATALOG_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.version: Optional[int] = None
+        self.by_name: Dict[str, UUID] = {}
+        self._next_check = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self.version = None
+        self._next_check = 0.0
+
+    async def load(self, db: AsyncSession) -> None:
+        version = await get_catalog_version(db, EXERCISE_CATALOG)
+        result = await db.execute(select(Exercise.name, Exercise.id))
+        self.by_name = dict(result.all())
+        self.version = version
+        self._next_check = time.monotonic() + self.refresh_seconds
+
+    async def warm(self, db: AsyncSession) -> None:
+        """Startup preload; on failure the index simply loads on first use."""
+        try:
+            await self.load(db)
+        except SQLAlchemyError:
+            logger.warning("Could not warm the exercise catalog index", exc_info=True)
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        if self.version is not None and time.monotonic() < self._next_check:
+            return
+        async with self._lock:
+            if self.version is not None and time.monotonic() < self._next_check:
+                return
+            if self.version is not None and await get_catalog_version(db, EXERCISE_CATALOG) == self.version:
+                self._next_check = time.monotonic() + self.refresh_seconds
+                return
+            await self.load(db)
+
+    def lookup_names(self, names: List[str]) -> Tuple[Dict[str, UUID], List[str]]:
+        found, missing = {}, []
+        for name in names:
+            if name in self.by_name:
+                found[name] = self.by_name[name]
+            else:
+                missing.append(name)
+        return found, missing
+
+
+exercise_catalog = ExerciseCatalogIndex()
@@ -1,43 +1,86 @@
 from collections import defaultdict
-from sqlalchemy.orm import Session
-from uuid import UUID
-from typing import List, Optional
+from sqlalchemy import func, insert, or_, select, true
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID, uuid4
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 from src.backend.models.auth_user import AuthUser
 from src.backend.models.exercise import Exercise
 from src.backend.schemas.exercise import ExerciseCreate, ExerciseUpdate
+from src.backend.crud.catalog import EXERCISE_CATALOG, bump_catalog_version, exercise_catalog
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, paginate, str_key, uuid_key
 
 
-def create_exercise(db: Session, exercise_data: ExerciseCreate, currentActiveUser: Optional[AuthUser]):
+async def create_exercise(db: AsyncSession, exercise_data: ExerciseCreate, currentActiveUser: Optional[AuthUser]):
     exercise = Exercise(
         **exercise_data.model_dump(exclude={"user_id"}),
         user_id=currentActiveUser.id if currentActiveUser else None
     )
     db.add(exercise)
-    db.commit()
-    db.refresh(exercise)
+    await bump_catalog_version(db, EXERCISE_CATALOG)
+    await db.commit()
+    exercise_catalog.invalidate()
+    await db.refresh(exercise)
     return exercise
 
 
-def create_batch_exercise(db: Session, exercises_data: List[ExerciseCreate], currentActiveUser: Optional[AuthUser]):
-    exercises_list = []
+def _insert_skipping_duplicates(dialect_name: str):
+    """INSERT that silently skips rows whose unique name already exists."""
+    # Dialect modules are imported here, not at module load, so startup only
+    # pays for the dialect the engine actually uses.
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+        return postgresql_insert(Exercise).on_conflict_do_nothing(index_elements=[Exercise.name])
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(Exercise).on_conflict_do_nothing(index_elements=[Exercise.name])
+    if dialect_name == "mysql":
+        return insert(Exercise).prefix_with("IGNORE")
+    return insert(Exercise)
+
+
+async def create_batch_exercise(db: AsyncSession, exercises_data: List[ExerciseCreate], currentActiveUser: Optional[AuthUser]):
+    # Duplicates (already stored, or repeated within the batch) are skipped;
+    # the first occurrence of a name wins.
+    rows = {}
     for exercise_data in exercises_data:
-        existing = db.query(Exercise).filter(Exercise.name == exercise_data.name).first()
-        if existing:
-            continue
-        exercise = Exercise(
-            **exercise_data.model_dump(exclude={"user_id"}),
-            user_id=currentActiveUser.id if currentActiveUser else None
-        )
-        db.add(exercise)
-        db.commit()
-        db.refresh(exercise)
-        exercises_list.append(exercise)
-
-    return exercises_list
-
-
-def get_exercise_by_id(db: Session, exercise_id: UUID, currentActiveUser: Optional[AuthUser]):
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
+        if exercise_data.name not in rows:
+            rows[exercise_data.name] = {
+                **exercise_data.model_dump(exclude={"user_id"}),
+                "id": uuid4(),
+                "user_id": currentActiveUser.id if currentActiveUser else None,
+            }
+    if not rows:
+        return []
+
+    existing, _ = await resolve_exercise_names(db, list(rows))
+    for name in existing:
+        rows.pop(name)
+    if not rows:
+        return []
+
+    # The conflict clause still guards against a concurrent import racing us
+    # between the existence check and the insert.
+    stmt = _insert_skipping_duplicates(db.get_bind().dialect.name)
+    if db.get_bind().dialect.insert_returning:
+        created = (await db.scalars(stmt.returning(Exercise), list(rows.values()))).all()
+    else:
+        await db.execute(stmt, list(rows.values()))
+        ids = [row["id"] for row in rows.values()]
+        created = (await db.scalars(select(Exercise).where(Exercise.id.in_(ids)))).all()
+    if created:
+        await bump_catalog_version(db, EXERCISE_CATALOG)
+    await db.commit()
+    exercise_catalog.invalidate()
+
+    order = {name: i for i, name in enumerate(rows)}
+    return sorted(created, key=lambda exercise: order[exercise.name])
+
+
+async def get_exercise_by_id(db: AsyncSession, exercise_id: UUID, currentActiveUser: Optional[AuthUser]):
+    exercise = await db.get(Exercise, exercise_id)
     if not exercise:
         return None
 
@@ -51,23 +94,82 @@ def get_exercise_by_id(db: Session, exercise_id: UUID, currentActiveUser: Option
     return exercise
 
 
-def get_all_exercises(db: Session, currentActiveUser: Optional[AuthUser]):
-    # Admin sees everything
-    if currentActiveUser and currentActiveUser.is_admin:
-        return db.query(Exercise).all()
-
-    exercises = db.query(Exercise).all()
-    filtered_exercises = []
-    for exercise in exercises:
-        if exercise.user_id is None:
-            filtered_exercises.append(exercise)
-        elif currentActiveUser and exercise.user_id == currentActiveUser.id:
-            filtered_exercises.append(exercise)
-    return filtered_exercises
+async def get_exercise_by_name(db: AsyncSession, name: str) -> Optional[Exercise]:
+    result = await db.execute(select(Exercise).where(Exercise.name == name))
+    return result.scalars().first()
 
 
-def get_all_exercises_categorized(db: Session, currentActiveUser: Optional[AuthUser]):
-    exercises = get_all_exercises(db, currentActiveUser)
+def _visible_to(currentActiveUser: Optional[AuthUser]):
+    """SQL predicate: global exercises, the user's own, or everything for admins."""
+    if currentActiveUser and currentActiveUser.is_admin:
+        return true()
+    if currentActiveUser:
+        return or_(Exercise.user_id.is_(None), Exercise.user_id == currentActiveUser.id)
+    return Exercise.user_id.is_(None)
+
+
+def _select_visible_exercises(currentActiveUser: Optional[AuthUser], name: Optional[str] = None):
+    stmt = select(Exercise).where(_visible_to(currentActiveUser))
+    if name:
+        # Matches the lower(name) expression index on exercises
+        stmt = stmt.where(func.lower(Exercise.name) == name.lower())
+    return stmt
+
+
+async def resolve_exercise_names(db: AsyncSession, names: List[str]) -> Tuple[Dict[str, UUID], List[str]]:
+    """Map exercise names to ids; also return the names that do not exist.
+
+    Served from the in-memory catalog index; only names it does not know are
+    looked up, with one IN query. Until the next version check an id may
+    belong to an exercise another worker just deleted; see
+    retry_on_stale_catalog().
+    """
+    unique_names = list(dict.fromkeys(names))
+    await exercise_catalog.ensure_fresh(db)
+    ids, unknown = exercise_catalog.lookup_names(unique_names)
+    if unknown:
+        result = await db.execute(select(Exercise.name, Exercise.id).where(Exercise.name.in_(unknown)))
+        ids.update(result.all())
+    return ids, [name for name in unique_names if name not in ids]
+
+
+T = TypeVar("T")
+
+
+async def retry_on_stale_catalog(db: AsyncSession, write: Callable[..., Awaitable[T]], *args) -> T:
+    """Run `write(db, *args)`; on an IntegrityError roll back, reload the catalog index and run it once more.
+
+    The expected cause is an id from the index whose exercise another worker
+    has deleted; on the retry resolve_exercise_names() reports that name as
+    missing instead. A second failure propagates.
+    """
+    try:
+        return await write(db, *args)
+    except IntegrityError:
+        await db.rollback()
+        exercise_catalog.invalidate()
+        return await write(db, *args)
+
+
+async def get_all_exercises(db: AsyncSession, currentActiveUser: Optional[AuthUser], name: Optional[str] = None):
+    result = await db.execute(_select_visible_exercises(currentActiveUser, name))
+    return result.scalars().all()
+
+
+async def get_exercises_page(
+    db: AsyncSession,
+    currentActiveUser: Optional[AuthUser],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    name: Optional[str] = None,
+) -> Tuple[List[Exercise], Optional[str]]:
+    stmt = _select_visible_exercises(currentActiveUser, name)
+    keys = (str_key(Exercise.name), uuid_key(Exercise.id))
+    return await paginate(db, stmt, keys, cursor, limit)
+
+
+async def get_all_exercises_categorized(db: AsyncSession, currentActiveUser: Optional[AuthUser]):
+    exercises = await get_all_exercises(db, currentActiveUser)
     grouped = defaultdict(list)
     for exercise in exercises:
         if exercise.category:
@@ -77,8 +179,8 @@ def get_all_exercises_categorized(db: Session, currentActiveUser: Optional[AuthU
     return grouped
 
 
-def update_exercise(db: Session, exercise_id: UUID, updates: ExerciseUpdate, currentActiveUser: AuthUser):
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
+async def update_exercise(db: AsyncSession, exercise_id: UUID, updates: ExerciseUpdate, currentActiveUser: AuthUser):
+    exercise = await db.get(Exercise, exercise_id)
     if not exercise:
         return None
 
@@ -89,13 +191,15 @@ def update_exercise(db: Session, exercise_id: UUID, updates: ExerciseUpdate, cur
     for field, value in updates.model_dump(exclude_unset=True).items():
         setattr(exercise, field, value)
 
-    db.commit()
-    db.refresh(exercise)
+    await bump_catalog_version(db, EXERCISE_CATALOG)
+    await db.commit()
+    exercise_catalog.invalidate()
+    await db.refresh(exercise)
     return exercise
 
 
-def delete_exercise(db: Session, exercise_id: UUID, currentActiveUser: AuthUser):
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
+async def delete_exercise(db: AsyncSession, exercise_id: UUID, currentActiveUser: AuthUser):
+    exercise = await db.get(Exercise, exercise_id)
     if not exercise:
         return False
 
@@ -103,10 +207,12 @@ def delete_exercise(db: Session, exercise_id: UUID, currentActiveUser: AuthUser)
     if not currentActiveUser.is_admin and not is_exercise_owned_by_user(exercise, currentActiveUser):
         return False
 
-    db.delete(exercise)
-    db.commit()
+    await db.delete(exercise)
+    await bump_catalog_version(db, EXERCISE_CATALOG)
+    await db.commit()
+    exercise_catalog.invalidate()
     return True
 
 
 def is_exercise_owned_by_user(exercise: Exercise, user: AuthUser) -> bool:
-    return exercise.user_id == user.id
\ No newline at end of file
+    return exercise.user_id == user.id
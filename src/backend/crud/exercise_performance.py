@@ -0,0 +1,133 @@
+"""Maintenance and reads of exercise_performances, the (user, exercise, time) index.
+
+Workout writes keep one row per logged exercise in the same transaction;
+get_last_performances() then answers "what did I lift last time" for many
+exercises in one windowed query over that index.
+
+    python -m src.backend.crud.exercise_performance            # rebuild every user
+    python -m src.backend.crud.exercise_performance --user ID  # rebuild one user
+"""
+import argparse
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from src.backend.models.exercise_performance import ExercisePerformance
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout import Workout
+
+MAX_LAST_PERFORMANCE_IDS = 100
+
+
+async def record_performances(db: AsyncSession, rows: List[dict]) -> None:
+    """Insert index rows (ExercisePerformance columns as dicts) in one executemany."""
+    if rows:
+        await db.execute(insert(ExercisePerformance), rows)
+
+
+def workout_performance_rows(workout: Workout) -> List[dict]:
+    """Index rows for a flushed workout graph."""
+    return [
+        {
+            "logged_exercise_id": logged_exercise.id,
+            "workout_id": workout.id,
+            "user_id": workout.user_id,
+            "exercise_id": logged_exercise.exercise_id,
+            "performed_at": workout.created_time,
+        }
+        for logged_exercise in workout.logged_exercises
+    ]
+
+
+async def clear_performances(db: AsyncSession, *criteria) -> None:
+    """Drop index rows matching `criteria` (e.g. ExercisePerformance.workout_id == id)."""
+    await db.execute(delete(ExercisePerformance).where(*criteria).execution_options(synchronize_session=False))
+
+
+async def rebuild_exercise_performances(db: AsyncSession, user_ids: Optional[List[UUID]] = None) -> int:
+    """Replace the rows of `user_ids` (default: every user) from logged_exercises joined to workouts.
+
+    Returns the number of rows written.
+    """
+    source = select(
+        LoggedExercise.id, Workout.id, Workout.user_id, LoggedExercise.exercise_id, Workout.created_time,
+    ).join(Workout, LoggedExercise.workout_id == Workout.id)
+    written = select(func.count()).select_from(ExercisePerformance)
+    if user_ids is None:
+        await clear_performances(db)
+    else:
+        await clear_performances(db, ExercisePerformance.user_id.in_(user_ids))
+        source = source.where(Workout.user_id.in_(user_ids))
+        written = written.where(ExercisePerformance.user_id.in_(user_ids))
+    columns = ["logged_exercise_id", "workout_id", "user_id", "exercise_id", "performed_at"]
+    await db.execute(insert(ExercisePerformance).from_select(columns, source))
+    return (await db.execute(written)).scalar_one()
+
+
+async def get_last_performances(db: AsyncSession, user_id: UUID, exercise_ids: Iterable[UUID]) -> List[dict]:
+    """The user's most recent session of each exercise with its sets, in one query.
+
+    ROW_NUMBER() over each exercise's sessions, newest first, walks the
+    (user_id, exercise_id, performed_at) index; only rank 1 is outer-joined
+    to its sets, so a latest session without sets is reported with an
+    empty list. Exercises the user never logged are left out.
+    """
+    exercise_ids = list(dict.fromkeys(exercise_ids))
+    if not exercise_ids:
+        return []
+    ranked = (
+        select(
+            ExercisePerformance.logged_exercise_id,
+            ExercisePerformance.workout_id,
+            ExercisePerformance.exercise_id,
+            ExercisePerformance.performed_at,
+            func.row_number().over(
+                partition_by=ExercisePerformance.exercise_id,
+                order_by=(ExercisePerformance.performed_at.desc(), ExercisePerformance.logged_exercise_id.desc()),
+            ).label("recency"),
+        )
+        .where(ExercisePerformance.user_id == user_id, ExercisePerformance.exercise_id.in_(exercise_ids))
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            ranked.c.exercise_id,
+            ranked.c.workout_id,
+            ranked.c.performed_at,
+            LoggedExerciseSet.set_number,
+            LoggedExerciseSet.reps,
+            LoggedExerciseSet.weight,
+        )
+        .outerjoin(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == ranked.c.logged_exercise_id)
+        .where(ranked.c.recency == 1)
+        .order_by(ranked.c.exercise_id, LoggedExerciseSet.set_number)
+    )
+
+    performances: Dict[UUID, dict] = {}
+    for exercise_id, workout_id, performed_at, set_number, reps, weight in result.all():
+        performance = performances.setdefault(exercise_id, {
+            "exercise_id": exercise_id, "workout_id": workout_id, "performed_at": performed_at, "sets": [],
+        })
+        if set_number is not None:
+            performance["sets"].append({"set_number": set_number, "reps": reps, "weight": weight})
+    order = {exercise_id: position for position, exercise_id in enumerate(exercise_ids)}
+    return sorted(performances.values(), key=lambda p: order[p["exercise_id"]])
+
+
+async def _rebuild_and_commit(db: AsyncSession, user_ids: Optional[List[UUID]]) -> int:
+    written = await rebuild_exercise_performances(db, user_ids)
+    await db.commit()
+    return written
+
+
+if __name__ == "__main__":
+    from src.backend.database.async_configure import run_with_session
+    from src.backend.database.create_indexes import create_missing_tables
+
+    parser = argparse.ArgumentParser(description="Recompute exercise_performances from the workout tables.")
+    parser.add_argument("--user", type=UUID, action="append", help="only rebuild this user id (repeatable)")
+    args = parser.parse_args()
+    create_missing_tables()
+    print(f"Rebuilt {run_with_session(_rebuild_and_commit, args.user)} exercise performance row(s).")
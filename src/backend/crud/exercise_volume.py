@@ -0,0 +1,188 @@
+"""Maintenance and reads of the exercise_weekly_volume rollup.
+
+Workout writes collect the (exercise, ISO week) keys they touch, before and
+after the change, and call refresh_weekly_volume() once their own changes
+are flushed. Only those keys are recomputed, from that user's sets in those
+weeks. Top weight is a max and cannot be reversed with a delta, so the
+small recompute replaces delta arithmetic.
+
+    python -m src.backend.crud.exercise_volume            # rebuild every user
+    python -m src.backend.crud.exercise_volume --user ID  # rebuild one user
+"""
+import argparse
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.backend.models.exercise_weekly_volume import ExerciseWeeklyVolume
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout import Workout
+
+# (exercise_id, week_start)
+VolumeKey = Tuple[UUID, date]
+
+HISTORY_BUCKETS = ("week", "month")
+
+
+def week_start(moment: datetime) -> date:
+    """Monday of the ISO week containing `moment` (naive values are taken as UTC)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    day = moment.date()
+    return day - timedelta(days=day.weekday())
+
+
+def workout_volume_keys(workout: Workout) -> Set[VolumeKey]:
+    """Keys a loaded workout graph contributes to."""
+    week = week_start(workout.created_time)
+    return {(logged_exercise.exercise_id, week) for logged_exercise in workout.logged_exercises}
+
+
+def _aggregate_sets():
+    return select(
+        LoggedExercise.exercise_id,
+        func.count(LoggedExerciseSet.id),
+        func.sum(LoggedExerciseSet.reps),
+        func.sum(LoggedExerciseSet.reps * LoggedExerciseSet.weight),
+        func.max(LoggedExerciseSet.weight),
+    ).join(Workout, LoggedExercise.workout_id == Workout.id).join(
+        LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id
+    )
+
+
+def _row(user_id: UUID, exercise_id: UUID, week: date, sets: int, reps, volume, top_weight) -> dict:
+    return {
+        "user_id": user_id,
+        "exercise_id": exercise_id,
+        "week_start": week,
+        "set_count": sets,
+        "rep_count": reps or 0,
+        "volume": volume or 0.0,
+        "top_weight": top_weight or 0.0,
+    }
+
+
+async def refresh_weekly_volume(db: AsyncSession, user_id: UUID, keys: Iterable[VolumeKey]) -> None:
+    """Recompute the user's rows for `keys` in the caller's transaction (changes must be flushed)."""
+    by_week = defaultdict(set)
+    for exercise_id, week in keys:
+        by_week[week].add(exercise_id)
+
+    for week, exercise_ids in by_week.items():
+        start = datetime.combine(week, time.min, tzinfo=timezone.utc)
+        result = await db.execute(
+            _aggregate_sets()
+            .where(
+                Workout.user_id == user_id,
+                LoggedExercise.exercise_id.in_(exercise_ids),
+                Workout.created_time >= start,
+                Workout.created_time < start + timedelta(days=7),
+            )
+            .group_by(LoggedExercise.exercise_id)
+        )
+        rows = [_row(user_id, exercise_id, week, *totals) for exercise_id, *totals in result.all()]
+        await db.execute(
+            delete(ExerciseWeeklyVolume)
+            .where(
+                ExerciseWeeklyVolume.user_id == user_id,
+                ExerciseWeeklyVolume.week_start == week,
+                ExerciseWeeklyVolume.exercise_id.in_(exercise_ids),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if rows:
+            await db.execute(ExerciseWeeklyVolume.__table__.insert(), rows)
+
+
+async def rebuild_weekly_volume(db: AsyncSession, user_ids: Optional[List[UUID]] = None) -> int:
+    """Replace the rows of `user_ids` (default: every user) from the raw tables; returns rows written.
+
+    Sets are folded per workout in SQL and into ISO weeks here, so the
+    bucketing needs no dialect-specific date functions.
+    """
+    query = _aggregate_sets().add_columns(Workout.user_id, Workout.created_time).group_by(
+        Workout.id, LoggedExercise.exercise_id
+    )
+    stale = delete(ExerciseWeeklyVolume)
+    if user_ids is not None:
+        query = query.where(Workout.user_id.in_(user_ids))
+        stale = stale.where(ExerciseWeeklyVolume.user_id.in_(user_ids))
+
+    weeks = {}
+    for exercise_id, sets, reps, volume, top_weight, user_id, created_time in (await db.execute(query)).all():
+        key = (user_id, exercise_id, week_start(created_time))
+        row = weeks.setdefault(key, _row(*key, 0, 0, 0.0, 0.0))
+        row["set_count"] += sets
+        row["rep_count"] += reps or 0
+        row["volume"] += volume or 0.0
+        row["top_weight"] = max(row["top_weight"], top_weight or 0.0)
+
+    await db.execute(stale.execution_options(synchronize_session=False))
+    if weeks:
+        await db.execute(ExerciseWeeklyVolume.__table__.insert(), list(weeks.values()))
+    return len(weeks)
+
+
+async def get_exercise_history(
+    db: AsyncSession,
+    user_id: UUID,
+    exercise_id: UUID,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    bucket: str = "week",
+) -> List[dict]:
+    """Volume time series, oldest first, from the weekly rollup.
+
+    A week belongs to the month its Monday falls in, so month buckets are
+    sums of whole ISO weeks.
+    """
+    if bucket not in HISTORY_BUCKETS:
+        raise ValueError(f"Unknown bucket '{bucket}'. Expected one of {list(HISTORY_BUCKETS)}.")
+    query = (
+        select(
+            ExerciseWeeklyVolume.week_start,
+            ExerciseWeeklyVolume.set_count,
+            ExerciseWeeklyVolume.rep_count,
+            ExerciseWeeklyVolume.volume,
+            ExerciseWeeklyVolume.top_weight,
+        )
+        .where(ExerciseWeeklyVolume.user_id == user_id, ExerciseWeeklyVolume.exercise_id == exercise_id)
+        .order_by(ExerciseWeeklyVolume.week_start)
+    )
+    if start is not None:
+        query = query.where(ExerciseWeeklyVolume.week_start >= start - timedelta(days=start.weekday()))
+    if end is not None:
+        query = query.where(ExerciseWeeklyVolume.week_start <= end)
+
+    points = {}
+    for week, sets, reps, volume, top_weight in (await db.execute(query)).all():
+        period = week if bucket == "week" else week.replace(day=1)
+        point = points.setdefault(period, {
+            "period_start": period, "set_count": 0, "rep_count": 0, "volume": 0.0, "top_weight": 0.0,
+        })
+        point["set_count"] += sets
+        point["rep_count"] += reps
+        point["volume"] += volume
+        point["top_weight"] = max(point["top_weight"], top_weight)
+    return list(points.values())
+
+
+async def _rebuild_and_commit(db: AsyncSession, user_ids: Optional[List[UUID]]) -> int:
+    written = await rebuild_weekly_volume(db, user_ids)
+    await db.commit()
+    return written
+
+
+if __name__ == "__main__":
+    from src.backend.database.async_configure import run_with_session
+    from src.backend.database.create_indexes import create_missing_tables
+
+    parser = argparse.ArgumentParser(description="Recompute exercise_weekly_volume from the workout tables.")
+    parser.add_argument("--user", type=UUID, action="append", help="only rebuild this user id (repeatable)")
+    args = parser.parse_args()
+    create_missing_tables()
+    print(f"Rebuilt {run_with_session(_rebuild_and_commit, args.user)} weekly volume row(s).")
@@ -1,13 +1,40 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import List, Optional
 
+from src.backend.crud.exercise_performance import clear_performances, record_performances
+from src.backend.crud.exercise_volume import refresh_weekly_volume, week_start
+from src.backend.crud.personal_records import recompute_personal_records, record_new_sets
+from src.backend.crud.summary import apply_summary_delta, summary_delta
+from src.backend.models.exercise_performance import ExercisePerformance
 from src.backend.models.logged_exercise import LoggedExercise
 from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout import Workout
 from src.backend.schemas.logged_exercise import LoggedExerciseCreate
 
 
-def log_exercise(db: Session, log_data: LoggedExerciseCreate, workout_id: UUID) -> LoggedExercise:
+async def _update_rollups(db: AsyncSession, log_entry: LoggedExercise, sign: int) -> None:
+    result = await db.execute(select(Workout.user_id, Workout.created_time).where(Workout.id == log_entry.workout_id))
+    workout = result.first()
+    if workout is None:
+        return
+    delta = summary_delta(sets=[(s.reps, s.weight) for s in log_entry.sets], workouts=0, sign=sign)
+    await apply_summary_delta(db, workout.user_id, delta, times_changed=False)
+    await refresh_weekly_volume(db, workout.user_id, {(log_entry.exercise_id, week_start(workout.created_time))})
+    if sign > 0:
+        await record_performances(db, [{
+            "logged_exercise_id": log_entry.id, "workout_id": log_entry.workout_id, "user_id": workout.user_id,
+            "exercise_id": log_entry.exercise_id, "performed_at": workout.created_time,
+        }])
+        await record_new_sets(db, workout.user_id, [
+            (s.id, log_entry.exercise_id, s.reps, s.weight) for s in log_entry.sets
+        ])
+    else:
+        await recompute_personal_records(db, workout.user_id, {log_entry.exercise_id})
+
+
+async def log_exercise(db: AsyncSession, log_data: LoggedExerciseCreate, workout_id: UUID) -> LoggedExercise:
     logged_sets = [
         LoggedExerciseSet(
             set_number=s.set_number,
@@ -24,24 +51,33 @@ def log_exercise(db: Session, log_data: LoggedExerciseCreate, workout_id: UUID)
     )
 
     db.add(log_entry)
-    db.commit()
-    db.refresh(log_entry)
+    await db.flush()
+    await _update_rollups(db, log_entry, sign=1)
+    await db.commit()
+    await db.refresh(log_entry)
     return log_entry
 
 
-def get_logged_exercises_by_workout(db: Session, workout_id: UUID) -> List[LoggedExercise]:
-    return db.query(LoggedExercise).filter(LoggedExercise.workout_id == workout_id).all()
+async def get_logged_exercises_by_workout(db: AsyncSession, workout_id: UUID) -> List[LoggedExercise]:
+    result = await db.execute(select(LoggedExercise).where(LoggedExercise.workout_id == workout_id))
+    return result.scalars().all()
 
 
-def delete_logged_exercise(db: Session, workout_id: UUID, exercise_id: UUID) -> bool:
-    log_entry = db.query(LoggedExercise).filter(
-        LoggedExercise.workout_id == workout_id,
-        LoggedExercise.exercise_id == exercise_id
-    ).first()
+async def delete_logged_exercise(db: AsyncSession, workout_id: UUID, exercise_id: UUID) -> bool:
+    result = await db.execute(
+        select(LoggedExercise).where(
+            LoggedExercise.workout_id == workout_id,
+            LoggedExercise.exercise_id == exercise_id
+        )
+    )
+    log_entry = result.scalars().first()
 
     if not log_entry:
         return False
 
-    db.delete(log_entry)
-    db.commit()
-    return True
\ No newline at end of file
+    await clear_performances(db, ExercisePerformance.logged_exercise_id == log_entry.id)
+    await db.delete(log_entry)
+    await db.flush()
+    await _update_rollups(db, log_entry, sign=-1)
+    await db.commit()
+    return True
@@ -0,0 +1,95 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from uuid import UUID
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# A keyset column paired with the parser that turns its cursor string back
+# into a bindable value, e.g. (Workout.created_time, datetime.fromisoformat).
+KeysetColumn = Tuple[Any, Callable[[str], Any]]
+
+
+def _to_cursor_value(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_to_cursor_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[KeysetColumn]) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor arity mismatch")
+        if not all(isinstance(value, str) for value in values):
+            raise ValueError("cursor values must be strings")
+        return [parse(value) for (_, parse), value in zip(keys, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _after(columns: Sequence[Any], values: Sequence[Any], descending: bool):
+    """Row-value comparison `(c1, c2, ...) > (v1, v2, ...)`.
+
+    Kept as a single row value (not an OR of per-column terms) so the planner
+    can seek the keyset index past the cursor instead of filtering every row.
+    """
+    if len(columns) == 1:
+        return columns[0] < values[0] if descending else columns[0] > values[0]
+    # A plain tuple on the right binds each value with its column's type.
+    row, bound = tuple_(*columns), tuple(values)
+    return row < bound if descending else row > bound
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    keys: Sequence[KeysetColumn],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+    scalars: bool = True,
+) -> Tuple[list, Optional[str]]:
+    """Return one keyset page of `stmt` and the cursor for the next page.
+
+    The last column in `keys` must be unique so the ordering is total. With
+    `scalars=False` the page holds Row tuples, which must include the keys.
+    """
+    columns = [column for column, _ in keys]
+    if cursor:
+        stmt = stmt.where(_after(columns, decode_cursor(cursor, keys), descending))
+    stmt = stmt.order_by(*[c.desc() if descending else c.asc() for c in columns]).limit(limit + 1)
+
+    result = await db.execute(stmt)
+    rows = result.unique().scalars().all() if scalars else result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], c.key) for c in columns])
+    return rows, next_cursor
+
+
+def uuid_key(column: Any) -> KeysetColumn:
+    return column, UUID
+
+
+def datetime_key(column: Any) -> KeysetColumn:
+    return column, datetime.fromisoformat
+
+
+def str_key(column: Any) -> KeysetColumn:
+    return column, str
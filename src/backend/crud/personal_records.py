@@ -0,0 +1,230 @@
+"""Maintenance of the personal_records and rep_records tables.
+
+New sets are checked against the stored records: one lookup per table,
+however many sets were logged. Any set that beats a record is flagged, and
+the records are moved up. A first session establishes the baseline, so its
+sets are not flagged. When sets are removed or edited, the affected
+exercises are recomputed for that user with one GROUP BY of max reps per
+weight. Max weight and best e1RM both follow from those rows, because e1RM
+rises with reps at a fixed weight.
+
+    python -m src.backend.crud.personal_records            # rebuild every user
+    python -m src.backend.crud.personal_records --user ID  # rebuild one user
+
+Rebuild after changing E1RM_FORMULA.
+"""
+import argparse
+import os
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.personal_record import PersonalRecord, RepRecord
+from src.backend.models.workout import Workout
+
+E1RM_FORMULAS = ("epley", "brzycki")
+E1RM_FORMULA = os.getenv("E1RM_FORMULA", "epley")
+
+# Record kinds a set can set, in the order they are reported.
+WEIGHT_RECORD = "weight"
+REPS_RECORD = "reps"
+E1RM_RECORD = "e1rm"
+
+# (set_id, exercise_id, reps, weight)
+NewSet = Tuple[UUID, UUID, int, float]
+
+
+def estimate_one_rep_max(weight: float, reps: int, formula: Optional[str] = None) -> float:
+    """Estimated one-rep max of `reps` at `weight` (Epley or Brzycki); a single is its own max.
+
+    Brzycki diverges as reps approach 37, so longer sets fall back to Epley.
+    """
+    formula = formula or E1RM_FORMULA
+    if formula not in E1RM_FORMULAS:
+        raise ValueError(f"Unknown e1RM formula '{formula}'. Expected one of {list(E1RM_FORMULAS)}.")
+    if reps <= 0:
+        return 0.0
+    if reps == 1:
+        return float(weight)
+    if formula == "brzycki" and reps < 37:
+        return weight * 36 / (37 - reps)
+    return weight * (1 + reps / 30)
+
+
+def _record_row(user_id: UUID, exercise_id: UUID, weight: float, reps: int) -> dict:
+    return {
+        "user_id": user_id,
+        "exercise_id": exercise_id,
+        "max_weight": weight,
+        "best_e1rm": estimate_one_rep_max(weight, reps),
+        "best_e1rm_weight": weight,
+        "best_e1rm_reps": reps,
+    }
+
+
+async def _write(db: AsyncSession, user_id: UUID, records: Dict[UUID, dict], rep_records: Dict[Tuple[UUID, float], int]) -> None:
+    """Replace the given record rows: a DELETE and an INSERT per table, whatever their number."""
+    if records:
+        await db.execute(
+            delete(PersonalRecord)
+            .where(PersonalRecord.user_id == user_id, PersonalRecord.exercise_id.in_(list(records)))
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(PersonalRecord.__table__.insert(), list(records.values()))
+    if rep_records:
+        await db.execute(
+            delete(RepRecord)
+            .where(RepRecord.user_id == user_id, tuple_(RepRecord.exercise_id, RepRecord.weight).in_(list(rep_records)))
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(RepRecord.__table__.insert(), [
+            {"user_id": user_id, "exercise_id": exercise_id, "weight": weight, "max_reps": reps}
+            for (exercise_id, weight), reps in rep_records.items()
+        ])
+
+
+async def record_new_sets(db: AsyncSession, user_id: UUID, new_sets: Iterable[NewSet]) -> Dict[UUID, List[str]]:
+    """Raise the user's records with freshly written sets; returns {set_id: record kinds} for the PR sets.
+
+    Sets are compared in order against the records as they stood before this
+    write (and the running best within it). Call after the sets are flushed,
+    inside the caller's transaction.
+    """
+    new_sets = [s for s in new_sets if s[2] > 0]
+    if not new_sets:
+        return {}
+    exercise_ids = {exercise_id for _, exercise_id, _, _ in new_sets}
+    result = await db.execute(
+        select(PersonalRecord.__table__)
+        .where(PersonalRecord.user_id == user_id, PersonalRecord.exercise_id.in_(exercise_ids))
+    )
+    records = {row["exercise_id"]: dict(row) for row in result.mappings()}
+    rep_keys = {(exercise_id, weight) for _, exercise_id, _, weight in new_sets}
+    result = await db.execute(
+        select(RepRecord.exercise_id, RepRecord.weight, RepRecord.max_reps)
+        .where(RepRecord.user_id == user_id, tuple_(RepRecord.exercise_id, RepRecord.weight).in_(list(rep_keys)))
+    )
+    rep_records = {(exercise_id, weight): reps for exercise_id, weight, reps in result.all()}
+
+    baseline = exercise_ids - set(records)
+    changed_records, changed_reps = {}, {}
+    hits = {}
+    for set_id, exercise_id, reps, weight in new_sets:
+        record = records.get(exercise_id)
+        if record is None:
+            records[exercise_id] = changed_records[exercise_id] = _record_row(user_id, exercise_id, weight, reps)
+            changed_reps[(exercise_id, weight)] = rep_records[(exercise_id, weight)] = reps
+            continue
+
+        kinds = []
+        if weight > record["max_weight"]:
+            kinds.append(WEIGHT_RECORD)
+            record["max_weight"] = weight
+        previous_reps = rep_records.get((exercise_id, weight))
+        if previous_reps is None or reps > previous_reps:
+            if previous_reps is not None:
+                kinds.append(REPS_RECORD)
+            changed_reps[(exercise_id, weight)] = rep_records[(exercise_id, weight)] = reps
+        e1rm = estimate_one_rep_max(weight, reps)
+        if e1rm > record["best_e1rm"]:
+            kinds.append(E1RM_RECORD)
+            record.update(best_e1rm=e1rm, best_e1rm_weight=weight, best_e1rm_reps=reps)
+        if WEIGHT_RECORD in kinds or E1RM_RECORD in kinds:
+            changed_records[exercise_id] = record
+        if kinds and exercise_id not in baseline:
+            hits[set_id] = kinds
+
+    await _write(db, user_id, changed_records, changed_reps)
+    return hits
+
+
+async def _best_reps_by_weight(db: AsyncSession, user_ids: Optional[List[UUID]], exercise_ids: Optional[Iterable[UUID]] = None):
+    query = (
+        select(Workout.user_id, LoggedExercise.exercise_id, LoggedExerciseSet.weight, func.max(LoggedExerciseSet.reps))
+        .join(Workout, LoggedExercise.workout_id == Workout.id)
+        .join(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(LoggedExerciseSet.reps > 0)
+        .group_by(Workout.user_id, LoggedExercise.exercise_id, LoggedExerciseSet.weight)
+    )
+    if user_ids is not None:
+        query = query.where(Workout.user_id.in_(user_ids))
+    if exercise_ids is not None:
+        query = query.where(LoggedExercise.exercise_id.in_(list(exercise_ids)))
+    return (await db.execute(query)).all()
+
+
+def _fold(rows) -> Tuple[dict, dict]:
+    """Record rows per (user, exercise) and rep records per (user, exercise, weight)."""
+    records, rep_records = {}, {}
+    for user_id, exercise_id, weight, reps in rows:
+        rep_records[(user_id, exercise_id, weight)] = reps
+        candidate = _record_row(user_id, exercise_id, weight, reps)
+        record = records.setdefault((user_id, exercise_id), candidate)
+        record["max_weight"] = max(record["max_weight"], weight)
+        if candidate["best_e1rm"] > record["best_e1rm"]:
+            record.update({key: candidate[key] for key in ("best_e1rm", "best_e1rm_weight", "best_e1rm_reps")})
+    return records, rep_records
+
+
+async def _insert_folded(db: AsyncSession, records: dict, rep_records: dict) -> None:
+    if records:
+        await db.execute(PersonalRecord.__table__.insert(), list(records.values()))
+        await db.execute(RepRecord.__table__.insert(), [
+            {"user_id": user_id, "exercise_id": exercise_id, "weight": weight, "max_reps": reps}
+            for (user_id, exercise_id, weight), reps in rep_records.items()
+        ])
+
+
+async def recompute_personal_records(db: AsyncSession, user_id: UUID, exercise_ids: Iterable[UUID]) -> None:
+    """Rebuild the user's records for `exercise_ids` after sets were removed or edited (changes flushed)."""
+    exercise_ids = set(exercise_ids)
+    if not exercise_ids:
+        return
+    records, rep_records = _fold(await _best_reps_by_weight(db, [user_id], exercise_ids))
+    for model in (PersonalRecord, RepRecord):
+        await db.execute(
+            delete(model)
+            .where(model.user_id == user_id, model.exercise_id.in_(exercise_ids))
+            .execution_options(synchronize_session=False)
+        )
+    await _insert_folded(db, records, rep_records)
+
+
+async def rebuild_personal_records(db: AsyncSession, user_ids: Optional[List[UUID]] = None) -> int:
+    """Replace the records of `user_ids` (default: every user) from the raw sets; returns record rows written."""
+    records, rep_records = _fold(await _best_reps_by_weight(db, user_ids))
+    for model in (PersonalRecord, RepRecord):
+        stale = delete(model)
+        if user_ids is not None:
+            stale = stale.where(model.user_id.in_(user_ids))
+        await db.execute(stale.execution_options(synchronize_session=False))
+    await _insert_folded(db, records, rep_records)
+    return len(records)
+
+
+def group_new_sets(set_rows: Iterable[dict], exercise_by_logged: Dict[UUID, UUID]) -> List[NewSet]:
+    """NewSet tuples from inserted set rows and their logged exercise -> exercise mapping."""
+    return [
+        (row["id"], exercise_by_logged[row["logged_exercise_id"]], row["reps"], row["weight"])
+        for row in set_rows
+    ]
+
+
+async def _rebuild_and_commit(db: AsyncSession, user_ids: Optional[List[UUID]]) -> int:
+    written = await rebuild_personal_records(db, user_ids)
+    await db.commit()
+    return written
+
+
+if __name__ == "__main__":
+    from src.backend.database.async_configure import run_with_session
+    from src.backend.database.create_indexes import create_missing_tables
+
+    parser = argparse.ArgumentParser(description="Recompute personal records from the logged sets.")
+    parser.add_argument("--user", type=UUID, action="append", help="only rebuild this user id (repeatable)")
+    args = parser.parse_args()
+    create_missing_tables()
+    print(f"Rebuilt {run_with_session(_rebuild_and_commit, args.user)} personal record row(s).")
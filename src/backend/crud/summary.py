@@ -0,0 +1,189 @@
+"""Maintenance of the user_workout_summary rollup.
+
+Workout writes call apply_summary_delta() after flushing their own changes,
+inside the same transaction, so the summary commits (or rolls back) with
+them. Counters move by deltas; first/last workout times are re-read from the
+(user_id, created_time) index because a delete cannot be undone by a delta.
+A user without a summary row (history older than the table) gets one built
+from scratch the first time they write; the row is created with an
+insert-or-skip, so concurrent first writes cannot collide on it.
+
+    python -m src.backend.crud.summary            # rebuild every user
+    python -m src.backend.crud.summary --user ID  # rebuild one user
+"""
+import argparse
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+
+from src.backend.models.auth_user import AuthUser
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.user_workout_summary import WORKOUT_TYPE_COLUMNS, UserWorkoutSummary
+from src.backend.models.workout import Workout
+
+_COUNTER_COLUMNS = ("total_workouts", *WORKOUT_TYPE_COLUMNS.values(), "total_sets", "total_reps", "total_volume")
+
+
+def summary_delta(workout_type=None, sets: Iterable[Tuple[int, float]] = (), workouts: int = 1, sign: int = 1) -> dict:
+    """Counter increments contributed by `workouts` workouts holding `sets` (reps, weight) pairs.
+
+    workout_type may be an ExerciseGroup, its value, or None.
+    """
+    delta = {column: 0 for column in _COUNTER_COLUMNS}
+    delta["total_workouts"] = sign * workouts
+    if workout_type is not None and workouts:
+        delta[WORKOUT_TYPE_COLUMNS[ExerciseGroup(workout_type)]] = sign * workouts
+    for reps, weight in sets:
+        delta["total_sets"] += sign
+        delta["total_reps"] += sign * reps
+        delta["total_volume"] += sign * reps * weight
+    return delta
+
+
+def workout_delta(workout: Workout, sign: int = 1) -> dict:
+    """summary_delta() for a loaded workout graph."""
+    sets = [(s.reps, s.weight) for le in workout.logged_exercises for s in le.sets]
+    return summary_delta(workout.workout_type, sets, sign=sign)
+
+
+def combine_deltas(*deltas: dict) -> dict:
+    return {column: sum(delta.get(column, 0) for delta in deltas) for column in _COUNTER_COLUMNS}
+
+
+def _workout_time_bounds(user_id: UUID):
+    by_user = Workout.user_id == user_id
+    return {
+        "first_workout_time": select(func.min(Workout.created_time)).where(by_user).scalar_subquery(),
+        "last_workout_time": select(func.max(Workout.created_time)).where(by_user).scalar_subquery(),
+    }
+
+
+def _insert_skipping_existing(dialect_name: str):
+    """INSERT that leaves an existing summary row alone."""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+        return postgresql_insert(UserWorkoutSummary).on_conflict_do_nothing(index_elements=[UserWorkoutSummary.user_id])
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(UserWorkoutSummary).on_conflict_do_nothing(index_elements=[UserWorkoutSummary.user_id])
+    if dialect_name == "mysql":
+        return insert(UserWorkoutSummary).prefix_with("IGNORE")
+    return insert(UserWorkoutSummary)
+
+
+async def _update_summary(db: AsyncSession, user_id: UUID, values: dict) -> int:
+    result = await db.execute(
+        update(UserWorkoutSummary)
+        .where(UserWorkoutSummary.user_id == user_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def apply_summary_delta(db: AsyncSession, user_id: UUID, delta: dict, times_changed: bool = True) -> None:
+    """Add `delta` to the user's summary row; the caller must have flushed its changes and commits."""
+    values = {
+        column: getattr(UserWorkoutSummary, column) + amount
+        for column, amount in delta.items() if amount
+    }
+    if times_changed:
+        values.update(_workout_time_bounds(user_id))
+    if not values:
+        return
+    if await _update_summary(db, user_id, values):
+        return
+
+    # No row yet. The flushed state already includes this change, so the row
+    # is seeded with the totals before it and the delta applied on top: a
+    # concurrent first write that seeded the row meanwhile keeps its seed and
+    # both deltas still land.
+    seed = await compute_workout_summary(db, user_id)
+    if seed is None:
+        return
+    for column, amount in delta.items():
+        seed[column] -= amount
+    await db.execute(_insert_skipping_existing(db.get_bind().dialect.name), [seed])
+    await _update_summary(db, user_id, values)
+
+
+async def _aggregate_rows(db: AsyncSession, user_ids: Optional[list[UUID]]) -> list[dict]:
+    """Summary rows computed from the raw tables (one GROUP BY), zero rows for idle users."""
+    query = (
+        select(
+            Workout.user_id,
+            Workout.workout_type,
+            func.count(func.distinct(Workout.id)),
+            func.count(LoggedExerciseSet.id),
+            func.coalesce(func.sum(LoggedExerciseSet.reps), 0),
+            func.coalesce(func.sum(LoggedExerciseSet.reps * LoggedExerciseSet.weight), 0.0),
+            func.min(Workout.created_time),
+            func.max(Workout.created_time),
+        )
+        .outerjoin(LoggedExercise, LoggedExercise.workout_id == Workout.id)
+        .outerjoin(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .group_by(Workout.user_id, Workout.workout_type)
+    )
+    users = select(AuthUser.id)
+    if user_ids is not None:
+        query = query.where(Workout.user_id.in_(user_ids))
+        users = users.where(AuthUser.id.in_(user_ids))
+
+    empty = {**{column: 0 for column in _COUNTER_COLUMNS}, "first_workout_time": None, "last_workout_time": None}
+    rows = {user_id: {"user_id": user_id, **empty} for user_id in (await db.execute(users)).scalars()}
+    for user_id, workout_type, workouts, sets, reps, volume, first, last in (await db.execute(query)).all():
+        row = rows.get(user_id)
+        if row is None:
+            continue
+        row["total_workouts"] += workouts
+        if workout_type is not None:
+            row[WORKOUT_TYPE_COLUMNS[workout_type]] += workouts
+        row["total_sets"] += sets
+        row["total_reps"] += reps
+        row["total_volume"] += volume
+        row["first_workout_time"] = min(filter(None, (row["first_workout_time"], first)))
+        row["last_workout_time"] = max(filter(None, (row["last_workout_time"], last)))
+    return list(rows.values())
+
+
+async def compute_workout_summary(db: AsyncSession, user_id: UUID) -> Optional[dict]:
+    """The user's summary values straight from the raw tables, without writing anything."""
+    rows = await _aggregate_rows(db, [user_id])
+    return rows[0] if rows else None
+
+
+async def rebuild_workout_summaries(db: AsyncSession, user_ids: Optional[list[UUID]] = None) -> int:
+    """Replace the summary rows of `user_ids` (default: every user) with recomputed ones.
+
+    Runs in the caller's transaction; returns the number of rows written.
+    """
+    rows = await _aggregate_rows(db, user_ids)
+    stale = delete(UserWorkoutSummary)
+    if user_ids is not None:
+        stale = stale.where(UserWorkoutSummary.user_id.in_(user_ids))
+    await db.execute(stale.execution_options(synchronize_session=False))
+    if rows:
+        await db.execute(UserWorkoutSummary.__table__.insert(), rows)
+    return len(rows)
+
+
+async def _rebuild_and_commit(db: AsyncSession, user_ids: Optional[list[UUID]]) -> int:
+    written = await rebuild_workout_summaries(db, user_ids)
+    await db.commit()
+    return written
+
+
+if __name__ == "__main__":
+    from src.backend.database.async_configure import run_with_session
+    from src.backend.database.create_indexes import create_missing_tables
+
+    parser = argparse.ArgumentParser(description="Recompute user_workout_summary from the workout tables.")
+    parser.add_argument("--user", type=UUID, action="append", help="only rebuild this user id (repeatable)")
+    args = parser.parse_args()
+    create_missing_tables()
+    print(f"Rebuilt {run_with_session(_rebuild_and_commit, args.user)} workout summary row(s).")
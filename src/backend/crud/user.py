@@ -1,25 +1,39 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-from uuid import UUID
-from typing import Optional, List
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID, uuid4
+from typing import Optional, List, Tuple
 from src.backend.models.auth_user import AuthUser
+from src.backend.models.user_workout_summary import UserWorkoutSummary
 from src.backend.schemas.auth_user import AuthUserCreate, AuthUserUpdate
-from src.backend.auth.util import get_password_hash
+from src.backend.auth.revocation import revoke_user_tokens
+from src.backend.auth.util import get_password_hash_async, revocation_list
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, paginate, str_key, uuid_key
 
-def get_user_by_id(db: Session, user_id: UUID) -> Optional[AuthUser]:
-    result = db.execute(select(AuthUser).where(AuthUser.id == user_id))
+# Changing any of these makes outstanding tokens (or their claims) stale.
+_TOKEN_BEARING_FIELDS = {"username", "password", "disabled", "is_admin"}
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[AuthUser]:
+    result = await db.execute(select(AuthUser).where(AuthUser.id == user_id))
     return result.scalar_one_or_none()
 
-def get_user_by_username(db: Session, username: str) -> Optional[AuthUser]:
-    result = db.execute(select(AuthUser).where(AuthUser.username == username))
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[AuthUser]:
+    result = await db.execute(select(AuthUser).where(AuthUser.username == username))
     return result.scalar_one_or_none()
 
-def get_all_users(db: Session) -> List[AuthUser]:
-    return db.query(AuthUser).all()
+async def get_all_users(db: AsyncSession) -> List[AuthUser]:
+    result = await db.execute(select(AuthUser))
+    return result.scalars().all()
+
+async def get_users_page(
+    db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[AuthUser], Optional[str]]:
+    keys = (str_key(AuthUser.username), uuid_key(AuthUser.id))
+    return await paginate(db, select(AuthUser), keys, cursor, limit)
 
-def create_user(db: Session, user_data: AuthUserCreate) -> AuthUser:
-    hashed_password = get_password_hash(user_data.password)
+async def create_user(db: AsyncSession, user_data: AuthUserCreate) -> AuthUser:
+    hashed_password = await get_password_hash_async(user_data.password)
     db_user = AuthUser(
+        id=uuid4(),
         username=user_data.username,
         email=user_data.email,
         full_name=user_data.full_name,
@@ -28,27 +42,33 @@ def create_user(db: Session, user_data: AuthUserCreate) -> AuthUser:
         is_admin=user_data.is_admin
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    # Start the rollup at zero so the first workout is a plain delta.
+    db.add(UserWorkoutSummary(user_id=db_user.id))
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
-def update_user(db: Session, user_id: UUID, updates: AuthUserUpdate) -> Optional[AuthUser]:
-    user = get_user_by_id(db, user_id)
+async def update_user(db: AsyncSession, user_id: UUID, updates: AuthUserUpdate) -> Optional[AuthUser]:
+    user = await get_user_by_id(db, user_id)
     if not user:
         return None
     update_data = updates.model_dump(exclude_unset=True)
+    if update_data.keys() & _TOKEN_BEARING_FIELDS:
+        await revoke_user_tokens(db, revocation_list, user.id)
     if "password" in update_data:
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+        update_data["hashed_password"] = await get_password_hash_async(update_data.pop("password"))
     for field, value in update_data.items():
         setattr(user, field, value)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
-def delete_user(db: Session, user_id: UUID) -> bool:
-    user = get_user_by_id(db, user_id)
+async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
+    user = await get_user_by_id(db, user_id)
     if not user:
         return False
-    db.delete(user)
-    db.commit()
-    return True
\ No newline at end of file
+    await revoke_user_tokens(db, revocation_list, user.id)
+    await db.execute(delete(UserWorkoutSummary).where(UserWorkoutSummary.user_id == user.id))
+    await db.delete(user)
+    await db.commit()
+    return True
@@ -1,153 +1,412 @@
+import os
+from collections import defaultdict, deque
 from dateutil.relativedelta import relativedelta
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload, subqueryload
 from uuid import UUID, uuid4
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.backend.models.auth_user import AuthUser
 from src.backend.models.enums import ExerciseGroup
 from src.backend.models.exercise import Exercise
+from src.backend.models.exercise_performance import ExercisePerformance
 from src.backend.models.workout import Workout
 from src.backend.models.logged_exercise import LoggedExercise
 from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.user_workout_summary import WORKOUT_TYPE_COLUMNS, UserWorkoutSummary
 from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+from src.backend.crud.exercise import resolve_exercise_names, retry_on_stale_catalog
+from src.backend.crud.summary import (
+    apply_summary_delta,
+    combine_deltas,
+    compute_workout_summary,
+    summary_delta,
+    workout_delta,
+)
+from src.backend.crud.exercise_performance import clear_performances, record_performances, workout_performance_rows
+from src.backend.crud.exercise_volume import refresh_weekly_volume, week_start, workout_volume_keys
+from src.backend.crud.personal_records import group_new_sets, recompute_personal_records, record_new_sets
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, datetime_key, paginate, uuid_key
+
+# Loader strategies for the workout -> logged exercise -> set/exercise graph.
+# Collections default to selectin (one extra IN query per level, independent
+# of history size); the many-to-one exercise rides along as a joined load.
+WORKOUT_COLLECTION_LOADING = os.getenv("WORKOUT_COLLECTION_LOADING", "selectin")
+WORKOUT_EXERCISE_LOADING = os.getenv("WORKOUT_EXERCISE_LOADING", "joined")
+
+_LOADERS = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "subquery": subqueryload,
+}
+
+
+def workout_graph_options(collection_loading: Optional[str] = None, exercise_loading: Optional[str] = None):
+    """Loader options that fetch a workout's full graph in a fixed number of queries."""
+    collection_loading = collection_loading or WORKOUT_COLLECTION_LOADING
+    exercise_loading = exercise_loading or WORKOUT_EXERCISE_LOADING
+    for strategy in (collection_loading, exercise_loading):
+        if strategy not in _LOADERS:
+            raise ValueError(f"Unknown loading strategy '{strategy}'. Expected one of {sorted(_LOADERS)}.")
+
+    collection = _LOADERS[collection_loading]
+    return (
+        collection(Workout.logged_exercises).options(
+            collection(LoggedExercise.sets),
+            _LOADERS[exercise_loading](LoggedExercise.exercise),
+        ),
+    )
 
 
-def create_workout(db: Session, workout_data: WorkoutCreateSimple) -> Workout:
-    user = db.query(AuthUser).filter(AuthUser.username == workout_data.username).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+def _select_workouts():
+    return select(Workout).options(*workout_graph_options())
+
+
+# Newest first; id breaks ties between workouts logged at the same instant.
+_WORKOUT_KEYSET = (datetime_key(Workout.created_time), uuid_key(Workout.id))
+
+
+def _missing_exercises_message(missing: list[str]) -> str:
+    if len(missing) == 1:
+        return f"Exercise '{missing[0]}' not found"
+    return "Exercises not found: " + ", ".join(f"'{name}'" for name in missing)
+
 
-    logged_exercises = []
-    for entry in workout_data.logged_exercises:
-        exercise = db.query(Exercise).filter(Exercise.name == entry.name).first()
-        if not exercise:
-            raise HTTPException(status_code=404, detail=f"Exercise '{entry.name}' not found")
-
-        logged_sets = [
-            LoggedExerciseSet(
-                set_number=s.set_number,
-                reps=s.reps,
-                weight=s.weight
-            )
-            for s in entry.sets
-        ]
-
-        logged_exercise = LoggedExercise(
-            exercise_id=exercise.id,
-            sets=logged_sets
+async def _insert_logged_exercises(db: AsyncSession, workout_id: UUID, entries: list, exercise_ids: dict) -> Tuple[list, list]:
+    """Bulk-insert logged exercises and their sets: two executemany statements total.
+
+    `entries` are dicts shaped like LoggedExerciseCreateByName. Returns the
+    inserted (logged exercise rows, set rows).
+    """
+    logged_rows, set_rows = [], []
+    for entry in entries:
+        logged_exercise_id = uuid4()
+        logged_rows.append({
+            "id": logged_exercise_id,
+            "workout_id": workout_id,
+            "exercise_id": exercise_ids[entry["name"]],
+        })
+        set_rows.extend(
+            {
+                "id": uuid4(),
+                "logged_exercise_id": logged_exercise_id,
+                "set_number": s["set_number"],
+                "reps": s["reps"],
+                "weight": s["weight"],
+            }
+            for s in entry["sets"]
         )
-        logged_exercises.append(logged_exercise)
+    if logged_rows:
+        await db.execute(insert(LoggedExercise), logged_rows)
+    if set_rows:
+        await db.execute(insert(LoggedExerciseSet), set_rows)
+    return logged_rows, set_rows
+
+
+async def create_workout(db: AsyncSession, workout_data: WorkoutCreateSimple) -> Workout:
+    workout, _ = await create_workout_with_records(db, workout_data)
+    return workout
+
+
+async def create_workout_with_records(
+    db: AsyncSession, workout_data: WorkoutCreateSimple
+) -> Tuple[Workout, Dict[UUID, List[str]]]:
+    """create_workout() that also returns {set_id: record kinds} for the sets that set personal records."""
+    return await retry_on_stale_catalog(db, _create_workout_with_records, workout_data)
+
+
+async def _create_workout_with_records(
+    db: AsyncSession, workout_data: WorkoutCreateSimple
+) -> Tuple[Workout, Dict[UUID, List[str]]]:
+    result = await db.execute(select(AuthUser.id).where(AuthUser.username == workout_data.username))
+    user_id = result.scalars().first()
+    if not user_id:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    entries = [entry.model_dump() for entry in workout_data.logged_exercises]
+    exercise_ids, missing = await resolve_exercise_names(db, [entry["name"] for entry in entries])
+    if missing:
+        raise HTTPException(status_code=404, detail=_missing_exercises_message(missing))
 
     workout = Workout(
-        user_id=user.id,
+        id=uuid4(),
+        user_id=user_id,
         created_time=workout_data.created_time,
         notes=workout_data.notes,
         workout_type=workout_data.workout_type,
-        logged_exercises=logged_exercises
     )
-
     db.add(workout)
-    db.commit()
-    db.refresh(workout)
-    return workout
+    await db.flush()
+    logged_rows, set_rows = await _insert_logged_exercises(db, workout.id, entries, exercise_ids)
+    exercise_by_logged = {row["id"]: row["exercise_id"] for row in logged_rows}
+    await record_performances(db, [
+        {"logged_exercise_id": row["id"], "workout_id": workout.id, "user_id": user_id,
+         "exercise_id": row["exercise_id"], "performed_at": workout.created_time}
+        for row in logged_rows
+    ])
+    records = await record_new_sets(db, user_id, group_new_sets(set_rows, exercise_by_logged))
+    sets = [(s["reps"], s["weight"]) for entry in entries for s in entry["sets"]]
+    await apply_summary_delta(db, user_id, summary_delta(workout.workout_type, sets))
+    week = week_start(workout.created_time)
+    await refresh_weekly_volume(db, user_id, {(exercise_ids[entry["name"]], week) for entry in entries})
+    await db.commit()
+    return await _reload_workout(db, workout.id), records
+
+
+async def _reload_workout(db: AsyncSession, workout_id: UUID) -> Workout:
+    # refresh() does not cascade into nested eager loads, and AsyncSession
+    # cannot lazy-load during serialization, so re-select the whole graph.
+    result = await db.execute(
+        _select_workouts()
+        .where(Workout.id == workout_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.unique().scalars().one()
 
 
-def get_workout_by_workout_id(db: Session, workout_id: UUID) -> Optional[Workout]:
-    return db.query(Workout).filter(Workout.id == workout_id).first()
+async def get_workout_by_workout_id(db: AsyncSession, workout_id: UUID) -> Optional[Workout]:
+    result = await db.execute(_select_workouts().where(Workout.id == workout_id))
+    return result.unique().scalars().first()
 
 
-def get_last_workout(username: str, db: Session) -> Optional[Workout]:
-    return (
-        db.query(Workout)
+async def get_last_workout(username: str, db: AsyncSession) -> Optional[Workout]:
+    result = await db.execute(
+        _select_workouts()
         .join(AuthUser, Workout.user_id == AuthUser.id)
-        .filter(AuthUser.username == username)
+        .where(AuthUser.username == username)
         .order_by(Workout.created_time.desc())
-        .first()
+        .limit(1)
     )
+    return result.unique().scalars().first()
 
 
-def get_all_workouts_by_name(username: str, db: Session) -> list[Workout]:
-    return (
-        db.query(Workout)
+async def get_all_workouts_by_name(username: str, db: AsyncSession) -> list[Workout]:
+    result = await db.execute(
+        _select_workouts()
         .join(AuthUser, Workout.user_id == AuthUser.id)
-        .filter(AuthUser.username == username)
+        .where(AuthUser.username == username)
         .order_by(Workout.created_time.desc())
-        .all()
     )
+    return result.unique().scalars().all()
 
 
-def get_last_workout_based_on_username_and_type(username: str, workout_type: str, db: Session) -> Optional[Workout]:
-    return (
-        db.query(Workout)
+async def get_workouts_page_by_name(
+    username: str, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[list[Workout], Optional[str]]:
+    stmt = (
+        _select_workouts()
         .join(AuthUser, Workout.user_id == AuthUser.id)
-        .filter(AuthUser.username == username, Workout.workout_type == ExerciseGroup(workout_type))
+        .where(AuthUser.username == username)
+    )
+    return await paginate(db, stmt, _WORKOUT_KEYSET, cursor, limit, descending=True)
+
+
+async def get_last_workout_based_on_username_and_type(username: str, workout_type: str, db: AsyncSession) -> Optional[Workout]:
+    result = await db.execute(
+        _select_workouts()
+        .join(AuthUser, Workout.user_id == AuthUser.id)
+        .where(AuthUser.username == username, Workout.workout_type == ExerciseGroup(workout_type))
         .order_by(Workout.created_time.desc())
-        .first()
+        .limit(1)
     )
+    return result.unique().scalars().first()
+
 
+async def get_all_workouts(db: AsyncSession) -> list[Workout]:
+    result = await db.execute(_select_workouts())
+    return result.unique().scalars().all()
 
-def get_all_workouts(db: Session) -> list[Workout]:
-    return db.query(Workout).all()
 
+async def get_workouts_page(
+    db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[list[Workout], Optional[str]]:
+    return await paginate(db, _select_workouts(), _WORKOUT_KEYSET, cursor, limit, descending=True)
 
-def update_workout(db: Session, workout_id: UUID, updates: WorkoutUpdate) -> Optional[Workout]:
-    workout = db.query(Workout).filter(Workout.id == workout_id).first()
+
+# Row-tuple read path: history pages built as plain dicts shaped like
+# WorkoutOut, without instantiating ORM objects or validating through Pydantic.
+_WORKOUT_COLUMNS = (Workout.id, Workout.user_id, Workout.created_time, Workout.notes, Workout.workout_type)
+
+
+async def _workout_payloads(db: AsyncSession, workout_rows: list) -> list[dict]:
+    workouts = {
+        row.id: {
+            "id": row.id,
+            "user_id": row.user_id,
+            "created_time": row.created_time,
+            "notes": row.notes,
+            "workout_type": row.workout_type,
+            "logged_exercises": [],
+        }
+        for row in workout_rows
+    }
+    if not workouts:
+        return []
+
+    result = await db.execute(
+        select(
+            LoggedExercise.id, LoggedExercise.workout_id,
+            Exercise.id, Exercise.name, Exercise.category,
+            LoggedExerciseSet.id, LoggedExerciseSet.set_number, LoggedExerciseSet.reps, LoggedExerciseSet.weight,
+        )
+        .join(Exercise, LoggedExercise.exercise_id == Exercise.id)
+        .outerjoin(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(LoggedExercise.workout_id.in_(list(workouts)))
+        # Fixed order, so the JSON does not depend on the database's row order.
+        .order_by(LoggedExercise.workout_id, LoggedExercise.id, LoggedExerciseSet.set_number)
+    )
+    logged = {}
+    for (logged_id, workout_id, exercise_id, name, category,
+         set_id, set_number, reps, weight) in result.all():
+        entry = logged.get(logged_id)
+        if entry is None:
+            entry = logged[logged_id] = {
+                "id": logged_id,
+                "workout_id": workout_id,
+                "exercise": {"id": exercise_id, "name": name, "category": category},
+                "sets": [],
+            }
+            workouts[workout_id]["logged_exercises"].append(entry)
+        if set_id is not None:
+            entry["sets"].append({
+                "id": set_id,
+                "logged_exercise_id": logged_id,
+                "set_number": set_number,
+                "reps": reps,
+                "weight": weight,
+            })
+    return list(workouts.values())
+
+
+async def get_workout_payloads_page(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    username: Optional[str] = None,
+) -> Tuple[list[dict], Optional[str]]:
+    """Like get_workouts_page(_by_name), but returns JSON-ready dicts: two queries, no ORM objects."""
+    stmt = select(*_WORKOUT_COLUMNS)
+    if username is not None:
+        stmt = stmt.join(AuthUser, Workout.user_id == AuthUser.id).where(AuthUser.username == username)
+    rows, next_cursor = await paginate(db, stmt, _WORKOUT_KEYSET, cursor, limit, descending=True, scalars=False)
+    return await _workout_payloads(db, rows), next_cursor
+
+
+def _reconcile_sets(logged_exercise: LoggedExercise, incoming: list) -> None:
+    """Match incoming sets to existing rows by set_number; unmatched rows are deleted."""
+    existing = {s.set_number: s for s in logged_exercise.sets}
+    for set_data in incoming:
+        current = existing.pop(set_data["set_number"], None)
+        if current is None:
+            logged_exercise.sets.append(LoggedExerciseSet(
+                set_number=set_data["set_number"],
+                reps=set_data["reps"],
+                weight=set_data["weight"]
+            ))
+            continue
+        # Assigning an equal value records no net change, so no UPDATE is emitted
+        current.reps = set_data["reps"]
+        current.weight = set_data["weight"]
+    for stale in existing.values():
+        logged_exercise.sets.remove(stale)
+
+
+def _reconcile_logged_exercises(workout: Workout, entries: list, exercise_ids: dict) -> None:
+    """Diff the incoming exercises against the loaded graph instead of clear-and-reinsert.
+
+    Existing logged exercises are matched by exercise (in order, so a workout
+    may log the same exercise twice). The unit of work then flushes only the
+    UPDATE/INSERT/DELETE statements the edit actually needs; removed rows go
+    through the delete-orphan cascade.
+    """
+    available = defaultdict(deque)
+    for logged_exercise in workout.logged_exercises:
+        available[logged_exercise.exercise_id].append(logged_exercise)
+
+    for entry in entries:
+        exercise_id = exercise_ids[entry["name"]]
+        if available[exercise_id]:
+            logged_exercise = available[exercise_id].popleft()
+        else:
+            logged_exercise = LoggedExercise(exercise_id=exercise_id)
+            workout.logged_exercises.append(logged_exercise)
+        _reconcile_sets(logged_exercise, entry["sets"])
+
+    for leftovers in available.values():
+        for logged_exercise in leftovers:
+            workout.logged_exercises.remove(logged_exercise)
+
+
+async def update_workout(db: AsyncSession, workout_id: UUID, updates: WorkoutUpdate) -> Optional[Workout]:
+    return await retry_on_stale_catalog(db, _update_workout, workout_id, updates)
+
+
+async def _update_workout(db: AsyncSession, workout_id: UUID, updates: WorkoutUpdate) -> Optional[Workout]:
+    workout = await get_workout_by_workout_id(db, workout_id)
     if not workout:
         return None
 
     payload = updates.model_dump(exclude_unset=True)
+    before = workout_delta(workout, sign=-1)
+    touched_weeks = workout_volume_keys(workout)
 
     if "logged_exercises" in payload and payload["logged_exercises"]:
-        workout.logged_exercises.clear()
-        for le_data in payload["logged_exercises"]:
-            exercise = db.query(Exercise).filter(Exercise.name == le_data["name"]).first()
-            if not exercise:
-                raise ValueError(f"Exercise '{le_data['name']}' not found.")
-            le = LoggedExercise(
-                id=uuid4(),
-                workout_id=workout.id,
-                exercise_id=exercise.id
-            )
-            db.add(le)
-            for set_data in le_data["sets"]:
-                le_set = LoggedExerciseSet(
-                    id=uuid4(),
-                    logged_exercise_id=le.id,
-                    set_number=set_data["set_number"],
-                    reps=set_data["reps"],
-                    weight=set_data["weight"]
-                )
-                db.add(le_set)
+        entries = payload["logged_exercises"]
+        exercise_ids, missing = await resolve_exercise_names(db, [entry["name"] for entry in entries])
+        if missing:
+            raise ValueError(_missing_exercises_message(missing) + ".")
+        _reconcile_logged_exercises(workout, entries, exercise_ids)
 
     for field, value in payload.items():
         if field != "logged_exercises":
             setattr(workout, field, value)
 
-    db.commit()
-    db.refresh(workout)
-    return workout
-
-
-def delete_workout(db: Session, workout_id: UUID) -> bool:
-    workout = db.query(Workout).filter(Workout.id == workout_id).first()
+    await db.flush()
+    await apply_summary_delta(
+        db, workout.user_id, combine_deltas(before, workout_delta(workout)),
+        times_changed="created_time" in payload,
+    )
+    if payload.keys() & {"logged_exercises", "created_time"}:
+        await clear_performances(db, ExercisePerformance.workout_id == workout.id)
+        await record_performances(db, workout_performance_rows(workout))
+        after_weeks = workout_volume_keys(workout)
+        await refresh_weekly_volume(db, workout.user_id, touched_weeks | after_weeks)
+        if payload.get("logged_exercises"):
+            touched_exercises = {exercise_id for exercise_id, _ in touched_weeks | after_weeks}
+            await recompute_personal_records(db, workout.user_id, touched_exercises)
+    await db.commit()
+    return await _reload_workout(db, workout.id)
+
+
+async def delete_workout(db: AsyncSession, workout_id: UUID) -> bool:
+    workout = await get_workout_by_workout_id(db, workout_id)
     if not workout:
         return False
-    db.delete(workout)
-    db.commit()
+    delta = workout_delta(workout, sign=-1)
+    touched_weeks = workout_volume_keys(workout)
+    await clear_performances(db, ExercisePerformance.workout_id == workout.id)
+    await db.delete(workout)
+    await db.flush()
+    await apply_summary_delta(db, workout.user_id, delta)
+    await refresh_weekly_volume(db, workout.user_id, touched_weeks)
+    await recompute_personal_records(db, workout.user_id, {exercise_id for exercise_id, _ in touched_weeks})
+    await db.commit()
     return True
 
 
-def calculate_num_workouts_by_month(username: str, db: Session) -> float:
-    workouts = get_all_workouts_by_name(username, db)
-    num_workouts = len(workouts)
+async def calculate_num_workouts_by_month(username: str, db: AsyncSession) -> float:
+    result = await db.execute(
+        select(func.count(Workout.id), func.min(Workout.created_time), func.max(Workout.created_time))
+        .join(AuthUser, Workout.user_id == AuthUser.id)
+        .where(AuthUser.username == username)
+    )
+    num_workouts, earliest_time, latest_time = result.one()
 
     if num_workouts <= 1:
         return float(num_workouts)
 
-    latest_time = workouts[0].created_time
-    earliest_time = workouts[-1].created_time
-
     diff = relativedelta(latest_time, earliest_time)
     total_months = diff.years * 12 + diff.months + (diff.days / 30)
 
@@ -157,14 +416,74 @@ def calculate_num_workouts_by_month(username: str, db: Session) -> float:
     return num_workouts / total_months
 
 
-def calculate_num_workouts_by_type(username: str, workout_type: str, db: Session) -> int:
-    return (
-        db.query(Workout)
+async def calculate_num_workouts_by_type(username: str, workout_type: str, db: AsyncSession) -> int:
+    result = await db.execute(
+        select(func.count(Workout.id))
         .join(AuthUser, Workout.user_id == AuthUser.id)
-        .filter(
+        .where(
             AuthUser.username == username,
             Workout.workout_type == ExerciseGroup(workout_type)
         )
-        .order_by(Workout.created_time.desc())
-        .count()
-    )
\ No newline at end of file
+    )
+    return result.scalar_one()
+
+
+async def calculate_num_workouts_by_all_types(username: str, db: AsyncSession) -> dict[str, int]:
+    """Workout counts for every ExerciseGroup (zero-filled) from a single GROUP BY."""
+    result = await db.execute(
+        select(Workout.workout_type, func.count(Workout.id))
+        .join(AuthUser, Workout.user_id == AuthUser.id)
+        .where(AuthUser.username == username, Workout.workout_type.is_not(None))
+        .group_by(Workout.workout_type)
+    )
+    counts = {group.value: 0 for group in ExerciseGroup}
+    for workout_type, count in result.all():
+        counts[workout_type.value] = count
+    return counts
+
+
+MOST_COMMON_EXERCISES_LIMIT = 5
+
+
+async def get_workout_stats(username: str, db: AsyncSession, top_exercises: int = MOST_COMMON_EXERCISES_LIMIT) -> dict:
+    """Dashboard numbers for one user; no ORM objects are loaded.
+
+    Totals come from the user's user_workout_summary row (a primary-key
+    lookup; recomputed on the fly for users the rollup has not reached yet),
+    and a GROUP BY ranks the exercises by how many times they were logged.
+    """
+    summary_columns = [column for column in UserWorkoutSummary.__table__.c if column.key != "user_id"]
+    result = await db.execute(
+        select(AuthUser.id, UserWorkoutSummary.user_id.label("summary_user_id"), *summary_columns)
+        .outerjoin(UserWorkoutSummary, UserWorkoutSummary.user_id == AuthUser.id)
+        .where(AuthUser.username == username)
+    )
+    summary = result.mappings().first()
+    if summary is not None and summary["summary_user_id"] is None:
+        summary = await compute_workout_summary(db, summary["id"])
+    summary = summary or {}
+
+    total_workouts = summary.get("total_workouts", 0)
+    total_sets = summary.get("total_sets", 0)
+    times_logged = func.count(LoggedExercise.id)
+    common = await db.execute(
+        select(Exercise.name)
+        .join(LoggedExercise, LoggedExercise.exercise_id == Exercise.id)
+        .join(Workout, LoggedExercise.workout_id == Workout.id)
+        .join(AuthUser, Workout.user_id == AuthUser.id)
+        .where(AuthUser.username == username)
+        .group_by(Exercise.id, Exercise.name)
+        .order_by(times_logged.desc(), Exercise.name)
+        .limit(top_exercises)
+    )
+
+    return {
+        "total_workouts": total_workouts,
+        "workouts_by_type": {group.value: summary.get(column, 0) for group, column in WORKOUT_TYPE_COLUMNS.items()},
+        "avg_sets_per_workout": total_sets / total_workouts if total_workouts else 0.0,
+        "avg_reps_per_set": summary.get("total_reps", 0) / total_sets if total_sets else 0.0,
+        "total_volume": summary.get("total_volume", 0.0),
+        "first_workout_time": summary.get("first_workout_time"),
+        "last_workout_time": summary.get("last_workout_time"),
+        "most_common_exercises": list(common.scalars().all()),
+    }
@@ -1,12 +1,12 @@
+import asyncio
 import os
+from functools import lru_cache
 from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
-from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
-
-load_dotenv()
-Base = declarative_base()
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, AsyncSession
+from typing import Any, AsyncGenerator, Awaitable, Callable, TypeVar
+from src.backend.config import load_env
+from src.backend.database.engine import create_async_db_engine
+from src.backend.models.base import Base
 
 # Query params understood by libpq/psycopg2 but NOT by asyncpg; they must be
 # stripped from the URL and translated into connect_args instead.
@@ -39,6 +39,7 @@ def _resolve_async_database_url() -> tuple[str, dict]:
     2. DATABASE_URL set   -> normalized to an async driver (Postgres -> asyncpg).
     3. DB_SECRET_NAME set -> legacy AWS Secrets Manager + RDS fallback.
     """
+    load_env()
     if os.getenv("TESTING", "0") == "1":
         return os.getenv("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:"), {}
 
@@ -65,11 +66,49 @@ def _resolve_async_database_url() -> tuple[str, dict]:
     )
 
 
-DATABASE_URL, _connect_args = _resolve_async_database_url()
+# Resolved on first use rather than at import, so a cold start does not wait
+# on Secrets Manager or driver imports before the app can even load.
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    url, connect_args = _resolve_async_database_url()
+    return create_async_db_engine(url, connect_args)
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(bind=get_async_engine(), expire_on_commit=False, class_=AsyncSession)
+
+
+_LAZY_ATTRIBUTES = {
+    "DATABASE_URL": lambda: get_async_engine().url.render_as_string(hide_password=False),
+    "engine": get_async_engine,
+    "async_session": get_async_sessionmaker,
+}
+
+
+def __getattr__(name: str):
+    # Keeps `from src.backend.database.async_configure import engine` working for scripts.
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+T = TypeVar("T")
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True, connect_args=_connect_args)
-async_session = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
-        yield session
\ No newline at end of file
+    async with get_async_sessionmaker()() as session:
+        yield session
+
+
+def run_with_session(fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """Sync shim for scripts: run an async CRUD function on a fresh AsyncSession.
+
+    Usage: ``run_with_session(crud_user.get_all_users)``. Must not be called
+    from inside a running event loop (use ``await fn(session, ...)`` there).
+    """
+    async def _runner() -> T:
+        async with get_async_sessionmaker()() as session:
+            return await fn(session, *args, **kwargs)
+
+    return asyncio.run(_runner())
@@ -1,11 +1,10 @@
 import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-
-load_dotenv()
-
-Base = declarative_base()
+from functools import lru_cache
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from src.backend.config import load_env
+from src.backend.database.engine import create_sync_db_engine
+from src.backend.models.base import Base
 
 
 def _resolve_database_url() -> str:
@@ -17,6 +16,7 @@ def _resolve_database_url() -> str:
                                  standard connection string).
       3. DB_SECRET_NAME set   -> legacy AWS Secrets Manager + RDS fallback.
     """
+    load_env()
     if os.getenv("TESTING", "0") == "1":
         return os.getenv("TEST_DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
@@ -46,15 +46,41 @@ def _resolve_database_url() -> str:
     )
 
 
-DATABASE_URL = _resolve_database_url()
+# Resolved on first use rather than at import: the URL may need a Secrets
+# Manager round-trip, and most importers never open a sync connection.
+@lru_cache(maxsize=None)
+def get_database_url() -> str:
+    return _resolve_database_url()
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    url = get_database_url()
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    return create_sync_db_engine(url, connect_args)
+
+
+@lru_cache(maxsize=None)
+def get_sessionmaker() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+_LAZY_ATTRIBUTES = {
+    "DATABASE_URL": get_database_url,
+    "engine": get_engine,
+    "SessionLocal": get_sessionmaker,
+}
+
 
-_connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=_connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def __getattr__(name: str):
+    # Keeps `from src.backend.database.configure import engine` working for scripts.
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db():
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
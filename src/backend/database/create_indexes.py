@@ -0,0 +1,80 @@
+"""Bring a long-lived database up to the models without dropping anything.
+
+    python -m src.backend.database.create_indexes
+
+creates tables added to the models since the database was built, then the
+indexes it is missing. Run it before the rollup rebuild CLIs (e.g.
+python -m src.backend.crud.summary), which fill the new tables.
+"""
+from typing import Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from src.backend.database.configure import Base, get_engine
+import src.backend.models  # noqa: F401  (registers every table on Base.metadata)
+
+
+def _existing_index_names(bind: Engine, table_name: str) -> set[str]:
+    if bind.dialect.name == "sqlite":
+        # SQLite reflection skips expression indexes such as lower(name)
+        with bind.connect() as conn:
+            rows = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+                {"table": table_name},
+            )
+            return {row[0] for row in rows}
+    return {index["name"] for index in inspect(bind).get_indexes(table_name)}
+
+
+def create_missing_tables(bind: Optional[Engine] = None) -> list[str]:
+    """Create model tables (with their indexes) that an existing database does not have yet.
+
+    Unlike sync_tables this never drops anything, so it is safe on a
+    database holding data. Returns the names of the tables created.
+    """
+    bind = bind if bind is not None else get_engine()
+    inspector = inspect(bind)
+    missing = [table for table in Base.metadata.sorted_tables if not inspector.has_table(table.name)]
+    if missing:
+        Base.metadata.create_all(bind=bind, tables=missing, checkfirst=True)
+    return [table.name for table in missing]
+
+
+def create_missing_indexes(bind: Optional[Engine] = None) -> list[str]:
+    """Create model-declared indexes that an existing database is missing.
+
+    create_all() skips tables that already exist, so indexes added to the
+    models later never reach long-lived databases. This is idempotent and
+    leaves data alone. On PostgreSQL the indexes are built CONCURRENTLY so
+    writes to the hot tables are not blocked while they build.
+    """
+    bind = bind if bind is not None else get_engine()
+    inspector = inspect(bind)
+    concurrent = bind.dialect.name == "postgresql"
+    if concurrent:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        bind = bind.execution_options(isolation_level="AUTOCOMMIT")
+
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = _existing_index_names(bind, table.name)
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name in existing:
+                continue
+            if concurrent:
+                index.dialect_options["postgresql"]["concurrently"] = True
+            try:
+                index.create(bind=bind)
+            finally:
+                if concurrent:
+                    index.dialect_options["postgresql"]["concurrently"] = False
+            created.append(index.name)
+    return created
+
+
+if __name__ == "__main__":
+    tables = create_missing_tables()
+    print(f"Created {len(tables)} table(s): {', '.join(tables)}" if tables else "All tables already exist.")
+    created = create_missing_indexes()
+    print(f"Created {len(created)} index(es): {', '.join(created)}" if created else "All indexes already exist.")
@@ -0,0 +1,142 @@
+import os
+import time
+from dataclasses import dataclass
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection-pool knobs shared by the sync and async engines.
+
+    Defaults suit Neon: it suspends idle computes and drops their
+    connections, so connections are pinged on checkout and recycled well
+    before its idle timeout.
+    """
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 240
+    pool_pre_ping: bool = True
+    # Behind a transaction pooler (PgBouncer, Neon's "-pooler" endpoint) a
+    # server-side prepared statement may land on another backend, so
+    # statement caching must be off.
+    transaction_pooler: bool = False
+    statement_cache_size: int = 100
+
+    @classmethod
+    def from_env(cls, url: str = "") -> "PoolSettings":
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", cls.pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", cls.max_overflow)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", cls.pool_timeout)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", cls.pool_recycle)),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            transaction_pooler=_env_bool("DB_TRANSACTION_POOLER", "-pooler." in url),
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", cls.statement_cache_size)),
+        )
+
+
+class _WaitTimingMixin:
+    """Records how long checkouts wait for a connection, for `pool_stats`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.invalidated = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            self.wait_count += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class TimedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _count_invalidations(sync_engine: Engine) -> None:
+    # Pre-ping failures (e.g. Neon dropped an idle connection) land here.
+    # Look the pool up on each event: dispose() swaps in a fresh one.
+    @event.listens_for(sync_engine.pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        sync_engine.pool.invalidated += 1
+
+
+def _engine_kwargs(url: str, connect_args: dict, settings: PoolSettings, is_async: bool) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {"connect_args": dict(connect_args)}
+    if url.startswith("sqlite"):
+        # SQLite picks its own pool (static for :memory:); sizing does not apply.
+        return kwargs
+
+    kwargs.update(
+        poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+    )
+    if url.startswith("postgresql+asyncpg"):
+        statement_cache_size = 0 if settings.transaction_pooler else settings.statement_cache_size
+        kwargs["connect_args"]["statement_cache_size"] = statement_cache_size
+        if settings.transaction_pooler:
+            # SQLAlchemy's own prepared-statement cache, plus unique names so
+            # two backends never see the same statement name. Both are read
+            # by the asyncpg dialect's connect(), not by create_engine().
+            kwargs["connect_args"]["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+            kwargs["connect_args"]["prepared_statement_cache_size"] = 0
+    return kwargs
+
+
+def create_sync_db_engine(url: str, connect_args: Optional[dict] = None, settings: Optional[PoolSettings] = None) -> Engine:
+    settings = settings or PoolSettings.from_env(url)
+    engine = create_engine(url, **_engine_kwargs(url, connect_args or {}, settings, is_async=False))
+    if isinstance(engine.pool, TimedQueuePool):
+        _count_invalidations(engine)
+    return engine
+
+
+def create_async_db_engine(url: str, connect_args: Optional[dict] = None, settings: Optional[PoolSettings] = None) -> AsyncEngine:
+    settings = settings or PoolSettings.from_env(url)
+    engine = create_async_engine(url, **_engine_kwargs(url, connect_args or {}, settings, is_async=True))
+    if isinstance(engine.sync_engine.pool, TimedAsyncAdaptedQueuePool):
+        _count_invalidations(engine.sync_engine)
+    return engine
+
+
+def pool_stats(engine) -> Dict[str, Any]:
+    """Live pool numbers for a sync or async engine."""
+    pool = engine.sync_engine.pool if isinstance(engine, AsyncEngine) else engine.pool
+    if not isinstance(pool, _WaitTimingMixin):
+        return {"pool": type(pool).__name__, "status": pool.status()}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "wait_count": pool.wait_count,
+        "wait_seconds_total": round(pool.wait_seconds_total, 6),
+        "wait_seconds_max": round(pool.wait_seconds_max, 6),
+        "invalidated": pool.invalidated,
+    }
@@ -1,15 +1,23 @@
 import os
-from dotenv import load_dotenv
-from src.backend.database.configure import Base, engine
+from src.backend.config import load_env
+from src.backend.database.configure import Base, get_engine
 from src.backend.models.auth_user import AuthUser
 from src.backend.models.exercise import Exercise
 from src.backend.models.workout import Workout
 from src.backend.models.logged_exercise import LoggedExercise
 from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.token_revocation import TokenRevocation
+from src.backend.models.refresh_token import RefreshToken
+from src.backend.models.catalog_version import CatalogVersion
+from src.backend.models.user_workout_summary import UserWorkoutSummary
+from src.backend.models.exercise_weekly_volume import ExerciseWeeklyVolume
+from src.backend.models.personal_record import PersonalRecord, RepRecord
+from src.backend.models.exercise_performance import ExercisePerformance
 
 
 def sync_tables():
     """Drop and recreate all tables against the configured database."""
+    engine = get_engine()
     Base.metadata.drop_all(bind=engine)
     print("Dropped all tables.")
     Base.metadata.create_all(bind=engine)
@@ -17,7 +25,7 @@ def sync_tables():
 
 
 if __name__ == "__main__":
-    load_dotenv()
+    load_env()
     if os.getenv("TESTING", "0") != "1":
         confirm = input("This will DROP ALL TABLES in the database. Type 'yes' to continue: ")
         if confirm.lower() != "yes":
@@ -1,7 +1,13 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.backend.database.configure import get_db
+from src.backend.database.async_configure import get_async_engine, get_async_sessionmaker, get_db
+from src.backend.database.engine import pool_stats
+from src.backend.auth.util import get_admin_active_user
+from src.backend.crud.catalog import exercise_catalog
+from src.backend.auth.passwords import password_pool
 from src.backend.api import user, exercise, workout, logged_exercise
+from src.backend.api.compression import CompressionMiddleware
 
 app = FastAPI(
     title="Fitness Tracker API",
@@ -21,17 +27,41 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
 
 app.include_router(user.router, prefix="/api/users", tags=["Users"])
 app.include_router(exercise.router, prefix="/api/exercises", tags=["Exercises"])
 app.include_router(workout.router, prefix="/api/workouts", tags=["Workouts"])
 app.include_router(logged_exercise.router, prefix="/api/logged_exercises", tags=["Logged Exercises"])
 
+async def _warm_exercise_catalog():
+    async with get_async_sessionmaker()() as db:
+        await exercise_catalog.warm(db)
+
+@app.on_event("startup")
+async def start_catalog_warmup():
+    # In the background, so startup never waits on a database round trip;
+    # requests that arrive first simply load the index on use.
+    app.state.catalog_warmup = asyncio.create_task(_warm_exercise_catalog())
+
+@app.on_event("shutdown")
+async def stop_catalog_warmup():
+    app.state.catalog_warmup.cancel()
+
+@app.on_event("shutdown")
+def shutdown_password_pool():
+    password_pool.shutdown()
+
 # Root endpoint
 @app.get("/api", tags=["Root"])
 def read_root():
     return {"message": "Welcome to the Fitness Tracker API!"}
 
+# Live connection-pool numbers for the async engine (admins only)
+@app.get("/api/pool-stats", tags=["Root"], dependencies=[Depends(get_admin_active_user)])
+def read_pool_stats():
+    return pool_stats(get_async_engine())
+
 # /docs endpoint that React is expecting
 @app.get("/api/custom-docs", tags=["Docs"])
 def get_docs():
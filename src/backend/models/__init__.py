@@ -3,4 +3,11 @@ from .user import User
 from .exercise import Exercise
 from .workout import Workout
 from .logged_exercise import LoggedExercise
-from .logged_exercise_set import LoggedExerciseSet
\ No newline at end of file
+from .logged_exercise_set import LoggedExerciseSet
+from .token_revocation import TokenRevocation
+from .refresh_token import RefreshToken
+from .catalog_version import CatalogVersion
+from .user_workout_summary import UserWorkoutSummary
+from .exercise_weekly_volume import ExerciseWeeklyVolume
+from .personal_record import PersonalRecord, RepRecord
+from .exercise_performance import ExercisePerformance
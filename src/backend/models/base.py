@@ -1 +1,4 @@
-from src.backend.database.configure import Base
\ No newline at end of file
+from sqlalchemy.orm import declarative_base
+
+# The one declarative base shared by the sync and async engines.
+Base = declarative_base()
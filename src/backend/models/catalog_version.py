@@ -0,0 +1,13 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.backend.models.base import Base
+
+class CatalogVersion(Base):
+    """Monotonic change counter per cached catalog (e.g. "exercises")."""
+    __tablename__ = "catalog_versions"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'CatalogVersion(name="{self.name}", version={self.version})'
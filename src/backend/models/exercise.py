@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, String, Enum as SQLEnum, ForeignKey
+from sqlalchemy import JSON, String, Enum as SQLEnum, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID, uuid4
 from typing import Optional, List
@@ -10,7 +10,7 @@ class Exercise(Base):
     __tablename__ = "exercises"
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id"), nullable=True)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id"), nullable=True, index=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     category: Mapped[ExerciseGroup] = mapped_column(SQLEnum(ExerciseGroup), nullable=True)
     primary_muscles: Mapped[list[str]] = mapped_column(JSON)
@@ -29,4 +29,7 @@ class Exercise(Base):
             "primary_muscles": self.primary_muscles,
             "secondary_muscles": self.secondary_muscles,
             "description": self.description
-        }
\ No newline at end of file
+        }
+
+# Case-insensitive name lookups (GET /api/exercises/?name=...)
+Index("ix_exercises_name_lower", func.lower(Exercise.name))
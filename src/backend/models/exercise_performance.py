@@ -0,0 +1,34 @@
+from sqlalchemy import DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from datetime import datetime
+from src.backend.models.base import Base
+
+class ExercisePerformance(Base):
+    """One row per logged exercise, carrying its workout's user and time.
+
+    The user lives on workouts and the exercise on logged_exercises, so no
+    index on the base tables can serve "a user's latest sessions of an
+    exercise"; this narrow copy can. Kept current by the workout write paths.
+    """
+    __tablename__ = "exercise_performances"
+
+    logged_exercise_id: Mapped[UUID] = mapped_column(ForeignKey("logged_exercises.id", ondelete="CASCADE"), primary_key=True)
+    workout_id: Mapped[UUID] = mapped_column(ForeignKey("workouts.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id", ondelete="CASCADE"))
+    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id", ondelete="CASCADE"))
+    performed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"ExercisePerformance(logged_exercise_id={self.logged_exercise_id}, exercise_id={self.exercise_id}, performed_at={self.performed_at})"
+
+# Newest session of each exercise for a user: equality on (user_id, exercise_id),
+# then a walk down performed_at (logged_exercise_id breaks ties, matching the
+# window's ORDER BY so no sort is needed).
+Index(
+    "ix_exercise_performances_user_exercise_time",
+    ExercisePerformance.user_id,
+    ExercisePerformance.exercise_id,
+    ExercisePerformance.performed_at.desc(),
+    ExercisePerformance.logged_exercise_id.desc(),
+)
@@ -0,0 +1,23 @@
+from sqlalchemy import Date, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from datetime import date
+from src.backend.models.base import Base
+
+class ExerciseWeeklyVolume(Base):
+    """Per-user, per-exercise totals for one ISO week (week_start is that week's Monday, UTC).
+
+    Kept current by the workout write paths; progress charts read O(weeks) rows.
+    """
+    __tablename__ = "exercise_weekly_volume"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id", ondelete="CASCADE"), primary_key=True)
+    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id", ondelete="CASCADE"), primary_key=True)
+    week_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    set_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rep_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    volume: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    top_weight: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    def __repr__(self):
+        return f"ExerciseWeeklyVolume(user_id={self.user_id}, exercise_id={self.exercise_id}, week_start={self.week_start}, volume={self.volume})"
@@ -10,13 +10,14 @@ class LoggedExercise(Base):
     __tablename__ = 'logged_exercises'
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    workout_id: Mapped[UUID] = mapped_column(ForeignKey("workouts.id"))
-    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id"))
+    workout_id: Mapped[UUID] = mapped_column(ForeignKey("workouts.id"), index=True)
+    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id"), index=True)
 
     sets: Mapped[List[LoggedExerciseSet]] = relationship(
         LoggedExerciseSet,
         back_populates="logged_exercise",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
 
     exercise: Mapped[Exercise] = relationship(Exercise, lazy="joined")
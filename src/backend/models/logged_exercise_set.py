@@ -7,7 +7,7 @@ class LoggedExerciseSet(Base):
     __tablename__ = "logged_exercise_sets"
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    logged_exercise_id: Mapped[UUID] = mapped_column(ForeignKey("logged_exercises.id"))
+    logged_exercise_id: Mapped[UUID] = mapped_column(ForeignKey("logged_exercises.id"), index=True)
     set_number: Mapped[int]
     reps: Mapped[int]
     weight: Mapped[float]
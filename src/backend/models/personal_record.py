@@ -0,0 +1,30 @@
+from sqlalchemy import Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from src.backend.models.base import Base
+
+class PersonalRecord(Base):
+    """A user's best heaviest set and best estimated one-rep max for one exercise."""
+    __tablename__ = "personal_records"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id", ondelete="CASCADE"), primary_key=True)
+    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id", ondelete="CASCADE"), primary_key=True)
+    max_weight: Mapped[float] = mapped_column(Float, nullable=False)
+    best_e1rm: Mapped[float] = mapped_column(Float, nullable=False)
+    best_e1rm_weight: Mapped[float] = mapped_column(Float, nullable=False)
+    best_e1rm_reps: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"PersonalRecord(user_id={self.user_id}, exercise_id={self.exercise_id}, max_weight={self.max_weight}, best_e1rm={self.best_e1rm})"
+
+class RepRecord(Base):
+    """Most reps a user has done at one exact weight of one exercise."""
+    __tablename__ = "rep_records"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id", ondelete="CASCADE"), primary_key=True)
+    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id", ondelete="CASCADE"), primary_key=True)
+    weight: Mapped[float] = mapped_column(Float, primary_key=True)
+    max_reps: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"RepRecord(user_id={self.user_id}, exercise_id={self.exercise_id}, weight={self.weight}, max_reps={self.max_reps})"
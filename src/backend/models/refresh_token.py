@@ -0,0 +1,19 @@
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID, uuid4
+from datetime import datetime
+from typing import Optional
+from src.backend.models.base import Base
+
+class RefreshToken(Base):
+    """A single-use refresh token; only the SHA-256 of the token is stored."""
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id", ondelete="CASCADE"), index=True)
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    used_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"RefreshToken(id={self.id}, user_id={self.user_id}, expires_at={self.expires_at}, used_at={self.used_at})"
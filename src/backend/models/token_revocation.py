@@ -0,0 +1,19 @@
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from datetime import datetime
+from src.backend.models.base import Base
+
+class TokenRevocation(Base):
+    """Access tokens for `user_id` issued at or before `revoked_at` are invalid.
+
+    One row per user (upserted), so the table only ever holds users whose
+    tokens were revoked recently.
+    """
+    __tablename__ = "token_revocations"
+
+    user_id: Mapped[UUID] = mapped_column(primary_key=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+    def __repr__(self):
+        return f"TokenRevocation(user_id={self.user_id}, revoked_at={self.revoked_at})"
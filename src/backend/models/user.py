@@ -2,7 +2,7 @@ from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID, uuid4
 from datetime import datetime
-from src.backend.database.configure import Base
+from src.backend.models.base import Base
 
 class User(Base):
     __tablename__ = "users"
@@ -0,0 +1,39 @@
+from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+from src.backend.models.base import Base
+from src.backend.models.enums import ExerciseGroup
+
+# One counter column per ExerciseGroup, so deltas are plain `col = col + n` updates.
+WORKOUT_TYPE_COLUMNS = {group: f"{group.name.lower()}_workouts" for group in ExerciseGroup}
+
+class UserWorkoutSummary(Base):
+    """Lifetime workout totals for one user, kept current by the workout write paths.
+
+    Rebuild from the raw tables with `python -m src.backend.crud.summary`.
+    """
+    __tablename__ = "user_workout_summary"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id", ondelete="CASCADE"), primary_key=True)
+    total_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    push_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pull_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    quads_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    hams_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    full_body_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    upper_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lower_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    custom_workouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_sets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_reps: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_volume: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    first_workout_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_workout_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def workouts_by_type(self) -> dict[str, int]:
+        return {group.value: getattr(self, column) or 0 for group, column in WORKOUT_TYPE_COLUMNS.items()}
+
+    def __repr__(self):
+        return f"UserWorkoutSummary(user_id={self.user_id}, total_workouts={self.total_workouts}, total_sets={self.total_sets})"
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String, Enum as SQLEnum, DateTime
+from sqlalchemy import ForeignKey, String, Enum as SQLEnum, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
@@ -16,7 +16,7 @@ class Workout(Base):
     user_id: Mapped[UUID] = mapped_column(ForeignKey("auth_users.id"))
     created_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     notes: Mapped[Optional[str]] = mapped_column(String(5000), default=None)
-    logged_exercises: Mapped[List[LoggedExercise]] = relationship("LoggedExercise", cascade="all, delete-orphan")
+    logged_exercises: Mapped[List[LoggedExercise]] = relationship("LoggedExercise", cascade="all, delete-orphan", lazy="selectin")
     workout_type: Mapped[ExerciseGroup] = mapped_column(SQLEnum(ExerciseGroup), nullable=True)
 
     user: Mapped[AuthUser] = relationship("AuthUser", backref="workouts")
@@ -30,4 +30,10 @@ class Workout(Base):
             "user_id": self.user_id,
             "created_time": self.created_time,
             "logged_exercises": [le.to_dict() for le in self.logged_exercises]
-        }
\ No newline at end of file
+        }
+
+# Hot paths: a user's history newest-first (with id as the keyset tiebreaker)
+# and the latest workout of a given type. Both lead with user_id, which also
+# covers the workouts.user_id foreign key.
+Index("ix_workouts_user_id_created_time", Workout.user_id, Workout.created_time.desc(), Workout.id.desc())
+Index("ix_workouts_user_id_type_created_time", Workout.user_id, Workout.workout_type, Workout.created_time.desc())
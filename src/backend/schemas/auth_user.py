@@ -30,6 +30,13 @@ class AuthUserOut(AuthUserBase):
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class AuthUserWithToken(AuthUserOut):
+    token: Token
 
 
 class TokenData(BaseModel):
@@ -1,7 +1,9 @@
 from pydantic import BaseModel
 from uuid import UUID
+from datetime import date, datetime
 from typing import Optional, List
 from src.backend.models.enums import ExerciseGroup
+from src.backend.schemas.logged_exercise_set import LoggedExerciseSetBase
 
 class ExerciseBase(BaseModel):
     name: str
@@ -45,4 +47,17 @@ class ExerciseSummaryOut(BaseModel):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class ExerciseHistoryPoint(BaseModel):
+    period_start: date
+    set_count: int
+    rep_count: int
+    volume: float
+    top_weight: float
+
+class LastPerformanceOut(BaseModel):
+    exercise_id: UUID
+    workout_id: UUID
+    performed_at: datetime
+    sets: List[LoggedExerciseSetBase]
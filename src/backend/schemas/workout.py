@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from src.backend.schemas.logged_exercise import LoggedExerciseCreateByName, LoggedExerciseOut  
 from src.backend.models.enums import ExerciseGroup
 
@@ -38,4 +38,23 @@ class WorkoutOut(WorkoutBase):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class PersonalRecordHit(BaseModel):
+    set_id: UUID
+    exercise_id: UUID
+    records: List[str]
+
+class WorkoutCreatedOut(WorkoutOut):
+    # Sets in this workout that beat the user's previous records
+    personal_records: List[PersonalRecordHit] = []
+
+class WorkoutStats(BaseModel):
+    total_workouts: int
+    workouts_by_type: Dict[str, int]
+    avg_sets_per_workout: float
+    avg_reps_per_set: float
+    total_volume: float = 0.0
+    first_workout_time: Optional[datetime] = None
+    last_workout_time: Optional[datetime] = None
+    most_common_exercises: List[str]
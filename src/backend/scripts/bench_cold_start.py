@@ -0,0 +1,76 @@
+"""Cold start to first response: spawn uvicorn and time until GET /api answers.
+
+    python -m src.backend.scripts.bench_cold_start [--runs 5]
+
+Each run starts a fresh `uvicorn src.backend.main:app` on a free port and
+polls /api until it returns 200. It reports the median import time of
+src.backend.main and the median spawn-to-first-200 time. The database is
+the in-memory SQLite test database unless DATABASE_URL/TESTING are set.
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _import_seconds(env: dict) -> float:
+    probe = "import time; s = time.perf_counter(); import src.backend.main; print(time.perf_counter() - s)"
+    result = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _first_response_seconds(env: dict, timeout: float) -> float:
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.backend.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"no response from uvicorn within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(runs: int, timeout: float):
+    env = dict(os.environ)
+    if "DATABASE_URL" not in env:
+        env.setdefault("TESTING", "1")
+
+    imports = [_import_seconds(env) for _ in range(runs)]
+    first = [_first_response_seconds(env, timeout) for _ in range(runs)]
+    print(f"{'phase':<22} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for label, samples in (("import main", imports), ("spawn -> first 200", first)):
+        print(
+            f"{label:<22} {statistics.median(samples) * 1000:>10.0f}"
+            f" {min(samples) * 1000:>8.0f} {max(samples) * 1000:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    main(args.runs, args.timeout)
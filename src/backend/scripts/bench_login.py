@@ -0,0 +1,43 @@
+"""Password-verification throughput of the login path versus worker count.
+
+    python -m src.backend.scripts.bench_login [--requests 64]
+
+Each row fires `--requests` concurrent verifications through a
+PasswordHashPool with that many worker processes and reports logins/s.
+The "inline" row is the old behaviour: bcrypt on the event loop thread.
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from src.backend.auth.passwords import PasswordHashPool, get_password_hash, verify_password
+
+
+async def _burst(pool: PasswordHashPool, hashed: str, requests: int) -> float:
+    start = time.perf_counter()
+    results = await asyncio.gather(*(pool.run(verify_password, "password", hashed) for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return requests / elapsed
+
+
+async def main(requests: int):
+    hashed = get_password_hash("password")
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+
+    print(f"{'workers':>8} {'logins/s':>10}")
+    inline = PasswordHashPool(workers=0, max_pending=requests)
+    print(f"{'inline':>8} {await _burst(inline, hashed, requests):>10.1f}")
+    for workers in worker_counts:
+        pool = PasswordHashPool(workers=workers, max_pending=requests)
+        await _burst(pool, hashed, workers)  # start the worker processes
+        print(f"{workers:>8} {await _burst(pool, hashed, requests):>10.1f}")
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=64)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,104 @@
+"""Serialization cost of a 1,000-workout history, per response path.
+
+    python -m src.backend.scripts.bench_serialization [--workouts 1000] [--repeat 5]
+
+No database involved: the same history is built once as ORM objects and
+once as the plain dicts the row-tuple read path produces, then timed through
+
+  * jsonable_encoder + stdlib json   (FastAPI's classic response_model path)
+  * TypeAdapter validate + dump_json (FastAPI's current path, prebuilt adapter)
+  * orjson on row dicts              (crud.workout.get_workout_payloads_page)
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from typing import List
+from uuid import uuid4
+
+import orjson
+
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise import Exercise
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout import Workout
+from src.backend.schemas.workout import WorkoutOut
+
+EXERCISES_PER_WORKOUT = 5
+SETS_PER_EXERCISE = 4
+
+
+def build_history(count: int):
+    user_id = uuid4()
+    exercises = [
+        Exercise(id=uuid4(), name=f"Lift {i}", category=ExerciseGroup.PUSH, primary_muscles=["m"])
+        for i in range(EXERCISES_PER_WORKOUT)
+    ]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    orm, rows = [], []
+    for i in range(count):
+        workout = Workout(
+            id=uuid4(), user_id=user_id, created_time=start + timedelta(days=i),
+            notes="session", workout_type=ExerciseGroup.PUSH, logged_exercises=[],
+        )
+        payload = {
+            "id": workout.id, "user_id": user_id, "created_time": workout.created_time,
+            "notes": workout.notes, "workout_type": workout.workout_type, "logged_exercises": [],
+        }
+        for exercise in exercises:
+            logged = LoggedExercise(id=uuid4(), workout_id=workout.id, exercise=exercise, sets=[])
+            logged_payload = {
+                "id": logged.id, "workout_id": workout.id,
+                "exercise": {"id": exercise.id, "name": exercise.name, "category": exercise.category},
+                "sets": [],
+            }
+            for n in range(1, SETS_PER_EXERCISE + 1):
+                s = LoggedExerciseSet(id=uuid4(), logged_exercise_id=logged.id, set_number=n, reps=8, weight=100.0)
+                logged.sets.append(s)
+                logged_payload["sets"].append({
+                    "id": s.id, "logged_exercise_id": logged.id, "set_number": n, "reps": 8, "weight": 100.0,
+                })
+            workout.logged_exercises.append(logged)
+            payload["logged_exercises"].append(logged_payload)
+        orm.append(workout)
+        rows.append(payload)
+    return orm, rows
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(workouts: int, repeat: int):
+    orm, rows = build_history(workouts)
+    adapter = TypeAdapter(List[WorkoutOut])
+
+    def classic():
+        models = adapter.validate_python(orm, from_attributes=True)
+        return json.dumps(jsonable_encoder(models)).encode()
+
+    def pydantic_json():
+        return adapter.dump_json(adapter.validate_python(orm, from_attributes=True))
+
+    def orjson_rows():
+        return orjson.dumps(rows, option=orjson.OPT_NON_STR_KEYS)
+
+    print(f"{workouts} workouts x {EXERCISES_PER_WORKOUT} exercises x {SETS_PER_EXERCISE} sets, best of {repeat}")
+    for label, fn in (("jsonable_encoder+json", classic), ("TypeAdapter.dump_json", pydantic_json), ("orjson row dicts", orjson_rows)):
+        print(f"{label:>24} {_best_of(repeat, fn) * 1000:8.1f} ms  {len(fn()) / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workouts", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.workouts, args.repeat)
@@ -0,0 +1,125 @@
+"""Dashboard stats for a heavy user: ORM walk versus the aggregate queries.
+
+    python -m src.backend.scripts.bench_stats [--workouts 5000] [--repeat 5] [--url sqlite+aiosqlite:///stats.db]
+
+Seeds one user with `--workouts` workouts (5 exercises x 4 sets each) into
+a throwaway SQLite file (or `--url`, which must point at an empty
+database), then times
+
+  * ORM walk   - load every workout graph and count in Python (the only way
+                 to get these numbers before crud.workout.get_workout_stats)
+  * aggregate  - crud.workout.get_workout_stats (two GROUP BY queries)
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.backend.models  # noqa: F401  (registers every table on Base.metadata)
+from src.backend.crud.workout import get_all_workouts_by_name, get_workout_stats
+from src.backend.database.engine import create_async_db_engine
+from src.backend.models.auth_user import AuthUser
+from src.backend.models.base import Base
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise import Exercise
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout import Workout
+
+USERNAME = "heavy_lifter"
+EXERCISES_PER_WORKOUT = 5
+SETS_PER_EXERCISE = 4
+_TYPES = list(ExerciseGroup)
+
+
+async def seed(session: AsyncSession, workouts: int) -> None:
+    user_id = uuid4()
+    await session.execute(insert(AuthUser).values(
+        id=user_id, username=USERNAME, email=f"{USERNAME}@example.com", hashed_password="x",
+    ))
+    exercise_ids = [uuid4() for _ in range(EXERCISES_PER_WORKOUT * 2)]
+    await session.execute(insert(Exercise), [
+        {"id": exercise_id, "name": f"Lift {i}", "category": ExerciseGroup.PUSH, "primary_muscles": ["m"]}
+        for i, exercise_id in enumerate(exercise_ids)
+    ])
+
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    workout_rows, logged_rows, set_rows = [], [], []
+    for i in range(workouts):
+        workout_id = uuid4()
+        workout_rows.append({
+            "id": workout_id, "user_id": user_id, "created_time": start + timedelta(hours=12 * i),
+            "workout_type": _TYPES[i % len(_TYPES)],
+        })
+        for j in range(EXERCISES_PER_WORKOUT):
+            logged_id = uuid4()
+            logged_rows.append({
+                "id": logged_id, "workout_id": workout_id,
+                "exercise_id": exercise_ids[(i + j) % len(exercise_ids)],
+            })
+            set_rows.extend(
+                {"id": uuid4(), "logged_exercise_id": logged_id, "set_number": n, "reps": 5 + n, "weight": 100.0}
+                for n in range(1, SETS_PER_EXERCISE + 1)
+            )
+    for model, rows in ((Workout, workout_rows), (LoggedExercise, logged_rows), (LoggedExerciseSet, set_rows)):
+        for offset in range(0, len(rows), 5000):
+            await session.execute(insert(model), rows[offset:offset + 5000])
+    await session.commit()
+
+
+async def orm_walk(session: AsyncSession) -> dict:
+    workouts = await get_all_workouts_by_name(USERNAME, session)
+    sets = [s for w in workouts for le in w.logged_exercises for s in le.sets]
+    exercises = Counter(le.exercise.name for w in workouts for le in w.logged_exercises)
+    return {
+        "total_workouts": len(workouts),
+        "workouts_by_type": Counter(w.workout_type.value for w in workouts if w.workout_type),
+        "avg_sets_per_workout": len(sets) / len(workouts),
+        "avg_reps_per_set": sum(s.reps for s in sets) / len(sets),
+        "most_common_exercises": [name for name, _ in exercises.most_common(5)],
+    }
+
+
+async def _best_of(factory: async_sessionmaker, repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        async with factory() as session:  # fresh session: no identity-map reuse between runs
+            start = time.perf_counter()
+            await fn(session)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main(workouts: int, repeat: int, url: str):
+    engine = create_async_db_engine(url)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with factory() as session:
+        await seed(session, workouts)
+
+    async def aggregate(session):
+        return await get_workout_stats(USERNAME, session)
+
+    print(f"{workouts} workouts x {EXERCISES_PER_WORKOUT} exercises x {SETS_PER_EXERCISE} sets, best of {repeat}")
+    for label, fn in (("ORM walk", orm_walk), ("aggregate", aggregate)):
+        print(f"{label:>12} {await _best_of(factory, repeat, fn) * 1000:9.1f} ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workouts", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'stats.db')}"
+        asyncio.run(main(args.workouts, args.repeat, url))
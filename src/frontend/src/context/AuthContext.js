@@ -1,10 +1,10 @@
-import React, { createContext, useContext, useEffect, useState } from "react";
+import React, { createContext, useContext, useEffect, useRef, useState } from "react";
 import axiosInstance from "../api/axios";
 
 const AuthContext = createContext({
     token: "",
     user: null,
-    login: (token, user) => {},
+    login: (token, user, refreshToken) => {},
     logout: () => {}
 });
 
@@ -15,28 +15,80 @@ export const AuthProvider = ({ children }) => {
         return u ? JSON.parse(u) : null;
     });
 
-    const login = (newToken, newUser) => {
+    const refreshToken = useRef(sessionStorage.getItem("refreshToken") || "");
+    // The refresh in flight, shared by every request that hit a 401 meanwhile:
+    // refresh tokens are single-use, so a second refresh would revoke the session.
+    const pendingRefresh = useRef(null);
+
+    const storeTokens = (newToken, newRefreshToken) => {
         sessionStorage.setItem("token", newToken);
-        sessionStorage.setItem("user", JSON.stringify(newUser));
+        if (newRefreshToken) {
+            sessionStorage.setItem("refreshToken", newRefreshToken);
+            refreshToken.current = newRefreshToken;
+        }
         setToken(newToken);
+    };
+
+    const login = (newToken, newUser, newRefreshToken) => {
+        sessionStorage.setItem("user", JSON.stringify(newUser));
+        storeTokens(newToken, newRefreshToken);
         setUser(newUser);
     };
 
     const logout = () => {
         sessionStorage.removeItem("token");
+        sessionStorage.removeItem("refreshToken");
         sessionStorage.removeItem("user");
+        refreshToken.current = "";
         setToken("");
         setUser(null);
     };
 
     useEffect(() => {
         const interceptor = axiosInstance.interceptors.request.use((config) => {
-            if (token) config.headers.Authorization = `Bearer ${token}`;
+            // Read storage rather than state so a retry right after a refresh sends the new token.
+            const current = sessionStorage.getItem("token");
+            if (current) config.headers.Authorization = `Bearer ${current}`;
             return config;
         });
         return () => axiosInstance.interceptors.request.eject(interceptor);
     }, [token]);
 
+    const refreshOnce = () => {
+        if (!pendingRefresh.current) {
+            pendingRefresh.current = axiosInstance
+                .post("/users/token/refresh", { refresh_token: refreshToken.current })
+                .then((res) => storeTokens(res.data.access_token, res.data.refresh_token))
+                .finally(() => {
+                    pendingRefresh.current = null;
+                });
+        }
+        return pendingRefresh.current;
+    };
+
+    // On an expired access token, trade the refresh token for a new pair and retry once.
+    useEffect(() => {
+        const interceptor = axiosInstance.interceptors.response.use(
+            (response) => response,
+            async (error) => {
+                const original = error.config;
+                const isRefreshCall = original?.url?.includes("/users/token");
+                if (error.response?.status !== 401 || !refreshToken.current || original._retried || isRefreshCall) {
+                    return Promise.reject(error);
+                }
+                original._retried = true;
+                try {
+                    await refreshOnce();
+                    return axiosInstance(original);
+                } catch (refreshError) {
+                    logout();
+                    return Promise.reject(refreshError);
+                }
+            }
+        );
+        return () => axiosInstance.interceptors.response.eject(interceptor);
+    }, []);
+
     return (
         <AuthContext.Provider value={{ token, user, login, logout }}>
             {children}
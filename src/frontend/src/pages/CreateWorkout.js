@@ -15,6 +15,11 @@ const createDefaultExercise = () => ({
     sets: [createDefaultSet()],
 });
 
+const isUntouched = (sets) =>
+    sets.length === 1 && sets[0].reps === createDefaultSet().reps && sets[0].weight === createDefaultSet().weight;
+
+const describeSets = (sets) => sets.map((s) => `${s.reps} × ${s.weight}`).join(", ");
+
 function formatToDatetimeLocal(isoString) {
     const date = new Date(isoString);
     const tzOffset = date.getTimezoneOffset() * 60000;
@@ -30,6 +35,7 @@ export default function CreateWorkout() {
     const [loggedExercises, setLoggedExercises] = useState([createDefaultExercise()]);
     const [groupedExercises, setGroupedExercises] = useState({});
     const [categories, setCategories] = useState([]);
+    const [lastPerformance, setLastPerformance] = useState({});
     const [toast, setToast] = useState({ show: false, message: "", variant: "info" });
     const [createdTime, setCreatedTime] = useState(() => {
         const now = new Date();
@@ -65,10 +71,39 @@ export default function CreateWorkout() {
         setTimeout(() => setToast({ show: false, message: "", variant: "info" }), 4000);
     };
 
+    const findExerciseId = (name) => {
+        for (const exerciseList of Object.values(groupedExercises || {})) {
+            const match = Array.isArray(exerciseList) && exerciseList.find((exercise) => exercise.name === name);
+            if (match) return match.id;
+        }
+        return null;
+    };
+
+    // Prefill an untouched exercise with the sets from the user's last session of it
+    const prefillFromLastPerformance = async (index, name) => {
+        const exerciseId = findExerciseId(name);
+        if (!exerciseId) return;
+        try {
+            const res = await axiosInstance.get("/exercises/last-performance", { params: { ids: exerciseId } });
+            const performance = Array.isArray(res.data) ? res.data[0] : null;
+            if (!performance) return;
+            setLastPerformance((prev) => ({ ...prev, [name]: performance }));
+            setLoggedExercises((prev) => {
+                if (!prev[index] || prev[index].exercise_name !== name || !isUntouched(prev[index].sets)) return prev;
+                const updated = [...prev];
+                updated[index] = { ...updated[index], sets: performance.sets.map((s) => ({ ...s })) };
+                return updated;
+            });
+        } catch (err) {
+            console.error("Error fetching last performance:", err);
+        }
+    };
+
     const handleExerciseChange = (index, field, value) => {
         const updated = [...loggedExercises];
         updated[index][field] = value;
         setLoggedExercises(updated);
+        if (field === "exercise_name" && value) prefillFromLastPerformance(index, value);
     };
 
     const handleSetChange = (exIndex, setIndex, field, value) => {
@@ -194,6 +229,12 @@ export default function CreateWorkout() {
                                             </optgroup>
                                         ))}
                                 </select>
+                                {lastPerformance[ex.exercise_name] && (
+                                    <div className="form-text">
+                                        Last time ({new Date(lastPerformance[ex.exercise_name].performed_at).toLocaleDateString()}):{" "}
+                                        {describeSets(lastPerformance[ex.exercise_name].sets)}
+                                    </div>
+                                )}
                             </div>
 
                             <div className="mb-2">
@@ -1,30 +1,37 @@
 import React, { useEffect, useState } from "react";
 import { Bar } from "react-chartjs-2";
 import { Chart as ChartJS, BarElement, CategoryScale, LinearScale, Tooltip, Legend } from "chart.js";
+import { useAuth } from "../context/AuthContext";
+import axiosInstance from "../api/axios";
 
 ChartJS.register(BarElement, CategoryScale, LinearScale, Tooltip, Legend);
 
 export default function Dashboard() {
+    const { user } = useAuth();
+    const username = user?.username;
+
     const [stats, setStats] = useState(null);
+    const [message, setMessage] = useState("");
 
     useEffect(() => {
-        const dummyStats = {
-            total_workouts: 18,
-            workouts_by_type: {
-                Push: 5,
-                Pull: 4,
-                Quads: 3,
-                Hams: 2,
-                "Full Body": 2,
-                Custom: 2
-            },
-            avg_sets_per_workout: 7.6,
-            avg_reps_per_set: 10.1,
-            most_common_exercises: ["Squat", "Deadlift", "Dips", "Incline DB Bench", "Lat Pulldown"]
-        };
+        if (!username) {
+            setMessage("You must be logged in to see your dashboard");
+            return;
+        }
+        axiosInstance.get(`/workouts/user/${username}/stats`)
+            .then(res => {
+                setStats(res.data);
+                setMessage("");
+            })
+            .catch(err => {
+                console.error(err);
+                setMessage("Failed to load your stats");
+            });
+    }, [username]);
 
-        setStats(dummyStats);
-    }, []);
+    if (message) {
+        return <div className="text-muted mt-5">{message}</div>;
+    }
 
     if (!stats) {
         return <div className="text-muted mt-5">Loading dashboard...</div>;
@@ -57,7 +64,7 @@ export default function Dashboard() {
 
     return (
         <div className="container mt-5 mb-5">
-            <h2 className="mb-4">📊 (Dummy) Workout Dashboard</h2>
+            <h2 className="mb-4">📊 Workout Dashboard</h2>
 
             {/* Stat Cards */}
             <div className="row mb-4">
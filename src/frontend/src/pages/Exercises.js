@@ -25,8 +25,17 @@ export default function Exercises() {
 
     const fetchAll = async () => {
         try {
-            const res = await axiosInstance.get("/exercises/");
-            setExercises(res.data);
+            // The catalog is small; walk every page so the table stays complete.
+            let all = [];
+            let cursor = null;
+            do {
+                const res = await axiosInstance.get("/exercises/", {
+                    params: { limit: 200, ...(cursor ? { cursor } : {}) },
+                });
+                all = all.concat(res.data.items || []);
+                cursor = res.data.next_cursor;
+            } while (cursor);
+            setExercises(all);
         } catch (err) {
             console.error("Failed to fetch exercises", err);
         }
@@ -18,8 +18,7 @@ export default function Login() {
                 qs.stringify({ username, password }),
                 { headers: { "Content-Type": "application/x-www-form-urlencoded" } }
             );
-            const token = res.data.access_token;
-            login(token, { username });
+            login(res.data.access_token, { username }, res.data.refresh_token);
             navigate("/");
         } catch (err) {
             console.error("Login failed", err);
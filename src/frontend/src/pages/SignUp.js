@@ -2,7 +2,6 @@ import React, { useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import { useAuth } from "../context/AuthContext";
 import axiosInstance from "../api/axios";
-import qs from "qs";
 
 export default function SignUp() {
     const [username, setUsername] = useState("");
@@ -18,20 +17,18 @@ export default function SignUp() {
         setError("");
 
         try {
-            await axiosInstance.post("/users/", {
-                username,
-                email,
-                password,
-                full_name: fullName || undefined,
-            });
-
             const res = await axiosInstance.post(
-                "/users/token",
-                qs.stringify({ username, password }),
-                { headers: { "Content-Type": "application/x-www-form-urlencoded" } }
+                "/users/",
+                {
+                    username,
+                    email,
+                    password,
+                    full_name: fullName || undefined,
+                },
+                { params: { issue_token: true } }
             );
-            const token = res.data.access_token;
-            login(token, { username });
+            const { access_token, refresh_token } = res.data.token;
+            login(access_token, { username }, refresh_token);
 
             navigate("/");
         } catch (err) {
@@ -20,6 +20,7 @@ function formatToDatetimeLocal(isoString) {
 export default function UpdateWorkout() {
     const { user } = useAuth();
     const [workouts, setWorkouts] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [selectedWorkout, setSelectedWorkout] = useState(null);
     const [notes, setNotes] = useState("");
     const [createdTime, setCreatedTime] = useState(null);
@@ -49,12 +50,17 @@ export default function UpdateWorkout() {
         setTimeout(() => setToast({ show: false, message: "", variant: "info" }), 4000);
     };
 
-    const fetchWorkoutsByUser = async () => {
+    const fetchWorkoutsByUser = async (cursor = null) => {
         try {
-            const res = await axiosInstance.get(`/workouts/user/${user.username}`);
-            setWorkouts(Array.isArray(res.data) ? res.data : []);
+            const res = await axiosInstance.get(`/workouts/user/${user.username}`, {
+                params: cursor ? { cursor } : {},
+            });
+            const items = Array.isArray(res.data?.items) ? res.data.items : [];
+            setWorkouts((prev) => (cursor ? [...prev, ...items] : items));
+            setNextCursor(res.data?.next_cursor || null);
         } catch {
-            setWorkouts([]);
+            if (!cursor) setWorkouts([]);
+            setNextCursor(null);
             showToast("Failed to fetch workouts", "danger");
         }
     };
@@ -179,6 +185,14 @@ export default function UpdateWorkout() {
                         </option>
                     ))}
                 </select>
+                {nextCursor && (
+                    <button
+                        className="btn btn-link btn-sm px-0"
+                        onClick={() => fetchWorkoutsByUser(nextCursor)}
+                    >
+                        Load older workouts
+                    </button>
+                )}
             </div>
 
             {selectedWorkout && (
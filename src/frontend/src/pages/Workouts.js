@@ -12,26 +12,32 @@ export default function Workouts() {
 
     const [type, setType] = useState("Push");
     const [allWorkouts, setAllWorkouts] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [singleWorkout, setSingleWorkout] = useState(null);
     const [message, setMessage] = useState("");
     const [tabKey, setTabKey] = useState("all");
 
     const [expandedWorkouts, setExpandedWorkouts] = useState({});
 
-    const fetchAllByUser = async () => {
+    const fetchAllByUser = async (cursor = null) => {
         if (!username) return setMessage("You must be logged in to see workouts");
         try {
-            const res = await axiosInstance.get(`/workouts/user/${username}`);
-            const data = res.data;
-            setAllWorkouts(Array.isArray(data) ? data : []);
+            const res = await axiosInstance.get(`/workouts/user/${username}`, {
+                params: cursor ? { cursor } : {},
+            });
+            const items = Array.isArray(res.data?.items) ? res.data.items : [];
+            const workouts = cursor ? [...allWorkouts, ...items] : items;
+            setAllWorkouts(workouts);
+            setNextCursor(res.data?.next_cursor || null);
             setSingleWorkout(null);
-            setMessage(!Array.isArray(data) || data.length === 0
+            setMessage(workouts.length === 0
                 ? "No workouts found for you"
                 : ""
             );
         } catch (err) {
             console.error(err);
-            setAllWorkouts([]);
+            if (!cursor) setAllWorkouts([]);
+            setNextCursor(null);
             setMessage("Failed to fetch your workouts");
         }
     };
@@ -42,6 +48,7 @@ export default function Workouts() {
             const res = await axiosInstance.get(`/workouts/user/${username}/latest`);
             setSingleWorkout(res.data || null);
             setAllWorkouts([]);
+            setNextCursor(null);
             setMessage(!res.data ? "No latest workout found" : "");
         } catch (err) {
             console.error(err);
@@ -58,6 +65,7 @@ export default function Workouts() {
             );
             setSingleWorkout(res.data || null);
             setAllWorkouts([]);
+            setNextCursor(null);
             setMessage(!res.data
                 ? `No ${type} workout found`
                 : ""
@@ -102,7 +110,7 @@ export default function Workouts() {
                 <div className="btn-group me-2" role="group">
                     <button
                         className="btn btn-outline-primary"
-                        onClick={fetchAllByUser}
+                        onClick={() => fetchAllByUser()}
                         disabled={!username}
                     >
                         All Workouts
@@ -196,6 +204,17 @@ export default function Workouts() {
                 </div>
             ))}
 
+            {allWorkouts.length > 0 && nextCursor && (
+                <div className="text-center mb-4">
+                    <button
+                        className="btn btn-outline-primary"
+                        onClick={() => fetchAllByUser(nextCursor)}
+                    >
+                        Load More
+                    </button>
+                </div>
+            )}
+
             {singleWorkout && (
                 <div className="card p-3 mb-4">
                     <h5>Workout Details</h5>
@@ -0,0 +1,111 @@
+import gzip
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.backend.api.caching import etag_matches, etag_response
+from src.backend.api.compression import CompressionMiddleware, negotiate_encoding
+
+BIG = "workout " * 500
+
+@pytest.fixture
+def compressed_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse(BIG, headers={"ETag": '"abc"'})
+
+    @app.get("/cached")
+    def cached(request: Request):
+        return etag_response(request, BIG.encode(), '"v1"')
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((BIG for _ in range(3)), media_type="text/plain")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(BIG.encode()), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_respects_q_values_and_server_order():
+    supported = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip, br", supported) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", supported) == "gzip"
+    assert negotiate_encoding("*", supported) == "zstd"
+    assert negotiate_encoding("gzip;q=0", supported) is None
+    assert negotiate_encoding("identity", supported) is None
+    assert negotiate_encoding("", supported) is None
+
+
+def test_large_response_is_gzipped(compressed_client):
+    response = compressed_client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) < len(BIG) / 10
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert response.text == BIG
+
+
+def test_revalidation_returns_the_etag_in_the_form_the_client_stored(compressed_client):
+    first = compressed_client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["ETag"] == 'W/"v1"'
+
+    revalidated = compressed_client.get("/cached", headers={"Accept-Encoding": "gzip", "If-None-Match": 'W/"v1"'})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == 'W/"v1"'
+
+    identity = compressed_client.get("/cached", headers={"Accept-Encoding": "identity", "If-None-Match": '"v1"'})
+    assert identity.status_code == 304
+    assert identity.headers["ETag"] == '"v1"'
+
+
+def test_etag_matches_compares_weakly():
+    assert etag_matches('"v1"', 'W/"v1"')
+    assert etag_matches('W/"v1"', '"v1"')
+    assert etag_matches('W/"v1"', '"v0", W/"v1"')
+    assert etag_matches('"v1"', "*")
+    assert not etag_matches('"v1"', '"v2"')
+
+
+def test_small_and_unaccepted_responses_are_not_compressed(compressed_client):
+    assert "Content-Encoding" not in compressed_client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "Content-Encoding" not in compressed_client.get("/big", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streaming_response_is_compressed_incrementally(compressed_client):
+    response = compressed_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.text == BIG * 3
+
+
+def test_already_compressed_bodies_are_skipped(compressed_client):
+    encoded = compressed_client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+    assert encoded.headers["Content-Encoding"] == "gzip"
+    assert encoded.text == BIG  # decoded exactly once
+
+    image = compressed_client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in image.headers
+
+
+@pytest.mark.parametrize("coding, module", [("br", "brotli"), ("zstd", "zstandard")])
+def test_optional_encodings(compressed_client, coding, module):
+    pytest.importorskip(module)
+    response = compressed_client.get("/big", headers={"Accept-Encoding": coding})
+    assert response.headers["Content-Encoding"] == coding
+    assert response.text == BIG
+
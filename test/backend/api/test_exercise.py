@@ -1,5 +1,6 @@
 import pytest
 from uuid import UUID, uuid4
+from sqlalchemy import text
 
 def test_create_exercise(client, override_current_user):
     response = client.post("/api/exercises/", json={
@@ -16,6 +17,19 @@ def test_create_exercise(client, override_current_user):
     assert isinstance(UUID(data["id"]), UUID)
 
 
+
+def test_create_exercise_name_freed_by_another_worker(client, override_current_user, test_engine_and_path):
+    payload = {"name": "Freed", "primary_muscles": ["m"], "category": "Custom"}
+    assert client.post("/api/exercises/", json=payload).status_code == 200
+    assert client.post("/api/exercises/", json=payload).status_code == 409  # also loads the catalog index
+
+    # Deleted elsewhere; this worker's index still lists the name.
+    engine, _ = test_engine_and_path
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM exercises WHERE name = 'Freed'"))
+
+    assert client.post("/api/exercises/", json=payload).status_code == 200
+
 def test_create_exercise_minimal_fields(client, override_current_user):
     response = client.post("/api/exercises/", json={
         "name": "Lunge",
@@ -63,7 +77,7 @@ def test_get_all_exercises(client, override_current_user):
 
     response = client.get("/api/exercises/")
     assert response.status_code == 200
-    exercises = response.json()
+    exercises = response.json()["items"]
     names = [e["name"] for e in exercises]
     assert "Deadlift" in names and "Overhead Press" in names
 
@@ -131,4 +145,93 @@ def test_create_batch_exercises(client, override_current_user):
     assert isinstance(data, list)
     assert len(data) == 2
     names = [e["name"] for e in data]
-    assert "Pushup_Batch1" in names and "Plank_Batch1" in names
\ No newline at end of file
+    assert "Pushup_Batch1" in names and "Plank_Batch1" in names
+
+def test_get_all_exercises_paginates_by_name(client, override_current_user):
+    for name in ["Curl", "Ab Wheel", "Bench", "Dip"]:
+        client.post("/api/exercises/", json={"name": name, "primary_muscles": ["x"], "category": "Custom"})
+
+    first = client.get("/api/exercises/", params={"limit": 3}).json()
+    assert [e["name"] for e in first["items"]] == ["Ab Wheel", "Bench", "Curl"]
+
+    second = client.get("/api/exercises/", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    assert [e["name"] for e in second["items"]] == ["Dip"]
+    assert second["next_cursor"] is None
+
+
+def test_get_exercises_filtered_by_name(client, override_current_user):
+    client.post("/api/exercises/", json={"name": "Goblet Squat", "primary_muscles": ["quads"], "category": "Quads"})
+    client.post("/api/exercises/", json={"name": "Split Squat", "primary_muscles": ["quads"], "category": "Quads"})
+
+    response = client.get("/api/exercises/", params={"name": "goblet squat"})
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()["items"]] == ["Goblet Squat"]
+
+
+@pytest.mark.parametrize("path", ["/api/exercises/", "/api/exercises/categorized", "/api/exercises/categories"])
+def test_exercise_catalog_revalidates_with_etag(client, override_current_user, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('"')
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+
+def test_exercise_write_changes_catalog_etag(client, override_current_user):
+    etag = client.get("/api/exercises/categorized").headers["ETag"]
+    client.post("/api/exercises/", json={"name": "Cache Buster", "primary_muscles": ["m"], "category": "Custom"})
+
+    response = client.get("/api/exercises/categorized", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [e["name"] for e in response.json()["Custom"]] == ["Cache Buster"]
+
+
+def test_exercise_history_endpoint(client, override_current_user, test_user):
+    exercise_id = client.post("/api/exercises/", json={
+        "name": "History Press", "primary_muscles": ["chest"], "category": "Push"
+    }).json()["id"]
+    for created_time, weight in [("2024-03-04T10:00:00Z", 100.0), ("2024-03-06T10:00:00Z", 105.0), ("2024-03-12T10:00:00Z", 110.0)]:
+        client.post("/api/workouts/", json={
+            "username": test_user.username,
+            "created_time": created_time,
+            "logged_exercises": [{"name": "History Press", "sets": [{"set_number": 1, "reps": 5, "weight": weight}]}],
+        })
+
+    res = client.get(f"/api/exercises/{exercise_id}/history", params={"from": "2024-03-01", "to": "2024-03-31"})
+    assert res.status_code == 200
+    assert [(p["period_start"], p["set_count"], p["top_weight"]) for p in res.json()] == [
+        ("2024-03-04", 2, 105.0), ("2024-03-11", 1, 110.0),
+    ]
+
+    monthly = client.get(f"/api/exercises/{exercise_id}/history", params={"bucket": "month"}).json()
+    assert monthly == [{"period_start": "2024-03-01", "set_count": 3, "rep_count": 15, "volume": 1575.0, "top_weight": 110.0}]
+
+    assert client.get(f"/api/exercises/{exercise_id}/history", params={"bucket": "day"}).status_code == 422
+    assert client.get(f"/api/exercises/{exercise_id}/history", params={"user": "someone_else"}).status_code == 403
+    assert client.get(f"/api/exercises/{uuid4()}/history").status_code == 404
+
+
+def test_last_performance_endpoint(client, override_current_user, test_user):
+    exercise_id = client.post("/api/exercises/", json={
+        "name": "Prefill Row", "primary_muscles": ["back"], "category": "Pull"
+    }).json()["id"]
+    for created_time, reps in [("2024-04-01T10:00:00Z", 8), ("2024-04-08T10:00:00Z", 10)]:
+        client.post("/api/workouts/", json={
+            "username": test_user.username,
+            "created_time": created_time,
+            "logged_exercises": [{"name": "Prefill Row", "sets": [{"set_number": 1, "reps": reps, "weight": 60.0}]}],
+        })
+
+    res = client.get("/api/exercises/last-performance", params={"ids": f"{exercise_id}, {uuid4()}"})
+    assert res.status_code == 200
+    (performance,) = res.json()
+    assert performance["exercise_id"] == exercise_id
+    assert performance["performed_at"].startswith("2024-04-08")
+    assert performance["sets"] == [{"set_number": 1, "reps": 10, "weight": 60.0}]
+
+    assert client.get("/api/exercises/last-performance", params={"ids": "nope"}).status_code == 422
@@ -6,7 +6,7 @@ def test_log_new_exercise(client, setup_logged_workout_api):
     workout_id = setup["workout_id"]
     ex_resp = client.get("/api/exercises/")
     assert ex_resp.status_code == 200
-    exercise_id = ex_resp.json()[0]["id"]
+    exercise_id = ex_resp.json()["items"][0]["id"]
     log_resp = client.post(f"/api/logged_exercises/{workout_id}/log", json={
         "exercise_id": exercise_id,
         "sets": [
@@ -31,7 +31,7 @@ def test_get_all_users(client, create_user_api):
     create_user_api(username=f"userb_{suffix2}", email=f"b_{suffix2}@example.com", password="b123")
     response = client.get("/api/users/all/")
     assert response.status_code == 200
-    usernames = [u["username"] for u in response.json()]
+    usernames = [u["username"] for u in response.json()["items"]]
     assert any(u.startswith("usera_") for u in usernames)
     assert any(u.startswith("userb_") for u in usernames)
 
@@ -79,4 +79,90 @@ def test_get_all_users_authenticated(client, auth_headers, create_user_api):
     headers = auth_headers(username=username, password=password)
     response = client.get("/api/users/all/auth/", headers=headers)
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
\ No newline at end of file
+    assert isinstance(response.json()["items"], list)
+
+def test_deleted_user_token_is_rejected(client, auth_headers, create_user_api):
+    suffix = str(uuid4())[:8]
+    username = f"revoked_{suffix}"
+    user = create_user_api(username=username, email=f"{username}@example.com", password="pw")
+    headers = auth_headers(username=username, password="pw")
+    assert client.get("/api/users/all/auth/", headers=headers).status_code == 200
+
+    assert client.delete(f"/api/users/{user['id']}").status_code == 200
+    response = client.get("/api/users/all/auth/", headers=headers)
+    assert response.status_code == 401
+
+def test_login_returns_503_when_hash_pool_saturated(client, create_user_api, monkeypatch):
+    from src.backend.auth.passwords import password_pool
+
+    username = f"busy_{str(uuid4())[:8]}"
+    create_user_api(username=username, email=f"{username}@example.com", password="pw")
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+    response = client.post("/api/users/token", data={"username": username, "password": "pw"})
+    assert response.status_code == 503
+
+def test_create_user_with_issue_token(client):
+    suffix = str(uuid4())[:8]
+    username = f"signup_{suffix}"
+    response = client.post(
+        "/api/users/?issue_token=true",
+        json={"username": username, "email": f"{username}@example.com", "password": "pw"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["username"] == username
+    assert data["token"]["token_type"] == "bearer"
+
+    headers = {"Authorization": f"Bearer {data['token']['access_token']}"}
+    assert client.get("/api/users/all/auth/", headers=headers).status_code == 200
+
+def test_create_user_without_issue_token_has_no_token(client, create_user_api):
+    suffix = str(uuid4())[:8]
+    data = create_user_api(username=f"plain_{suffix}", email=f"plain_{suffix}@example.com")
+    assert "token" not in data
+
+def _login(client, username, password):
+    response = client.post("/api/users/token", data={"username": username, "password": password})
+    assert response.status_code == 200
+    return response.json()
+
+def test_refresh_token_rotates(client, create_user_api):
+    username = f"refresh_{str(uuid4())[:8]}"
+    create_user_api(username=username, email=f"{username}@example.com", password="pw")
+    first = _login(client, username, "pw")
+    assert first["refresh_token"]
+
+    response = client.post("/api/users/token/refresh", json={"refresh_token": first["refresh_token"]})
+    assert response.status_code == 200
+    second = response.json()
+    assert second["refresh_token"] != first["refresh_token"]
+    headers = {"Authorization": f"Bearer {second['access_token']}"}
+    assert client.get("/api/users/all/auth/", headers=headers).status_code == 200
+
+    # The replacement keeps working until it is used in turn.
+    third = client.post("/api/users/token/refresh", json={"refresh_token": second["refresh_token"]})
+    assert third.status_code == 200
+
+def test_reused_refresh_token_revokes_the_family(client, create_user_api):
+    username = f"reuse_{str(uuid4())[:8]}"
+    create_user_api(username=username, email=f"{username}@example.com", password="pw")
+    first = _login(client, username, "pw")
+    second = client.post("/api/users/token/refresh", json={"refresh_token": first["refresh_token"]}).json()
+
+    replay = client.post("/api/users/token/refresh", json={"refresh_token": first["refresh_token"]})
+    assert replay.status_code == 401
+    stolen = client.post("/api/users/token/refresh", json={"refresh_token": second["refresh_token"]})
+    assert stolen.status_code == 401
+
+def test_refresh_rejects_unknown_token(client):
+    response = client.post("/api/users/token/refresh", json={"refresh_token": "not-a-token"})
+    assert response.status_code == 401
+
+def test_password_change_drops_refresh_tokens(client, create_user_api):
+    username = f"pwchange_{str(uuid4())[:8]}"
+    user = create_user_api(username=username, email=f"{username}@example.com", password="pw")
+    tokens = _login(client, username, "pw")
+    assert client.patch(f"/api/users/{user['id']}", json={"password": "new"}).status_code == 200
+
+    response = client.post("/api/users/token/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
@@ -1,6 +1,11 @@
+import base64
+import json
 import pytest
 from uuid import uuid4
 
+from src.backend.schemas.pagination import Page
+from src.backend.schemas.workout import WorkoutOut
+
 def make_workout_payload(username="testuser", notes="Leg day", exercise_name="Squat", wt_type="Push", sets=None, created_time=None):
     payload = {
         "username": username,
@@ -15,6 +20,23 @@ def make_workout_payload(username="testuser", notes="Leg day", exercise_name="Sq
         payload["created_time"] = created_time
     return payload
 
+
+def _read_query_counts(client, count_queries, username, workout_id):
+    counts = {}
+    for path in [
+        "/api/workouts/",
+        f"/api/workouts/{workout_id}",
+        f"/api/workouts/user/{username}",
+        f"/api/workouts/user/{username}/latest",
+        f"/api/workouts/user/{username}/latest/Push",
+    ]:
+        with count_queries() as statements:
+            res = client.get(path)
+        assert res.status_code == 200
+        counts[path] = len(statements)
+    return counts
+
+
 def test_create_workout(client, setup_user_and_exercise_api):
     setup_user_and_exercise_api()
     response = client.post("/api/workouts/", json=make_workout_payload())
@@ -41,8 +63,8 @@ def test_get_all_workouts(client, setup_user_and_exercise_api):
         client.post("/api/workouts/", json=make_workout_payload())
     res = client.get("/api/workouts/")
     assert res.status_code == 200
-    assert isinstance(res.json(), list)
-    assert len(res.json()) >= 2
+    assert isinstance(res.json()["items"], list)
+    assert len(res.json()["items"]) >= 2
 
 def test_delete_workout(client, setup_user_and_exercise_api):
     setup_user_and_exercise_api()
@@ -80,4 +102,122 @@ def test_api_update_workout(client, setup_user_and_exercise_api):
     assert data["workout_type"] == "Push"
     assert len(data["logged_exercises"]) == 1
     assert len(data["logged_exercises"][0]["sets"]) == 2
-    assert data["logged_exercises"][0]["sets"][0]["weight"] == 140.0
\ No newline at end of file
+    assert data["logged_exercises"][0]["sets"][0]["weight"] == 140.0
+
+def test_workout_reads_use_constant_query_count(client, setup_user_and_exercise_api, count_queries):
+    setup_user_and_exercise_api()
+    client.post("/api/exercises/", json={"name": "Bench", "primary_muscles": ["chest"], "category": "Push"})
+    two_exercise_payload = make_workout_payload(sets=[
+        {"set_number": 1, "reps": 8, "weight": 100.0},
+        {"set_number": 2, "reps": 6, "weight": 110.0},
+    ])
+    two_exercise_payload["logged_exercises"].append({
+        "name": "Bench",
+        "sets": [{"set_number": 1, "reps": 5, "weight": 80.0}],
+    })
+
+    workout_id = client.post("/api/workouts/", json=two_exercise_payload).json()["id"]
+    small = _read_query_counts(client, count_queries, "testuser", workout_id)
+
+    for _ in range(15):
+        client.post("/api/workouts/", json=two_exercise_payload)
+    large = _read_query_counts(client, count_queries, "testuser", workout_id)
+
+    assert large == small
+    # workouts + logged exercises (with joined exercise) + sets
+    assert all(count <= 3 for count in large.values())
+
+def test_get_workouts_by_user_paginates_newest_first(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    for day in range(1, 6):
+        client.post("/api/workouts/", json=make_workout_payload(notes=f"Day {day}", created_time=f"2024-01-0{day}T10:00:00"))
+
+    first = client.get("/api/workouts/user/testuser", params={"limit": 2}).json()
+    assert first["limit"] == 2
+    assert [w["notes"] for w in first["items"]] == ["Day 5", "Day 4"]
+    assert first["next_cursor"]
+
+    second = client.get("/api/workouts/user/testuser", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    assert [w["notes"] for w in second["items"]] == ["Day 3", "Day 2"]
+
+    last = client.get("/api/workouts/user/testuser", params={"limit": 2, "cursor": second["next_cursor"]}).json()
+    assert [w["notes"] for w in last["items"]] == ["Day 1"]
+    assert last["next_cursor"] is None
+
+def test_workout_pages_validate_and_order_sets(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    sets = [{"set_number": n, "reps": 10 - n, "weight": 100.0 + n} for n in (3, 1, 2)]
+    assert client.post("/api/workouts/", json=make_workout_payload(sets=sets)).status_code == 201
+
+    for path in ("/api/workouts/", "/api/workouts/user/testuser"):
+        page = Page[WorkoutOut].model_validate(client.get(path).json())
+        logged_sets = page.items[0].logged_exercises[0].sets
+        assert [s.set_number for s in logged_sets] == [1, 2, 3]
+        assert [s.reps for s in logged_sets] == [9, 8, 7]
+
+def test_get_workouts_rejects_invalid_cursor(client):
+    res = client.get("/api/workouts/", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+
+def test_get_workouts_rejects_cursor_with_wrong_value_types(client):
+    # Well-formed base64 JSON of the right arity, but not strings.
+    cursor = base64.urlsafe_b64encode(json.dumps([1, 2]).encode()).decode().rstrip("=")
+    res = client.get("/api/workouts/", params={"cursor": cursor})
+    assert res.status_code == 400
+
+def test_get_workout_frequency_by_all_types(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    client.post("/api/workouts/", json=make_workout_payload(wt_type="Push"))
+    client.post("/api/workouts/", json=make_workout_payload(wt_type="Quads"))
+    res = client.get("/api/workouts/user/testuser/frequency")
+    assert res.status_code == 200
+    data = res.json()
+    assert data["Push"] == 1 and data["Quads"] == 1 and data["Pull"] == 0
+    assert len(data) == 8
+
+def test_create_workout_flags_personal_records(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    first = client.post("/api/workouts/", json=make_workout_payload())
+    assert first.status_code == 201
+    assert first.json()["personal_records"] == []
+
+    res = client.post("/api/workouts/", json=make_workout_payload(sets=[
+        {"set_number": 1, "reps": 8, "weight": 100.0},
+        {"set_number": 2, "reps": 3, "weight": 120.0},
+    ]))
+    assert res.status_code == 201
+    data = res.json()
+    heavy_set = next(s for le in data["logged_exercises"] for s in le["sets"] if s["set_number"] == 2)
+    assert data["personal_records"] == [{
+        "set_id": heavy_set["id"],
+        "exercise_id": data["logged_exercises"][0]["exercise"]["id"],
+        "records": ["weight", "e1rm"],
+    }]
+
+def test_get_workout_stats(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    client.post("/api/workouts/", json=make_workout_payload(wt_type="Push"))
+    client.post("/api/workouts/", json=make_workout_payload(wt_type="Quads", sets=[
+        {"set_number": 1, "reps": 5, "weight": 120.0},
+        {"set_number": 2, "reps": 5, "weight": 120.0},
+    ]))
+    res = client.get("/api/workouts/user/testuser/stats")
+    assert res.status_code == 200
+    data = res.json()
+    assert data["total_workouts"] == 2
+    assert data["workouts_by_type"]["Push"] == 1 and data["workouts_by_type"]["Quads"] == 1
+    assert data["avg_sets_per_workout"] == 1.5
+    assert data["avg_reps_per_set"] == pytest.approx(6.0)
+    assert data["most_common_exercises"] == ["Squat"]
+
+
+def test_workout_history_is_compressed_when_accepted(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    for day in range(1, 10):
+        client.post("/api/workouts/", json=make_workout_payload(notes=f"Day {day}", created_time=f"2024-01-0{day}T10:00:00"))
+
+    plain = client.get("/api/workouts/user/testuser", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/api/workouts/user/testuser", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert int(compressed.headers["Content-Length"]) * 4 < int(plain.headers["Content-Length"])
+    assert compressed.json() == plain.json()
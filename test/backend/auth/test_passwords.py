@@ -0,0 +1,50 @@
+import pytest
+from fastapi import HTTPException, status
+
+from src.backend.auth.passwords import (
+    PasswordHashPool,
+    build_context,
+    get_password_hash,
+    verify_password,
+)
+
+pytestmark = pytest.mark.asyncio
+
+async def test_pool_hashes_and_verifies_in_worker_process():
+    pool = PasswordHashPool(workers=1, max_pending=2)
+    try:
+        hashed = await pool.run(get_password_hash, "secret")
+        assert await pool.run(verify_password, "secret", hashed)
+        assert not await pool.run(verify_password, "wrong", hashed)
+        assert pool.pending == 0
+    finally:
+        pool.shutdown()
+
+async def test_inline_pool_when_workers_disabled():
+    pool = PasswordHashPool(workers=0, max_pending=1)
+    hashed = await pool.run(get_password_hash, "secret")
+    assert verify_password("secret", hashed)
+
+async def test_saturated_pool_rejects_with_503():
+    pool = PasswordHashPool(workers=0, max_pending=0)
+    with pytest.raises(HTTPException) as excinfo:
+        await pool.run(get_password_hash, "secret")
+    assert excinfo.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert excinfo.value.headers["Retry-After"] == "1"
+    assert pool.pending == 0
+
+async def test_calibrate_rounds_picks_highest_cost_under_target(monkeypatch):
+    from src.backend.auth import passwords
+
+    # Pretend bcrypt costs 2**rounds microseconds.
+    monkeypatch.setattr(passwords, "_verify_seconds", lambda scheme, rounds: 2 ** rounds / 1_000_000)
+    assert passwords.calibrate_rounds("bcrypt", target_ms=250) == 17
+    assert passwords.calibrate_rounds("bcrypt", target_ms=0) == 4
+
+    with pytest.raises(ValueError):
+        passwords.calibrate_rounds("md5_crypt", target_ms=250)
+
+async def test_build_context_flags_hashes_at_other_costs():
+    context = build_context("bcrypt", rounds=5)
+    assert not context.needs_update(context.hash("secret"))
+    assert context.needs_update(build_context("bcrypt", rounds=4).hash("secret"))
@@ -0,0 +1,64 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, select, update
+
+from src.backend.auth.refresh import create_refresh_token, prune_refresh_tokens, rotate_refresh_token
+from src.backend.crud import user as crud_user
+from src.backend.models.refresh_token import RefreshToken
+from src.backend.schemas.auth_user import AuthUserCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def test_user(db):
+    user = await crud_user.create_user(db, AuthUserCreate(username="refresher", email="refresher@example.com", password="pw"))
+    await db.commit()
+    return user
+
+
+async def _count_tokens(db, user_id):
+    return (await db.execute(select(func.count()).where(RefreshToken.user_id == user_id))).scalar_one()
+
+
+async def test_rotation_claims_the_token_in_the_database(db, async_session_factory, test_user):
+    token = await create_refresh_token(db, test_user.id)
+    await db.commit()
+    # This session now holds the row with used_at unset, as a concurrent request would.
+    stale = (await db.execute(select(RefreshToken))).scalar_one()
+
+    async with async_session_factory() as other:
+        assert await rotate_refresh_token(other, token) is not None
+
+    assert stale.used_at is None
+    assert await rotate_refresh_token(db, token) is None
+    assert await _count_tokens(db, test_user.id) == 0
+
+
+async def test_disabled_user_cannot_refresh(db, test_user):
+    token = await create_refresh_token(db, test_user.id)
+    await create_refresh_token(db, test_user.id)
+    test_user.disabled = True
+    await db.commit()
+
+    assert await rotate_refresh_token(db, token) is None
+    assert await _count_tokens(db, test_user.id) == 0
+
+
+async def test_expired_tokens_are_pruned(db, test_user):
+    token = await create_refresh_token(db, test_user.id)
+    await create_refresh_token(db, test_user.id)
+    await db.flush()
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash != "")
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(days=1))
+        .execution_options(synchronize_session=False)
+    )
+    await create_refresh_token(db, test_user.id)
+    await db.commit()
+
+    assert await prune_refresh_tokens(db, test_user.id) == 2
+    assert await _count_tokens(db, test_user.id) == 1
+    assert await rotate_refresh_token(db, token) is None
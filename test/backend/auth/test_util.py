@@ -1,14 +1,14 @@
 import os
 import pytest
+import pytest_asyncio
 import jwt
 from datetime import timedelta, timezone, datetime
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
 
-from src.backend.database.configure import SessionLocal, Base
 from src.backend.models.auth_user import AuthUser
 from src.backend.crud import user as crud_user
-from src.backend.schemas.auth_user import AuthUserCreate
+from src.backend.models.token_revocation import TokenRevocation
+from src.backend.schemas.auth_user import AuthUserCreate, AuthUserUpdate
 from src.backend.auth.util import (
     verify_password,
     get_password_hash,
@@ -18,35 +18,24 @@ from src.backend.auth.util import (
     get_current_user,
     get_current_active_user,
     get_admin_active_user,
+    revocation_list,
+    user_claims,
     SECRET_KEY,
     ALGORITHM,
 )
 
-# Ensure fresh tables before each test function
+# Fresh tables come from the shared async `db` fixture in conftest.py
 
-def setup_function():
-    engine = SessionLocal().bind
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-
-@pytest.fixture
-def db() -> Session:
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-
-@pytest.fixture
-def test_user(db):
+@pytest_asyncio.fixture
+async def test_user(db):
     user_in = AuthUserCreate(
         username="testuser",
         email="testuser@example.com",
         password="testpass"
     )
-    user = crud_user.create_user(db, user_in)
-    db.commit()
-    db.refresh(user)
+    user = await crud_user.create_user(db, user_in)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 # Password hashing and verification
@@ -60,15 +49,34 @@ def test_password_hash_and_verify():
 
 # User retrieval and authentication
 
-def test_get_user_and_authenticate_user(db, test_user):
-    fetched = get_user(db, test_user.username)
+@pytest.mark.asyncio
+async def test_get_user_and_authenticate_user(db, test_user):
+    fetched = await get_user(db, test_user.username)
     assert fetched.id == test_user.id
 
-    authed = authenticate_user(db, test_user.username, "testpass")
+    authed = await authenticate_user(db, test_user.username, "testpass")
     assert authed and authed.id == test_user.id
 
-    assert authenticate_user(db, test_user.username, "badpass") is None
-    assert authenticate_user(db, "nouser", "pass") is None
+    assert await authenticate_user(db, test_user.username, "badpass") is None
+    assert await authenticate_user(db, "nouser", "pass") is None
+
+@pytest.mark.asyncio
+async def test_authenticate_user_rehashes_stale_hash(db, test_user, monkeypatch):
+    from src.backend.auth import passwords
+
+    monkeypatch.setattr(passwords.password_pool, "workers", 0)
+    monkeypatch.setattr(passwords, "pwd_context", passwords.build_context("bcrypt", rounds=4))
+    old_hash = test_user.hashed_password
+
+    authed = await authenticate_user(db, test_user.username, "testpass")
+    assert authed.hashed_password != old_hash
+    assert "$04$" in authed.hashed_password
+    await db.refresh(authed)
+    assert verify_password("testpass", authed.hashed_password)
+
+    # Already at the configured cost: left alone.
+    current_hash = authed.hashed_password
+    assert (await authenticate_user(db, test_user.username, "testpass")).hashed_password == current_hash
 
 # JWT creation and decoding
 
@@ -91,6 +99,40 @@ async def test_get_current_user_success_and_failure(db, test_user):
         await get_current_user("invalid.token", db)
     assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
 
+@pytest.mark.asyncio
+async def test_get_current_user_from_claims_skips_user_query(db, test_user, count_queries):
+    token = create_access_token(user_claims(test_user), expires_delta=timedelta(minutes=1))
+    await get_current_user(token, db)  # warm the revocation list
+
+    with count_queries() as statements:
+        user = await get_current_user(token, db)
+    assert statements == []
+    assert user.id == test_user.id
+    assert user.username == test_user.username
+    assert user.is_admin is False and user.disabled is False
+
+@pytest.mark.asyncio
+async def test_update_user_revokes_outstanding_tokens(db, test_user):
+    token = create_access_token(user_claims(test_user), expires_delta=timedelta(minutes=1))
+    await crud_user.update_user(db, test_user.id, AuthUserUpdate(is_admin=True))
+
+    with pytest.raises(HTTPException) as excinfo:
+        await get_current_user(token, db)
+    assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    fresh = create_access_token(user_claims(test_user), expires_delta=timedelta(minutes=1))
+    assert (await get_current_user(fresh, db)).is_admin is True
+
+@pytest.mark.asyncio
+async def test_revocations_from_other_workers_are_picked_up_on_refresh(db, test_user):
+    token = create_access_token(user_claims(test_user), expires_delta=timedelta(minutes=1))
+    db.add(TokenRevocation(user_id=test_user.id, revoked_at=datetime.now(timezone.utc)))
+    await db.commit()
+
+    revocation_list.invalidate()
+    with pytest.raises(HTTPException):
+        await get_current_user(token, db)
+
 # Dependency: active and admin user checks
 
 @pytest.mark.asyncio
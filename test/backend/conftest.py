@@ -4,19 +4,28 @@ os.environ["TESTING"] = "1"
 os.environ["DB_SECRET_NAME"] = "dummy"
 
 import tempfile
+from datetime import datetime, timezone
 import pytest
+import pytest_asyncio
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from src.backend.main import app
-from src.backend.database.configure import Base, get_db
+from src.backend.api.exercise import catalog_cache
+from src.backend.crud.catalog import exercise_catalog
+from src.backend.database.configure import Base
+from src.backend.database.async_configure import get_db
 from src.backend.crud import user as crud_user
 from src.backend.crud import exercise as crud_exercise
+from src.backend.crud import workout as crud_workout
 from src.backend.schemas.auth_user import AuthUserCreate
 from src.backend.schemas.exercise import ExerciseCreate
+from src.backend.schemas.workout import WorkoutCreateSimple
 from src.backend.models.enums import ExerciseGroup
 from src.backend.auth.util import get_current_active_user
 
@@ -38,35 +47,59 @@ def test_engine_and_path():
     except OSError:
         pass
 
-@pytest.fixture(scope="function")
-def db(test_engine_and_path):
+@pytest.fixture(scope="session")
+def async_test_engine(test_engine_and_path):
+    # NullPool: the TestClient serves requests on its own event loop, so
+    # aiosqlite connections must never be reused across loops.
+    _, path = test_engine_and_path
+    return create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+
+@pytest.fixture(scope="session")
+def async_session_factory(async_test_engine):
+    return async_sessionmaker(bind=async_test_engine, expire_on_commit=False, class_=AsyncSession)
+
+@pytest.fixture
+def count_queries(async_test_engine):
+    """Context manager collecting every SQL statement run through the async engine."""
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(async_test_engine.sync_engine, "before_cursor_execute", _record)
+    return _count
+
+@pytest_asyncio.fixture(scope="function")
+async def db(test_engine_and_path, async_session_factory):
     engine, _ = test_engine_and_path
-    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    exercise_catalog.invalidate()
 
-    db = SessionLocal()
-    try:
+    async with async_session_factory() as db:
         yield db
-    finally:
-        db.close()
 
 # -- TestClient fixture ---------------------------------------------------
 @pytest.fixture(scope="function")
-def client(test_engine_and_path):
+def client(test_engine_and_path, async_session_factory):
     engine, _ = test_engine_and_path
-    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
-    def override_get_db():
-        db = SessionLocal()
-        try:
+    async def override_get_db():
+        async with async_session_factory() as db:
             yield db
-        finally:
-            db.close()
 
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # Catalog versions restart at 0 with the fresh tables.
+    catalog_cache.clear()
+    exercise_catalog.invalidate()
 
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
@@ -74,25 +107,25 @@ def client(test_engine_and_path):
     app.dependency_overrides.clear()
 
 # -- Helper fixtures -------------------------------------------------------
-@pytest.fixture
-def test_user(db):
+@pytest_asyncio.fixture
+async def test_user(db):
     user_in = AuthUserCreate(
         email="wktest@example.com",
         username=f"test_{uuid4().hex[:6]}",
         password="testpass",
     )
-    user = crud_user.create_user(db, user_in)
-    db.commit()
-    db.refresh(user)
+    user = await crud_user.create_user(db, user_in)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 @pytest.fixture
 def create_user(db):
-    def _create(username="testuser", email="test@example.com", password="secret123", **extra_fields):
+    async def _create(username="testuser", email="test@example.com", password="secret123", **extra_fields):
         user_in = AuthUserCreate(username=username, email=email, password=password, **extra_fields)
-        user = crud_user.create_user(db, user_in)
-        db.commit()
-        db.refresh(user)
+        user = await crud_user.create_user(db, user_in)
+        await db.commit()
+        await db.refresh(user)
         return user
     return _create
 
@@ -135,7 +168,7 @@ def make_logged_exercise():
 def setup_user_and_exercise_api(client, override_current_user):
     def _setup(username="testuser", email="test@example.com", exercise_name="Squat", category="Quads"):
         client.post("/api/users/", json={"email": email, "username": username, "password": "password"})
-        existing = client.get("/api/exercises/").json()
+        existing = client.get("/api/exercises/").json()["items"]
         if not any(e["name"] == exercise_name for e in existing):
             client.post(
                 "/api/exercises/",
@@ -164,8 +197,8 @@ def setup_logged_workout_api(client, override_current_user, setup_user_and_exerc
         return {"username": username, "workout_id": data["id"], "exercise_name": exercise_name}
     return _setup
 
-@pytest.fixture
-def test_exercise(db):
+@pytest_asyncio.fixture
+async def test_exercise(db):
     ex = ExerciseCreate(
         name="Deadlift",
         primary_muscles=["back"],
@@ -173,4 +206,35 @@ def test_exercise(db):
         description="Posterior chain movement",
         category=ExerciseGroup.PULL,
     )
-    return crud_exercise.create_exercise(db, ex, None)
\ No newline at end of file
+    return await crud_exercise.create_exercise(db, ex, None)
+
+@pytest.fixture
+def create_test_workout(db, test_user, make_logged_exercise):
+    """Create a workout for `test_user` on 2024-01-`day` through the CRUD write path.
+
+    `entries` is a list of (exercise name, sets); it defaults to one Deadlift
+    with `sets`. `create` picks the write path, e.g. create_workout_with_records.
+    """
+    async def _create(sets=((5, 100.0),), day=1, workout_type=None, entries=None, create=crud_workout.create_workout):
+        entries = entries if entries is not None else [("Deadlift", sets)]
+        return await create(db, WorkoutCreateSimple(
+            username=test_user.username,
+            created_time=datetime(2024, 1, day, tzinfo=timezone.utc),
+            workout_type=workout_type,
+            logged_exercises=[make_logged_exercise(name, list(entry_sets)) for name, entry_sets in entries],
+        ))
+    return _create
+
+@pytest.fixture
+def assert_matches_rebuild(db, test_user):
+    """Check a maintained rollup against a rebuild from the raw tables.
+
+    `read(db, user_id)` returns the test user's rows and `rebuild(db, user_ids)`
+    recomputes them in place; returns the rows as they were maintained.
+    """
+    async def _assert(read, rebuild):
+        maintained = await read(db, test_user.id)
+        await rebuild(db, [test_user.id])
+        assert await read(db, test_user.id) == maintained
+        return maintained
+    return _assert
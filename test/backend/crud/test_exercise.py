@@ -1,12 +1,17 @@
 import pytest
 from uuid import uuid4
+from sqlalchemy import text
 
 from src.backend.crud import exercise as crud_exercise
+from src.backend.crud.catalog import EXERCISE_CATALOG, bump_catalog_version, exercise_catalog
+from src.backend.models.exercise import Exercise
 from src.backend.schemas.exercise import ExerciseCreate, ExerciseUpdate
 from src.backend.models.enums import ExerciseGroup
 
+pytestmark = pytest.mark.asyncio
 
-def test_create_exercise(db):
+
+async def test_create_exercise(db):
     exercise = ExerciseCreate(
         name="Deadlift",
         primary_muscles=["back", "glutes"],
@@ -14,14 +19,14 @@ def test_create_exercise(db):
         description="Posterior chain compound lift",
         category=ExerciseGroup.PULL
     )
-    created = crud_exercise.create_exercise(db, exercise, None)
+    created = await crud_exercise.create_exercise(db, exercise, None)
 
     assert created.id is not None
     assert created.name == "Deadlift"
     assert "glutes" in created.primary_muscles
 
 
-def test_create_exercise_with_auth_user(db, test_user):
+async def test_create_exercise_with_auth_user(db, test_user):
     exercise = ExerciseCreate(
         name="Bench Press",
         primary_muscles=["chest", "triceps"],
@@ -29,14 +34,14 @@ def test_create_exercise_with_auth_user(db, test_user):
         description="Upper-body push movement",
         category=ExerciseGroup.PUSH
     )
-    created = crud_exercise.create_exercise(db, exercise, test_user)
+    created = await crud_exercise.create_exercise(db, exercise, test_user)
 
     assert created.id is not None
     assert created.name == "Bench Press"
     assert created.user_id == test_user.id
 
 
-def test_create_batch_exercise(db):
+async def test_create_batch_exercise(db):
     e1 = ExerciseCreate(
         name="Deadlift",
         primary_muscles=["back", "glutes"],
@@ -51,13 +56,13 @@ def test_create_batch_exercise(db):
         description="Leg compound lift",
         category=ExerciseGroup.QUADS
     )
-    created = crud_exercise.create_batch_exercise(db, [e1, e2], None)
+    created = await crud_exercise.create_batch_exercise(db, [e1, e2], None)
     assert len(created) == 2
     assert created[0].name == "Deadlift"
     assert created[1].primary_muscles[0] == "quads"
 
 
-def test_create_batch_exercise_with_auth_user(db, test_user):
+async def test_create_batch_exercise_with_auth_user(db, test_user):
     e1 = ExerciseCreate(
         name=f"Test1_{uuid4().hex[:6]}",
         primary_muscles=["m1"],
@@ -68,12 +73,12 @@ def test_create_batch_exercise_with_auth_user(db, test_user):
         primary_muscles=["m2"],
         category=ExerciseGroup.PUSH
     )
-    created = crud_exercise.create_batch_exercise(db, [e1, e2], test_user)
+    created = await crud_exercise.create_batch_exercise(db, [e1, e2], test_user)
     assert all(ex.user_id == test_user.id for ex in created)
 
 
-def test_get_exercise_by_id(db, test_user):
-    created = crud_exercise.create_exercise(
+async def test_get_exercise_by_id(db, test_user):
+    created = await crud_exercise.create_exercise(
         db,
         ExerciseCreate(
             name="Pull-up",
@@ -84,15 +89,15 @@ def test_get_exercise_by_id(db, test_user):
         ),
         None
     )
-    fetched = crud_exercise.get_exercise_by_id(db, created.id, None)
+    fetched = await crud_exercise.get_exercise_by_id(db, created.id, None)
 
     assert fetched.id == created.id
     assert fetched.name == "Pull-up"
 
 
-def test_get_exercise_by_id_unauthorized(db, test_user, create_user):
-    other = create_user(username="other", email="other@example.com", password="pass")
-    exercise = crud_exercise.create_exercise(
+async def test_get_exercise_by_id_unauthorized(db, test_user, create_user):
+    other = await create_user(username="other", email="other@example.com", password="pass")
+    exercise = await crud_exercise.create_exercise(
         db,
         ExerciseCreate(
             name="Dip",
@@ -101,47 +106,47 @@ def test_get_exercise_by_id_unauthorized(db, test_user, create_user):
         ),
         other
     )
-    fetched = crud_exercise.get_exercise_by_id(db, exercise.id, test_user)
+    fetched = await crud_exercise.get_exercise_by_id(db, exercise.id, test_user)
     assert fetched is None
 
 
-def test_get_all_exercises(db):
-    crud_exercise.create_exercise(db, ExerciseCreate(
+async def test_get_all_exercises(db):
+    await crud_exercise.create_exercise(db, ExerciseCreate(
         name="Bench Press",
         primary_muscles=["chest", "triceps"],
         secondary_muscles=["shoulders"],
         category=ExerciseGroup.PUSH
     ), None)
-    crud_exercise.create_exercise(db, ExerciseCreate(
+    await crud_exercise.create_exercise(db, ExerciseCreate(
         name="Squat",
         primary_muscles=["quads", "glutes"],
         category=ExerciseGroup.QUADS
     ), None)
 
     # pass None positionally; do not use user=None
-    all_ex = crud_exercise.get_all_exercises(db, None)
+    all_ex = await crud_exercise.get_all_exercises(db, None)
     names = [ex.name for ex in all_ex]
     assert set(names) == {"Bench Press", "Squat"}
 
 
-def test_get_all_exercises_authorization(db, test_user, create_user):
-    crud_exercise.create_exercise(db, ExerciseCreate(name="Pub", primary_muscles=["a"], category=ExerciseGroup.PULL), None)
-    owned = crud_exercise.create_exercise(db, ExerciseCreate(name="Own", primary_muscles=["b"], category=ExerciseGroup.PULL), test_user)
-    other = create_user(username="other2", email="o2@example.com", password="pw")
-    crud_exercise.create_exercise(db, ExerciseCreate(name="Other", primary_muscles=["c"], category=ExerciseGroup.PULL), other)
+async def test_get_all_exercises_authorization(db, test_user, create_user):
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Pub", primary_muscles=["a"], category=ExerciseGroup.PULL), None)
+    owned = await crud_exercise.create_exercise(db, ExerciseCreate(name="Own", primary_muscles=["b"], category=ExerciseGroup.PULL), test_user)
+    other = await create_user(username="other2", email="o2@example.com", password="pw")
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Other", primary_muscles=["c"], category=ExerciseGroup.PULL), other)
 
-    results = crud_exercise.get_all_exercises(db, test_user)
+    results = await crud_exercise.get_all_exercises(db, test_user)
     ids = [ex.id for ex in results]
     assert owned.id in ids
     assert all(ex.user_id != other.id for ex in results)
 
 
-def test_get_all_exercises_categorized(db):
-    p = crud_exercise.create_exercise(db, ExerciseCreate(name="A1", primary_muscles=["x"], category=ExerciseGroup.PULL), None)
-    u = crud_exercise.create_exercise(db, ExerciseCreate(name="P1", primary_muscles=["y"], category=ExerciseGroup.PUSH), None)
+async def test_get_all_exercises_categorized(db):
+    p = await crud_exercise.create_exercise(db, ExerciseCreate(name="A1", primary_muscles=["x"], category=ExerciseGroup.PULL), None)
+    u = await crud_exercise.create_exercise(db, ExerciseCreate(name="P1", primary_muscles=["y"], category=ExerciseGroup.PUSH), None)
 
     # pass None positionally
-    grouped = crud_exercise.get_all_exercises_categorized(db, None)
+    grouped = await crud_exercise.get_all_exercises_categorized(db, None)
 
     assert ExerciseGroup.PULL.value in grouped
     assert ExerciseGroup.PUSH.value in grouped
@@ -149,13 +154,13 @@ def test_get_all_exercises_categorized(db):
     assert any(ex.id == u.id for ex in grouped[ExerciseGroup.PUSH.value])
 
 
-def test_update_exercise(db, test_user):
-    created = crud_exercise.create_exercise(
+async def test_update_exercise(db, test_user):
+    created = await crud_exercise.create_exercise(
         db,
         ExerciseCreate(name="Row", primary_muscles=["back"], category=ExerciseGroup.PULL),
         test_user
     )
-    updated = crud_exercise.update_exercise(
+    updated = await crud_exercise.update_exercise(
         db,
         created.id,
         ExerciseUpdate(name="Barbell Row", primary_muscles=["back", "biceps"]),
@@ -166,67 +171,176 @@ def test_update_exercise(db, test_user):
     assert "biceps" in updated.primary_muscles
 
 
-def test_update_exercise_invalid_id(db, test_user):
-    result = crud_exercise.update_exercise(db, uuid4(), ExerciseUpdate(name="X"), test_user)
+async def test_update_exercise_invalid_id(db, test_user):
+    result = await crud_exercise.update_exercise(db, uuid4(), ExerciseUpdate(name="X"), test_user)
     assert result is None
 
 
-def test_update_exercise_unauthorized(db, test_user, create_user):
-    other = create_user(username="other3", email="o3@example.com", password="pw")
-    ex = crud_exercise.create_exercise(db, ExerciseCreate(name="Z", primary_muscles=["z"], category=ExerciseGroup.PULL), other)
-    updated = crud_exercise.update_exercise(db, ex.id, ExerciseUpdate(name="NewZ"), test_user)
+async def test_update_exercise_unauthorized(db, test_user, create_user):
+    other = await create_user(username="other3", email="o3@example.com", password="pw")
+    ex = await crud_exercise.create_exercise(db, ExerciseCreate(name="Z", primary_muscles=["z"], category=ExerciseGroup.PULL), other)
+    updated = await crud_exercise.update_exercise(db, ex.id, ExerciseUpdate(name="NewZ"), test_user)
     assert updated is None
 
 
-def test_delete_exercise(db, test_user):
-    created = crud_exercise.create_exercise(db, ExerciseCreate(name="Press", primary_muscles=["s"], category=ExerciseGroup.PUSH), test_user)
-    res = crud_exercise.delete_exercise(db, created.id, test_user)
+async def test_delete_exercise(db, test_user):
+    created = await crud_exercise.create_exercise(db, ExerciseCreate(name="Press", primary_muscles=["s"], category=ExerciseGroup.PUSH), test_user)
+    res = await crud_exercise.delete_exercise(db, created.id, test_user)
     assert res is True
-    assert crud_exercise.get_exercise_by_id(db, created.id, test_user) is None
+    assert await crud_exercise.get_exercise_by_id(db, created.id, test_user) is None
 
 
-def test_delete_exercise_invalid_id(db, test_user):
-    assert not crud_exercise.delete_exercise(db, uuid4(), test_user)
+async def test_delete_exercise_invalid_id(db, test_user):
+    assert not await crud_exercise.delete_exercise(db, uuid4(), test_user)
 
 
-def test_delete_exercise_unauthorized(db, test_user, create_user):
-    other = create_user(username="other4", email="o4@example.com", password="pw")
-    ex = crud_exercise.create_exercise(db, ExerciseCreate(name="Del", primary_muscles=["d"], category=ExerciseGroup.PULL), other)
-    res = crud_exercise.delete_exercise(db, ex.id, test_user)
+async def test_delete_exercise_unauthorized(db, test_user, create_user):
+    other = await create_user(username="other4", email="o4@example.com", password="pw")
+    ex = await crud_exercise.create_exercise(db, ExerciseCreate(name="Del", primary_muscles=["d"], category=ExerciseGroup.PULL), other)
+    res = await crud_exercise.delete_exercise(db, ex.id, test_user)
     assert res is False
-    assert crud_exercise.get_exercise_by_id(db, ex.id, other) is not None
+    assert await crud_exercise.get_exercise_by_id(db, ex.id, other) is not None
 
 
 # Admin access behavior
 
-def test_admin_can_update_any_exercise(db, create_user):
-    owner = create_user("someone", "s@x.com", "pw")
-    admin = create_user("admin1", "admin@a.com", "pw", is_admin=True)
-    ex = crud_exercise.create_exercise(db, ExerciseCreate(name="AdminUpdate", primary_muscles=["x"], category=ExerciseGroup.PULL), owner)
+async def test_admin_can_update_any_exercise(db, create_user):
+    owner = await create_user("someone", "s@x.com", "pw")
+    admin = await create_user("admin1", "admin@a.com", "pw", is_admin=True)
+    ex = await crud_exercise.create_exercise(db, ExerciseCreate(name="AdminUpdate", primary_muscles=["x"], category=ExerciseGroup.PULL), owner)
 
-    updated = crud_exercise.update_exercise(db, ex.id, ExerciseUpdate(name="AdminDidThis"), admin)
+    updated = await crud_exercise.update_exercise(db, ex.id, ExerciseUpdate(name="AdminDidThis"), admin)
     assert updated is not None
     assert updated.name == "AdminDidThis"
 
 
-def test_admin_can_delete_any_exercise(db, create_user):
-    owner = create_user("someone2", "s2@x.com", "pw")
-    admin = create_user("admin2", "admin2@a.com", "pw", is_admin=True)
-    ex = crud_exercise.create_exercise(db, ExerciseCreate(name="AdminDel", primary_muscles=["x"], category=ExerciseGroup.PUSH), owner)
+async def test_admin_can_delete_any_exercise(db, create_user):
+    owner = await create_user("someone2", "s2@x.com", "pw")
+    admin = await create_user("admin2", "admin2@a.com", "pw", is_admin=True)
+    ex = await crud_exercise.create_exercise(db, ExerciseCreate(name="AdminDel", primary_muscles=["x"], category=ExerciseGroup.PUSH), owner)
 
-    deleted = crud_exercise.delete_exercise(db, ex.id, admin)
+    deleted = await crud_exercise.delete_exercise(db, ex.id, admin)
     assert deleted is True
 
 
-def test_admin_sees_all_exercises(db, create_user):
-    user1 = create_user("bob", "bob@x.com", "pw")
-    user2 = create_user("jess", "jess@x.com", "pw")
-    admin = create_user("admin3", "admin3@x.com", "pw", is_admin=True)
+async def test_admin_sees_all_exercises(db, create_user):
+    user1 = await create_user("bob", "bob@x.com", "pw")
+    user2 = await create_user("jess", "jess@x.com", "pw")
+    admin = await create_user("admin3", "admin3@x.com", "pw", is_admin=True)
 
-    crud_exercise.create_exercise(db, ExerciseCreate(name="Pub1", primary_muscles=["a"], category=ExerciseGroup.PULL), None)
-    crud_exercise.create_exercise(db, ExerciseCreate(name="U1", primary_muscles=["b"], category=ExerciseGroup.PULL), user1)
-    crud_exercise.create_exercise(db, ExerciseCreate(name="U2", primary_muscles=["c"], category=ExerciseGroup.PULL), user2)
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Pub1", primary_muscles=["a"], category=ExerciseGroup.PULL), None)
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="U1", primary_muscles=["b"], category=ExerciseGroup.PULL), user1)
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="U2", primary_muscles=["c"], category=ExerciseGroup.PULL), user2)
 
-    all_ex = crud_exercise.get_all_exercises(db, admin)
+    all_ex = await crud_exercise.get_all_exercises(db, admin)
     names = [ex.name for ex in all_ex]
-    assert {"Pub1", "U1", "U2"}.issubset(set(names))
\ No newline at end of file
+    assert {"Pub1", "U1", "U2"}.issubset(set(names))
+
+async def test_get_all_exercises_name_filter_is_case_insensitive_and_respects_visibility(db, test_user, create_user):
+    other = await create_user("other5", "o5@example.com", "pw")
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Front Squat", primary_muscles=["q"], category=ExerciseGroup.QUADS), None)
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Hack Squat", primary_muscles=["q"], category=ExerciseGroup.QUADS), other)
+
+    found = await crud_exercise.get_all_exercises(db, test_user, name="front SQUAT")
+    assert [ex.name for ex in found] == ["Front Squat"]
+
+    hidden = await crud_exercise.get_all_exercises(db, test_user, name="hack squat")
+    assert hidden == []
+
+
+async def test_name_filter_uses_lower_name_index(db):
+    plan = await db.execute(text("EXPLAIN QUERY PLAN SELECT id FROM exercises WHERE lower(name) = :n"), {"n": "squat"})
+    assert any("ix_exercises_name_lower" in row[-1] for row in plan.all())
+
+
+async def test_create_batch_exercise_skips_existing_and_repeated_names(db):
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Existing", primary_muscles=["a"], category=ExerciseGroup.PULL), None)
+    batch = [
+        ExerciseCreate(name="New1", primary_muscles=["b"], category=ExerciseGroup.PUSH),
+        ExerciseCreate(name="Existing", primary_muscles=["c"], category=ExerciseGroup.PULL),
+        ExerciseCreate(name="New2", primary_muscles=["d"], category=ExerciseGroup.QUADS),
+        ExerciseCreate(name="New1", primary_muscles=["e"], category=ExerciseGroup.HAMS),
+    ]
+    created = await crud_exercise.create_batch_exercise(db, batch, None)
+
+    assert [ex.name for ex in created] == ["New1", "New2"]
+    assert created[0].primary_muscles == ["b"]
+    assert created[1].category == ExerciseGroup.QUADS
+    assert await crud_exercise.create_batch_exercise(db, batch, None) == []
+
+
+async def test_create_batch_exercise_uses_constant_statements(db, count_queries):
+    batch = [
+        ExerciseCreate(name=f"Bulk{i}", primary_muscles=["m"], category=ExerciseGroup.CUSTOM)
+        for i in range(100)
+    ]
+    await exercise_catalog.load(db)
+    with count_queries() as statements:
+        created = await crud_exercise.create_batch_exercise(db, batch, None)
+
+    assert len(created) == 100
+    # existence check of names the catalog index does not know + one multi-row INSERT ... ON CONFLICT DO NOTHING + catalog version bump
+    assert len(statements) == 3
+    assert "ON CONFLICT" in statements[1]
+    assert "catalog_versions" in statements[2]
+
+
+async def test_exercise_writes_bump_catalog_version(db, test_user):
+    from src.backend.crud.catalog import EXERCISE_CATALOG, get_catalog_version
+
+    assert await get_catalog_version(db, EXERCISE_CATALOG) == 0
+    exercise = await crud_exercise.create_exercise(
+        db, ExerciseCreate(name="Versioned", primary_muscles=["m"], category=ExerciseGroup.CUSTOM), test_user
+    )
+    assert await get_catalog_version(db, EXERCISE_CATALOG) == 1
+
+    await crud_exercise.update_exercise(db, exercise.id, ExerciseUpdate(description="d"), test_user)
+    assert await get_catalog_version(db, EXERCISE_CATALOG) == 2
+
+    await crud_exercise.create_batch_exercise(
+        db, [ExerciseCreate(name="Versioned", primary_muscles=["m"], category=ExerciseGroup.CUSTOM)], test_user
+    )
+    assert await get_catalog_version(db, EXERCISE_CATALOG) == 2  # nothing inserted
+
+    await crud_exercise.delete_exercise(db, exercise.id, test_user)
+    assert await get_catalog_version(db, EXERCISE_CATALOG) == 3
+
+
+async def test_resolve_exercise_names_served_from_catalog_index(db, count_queries):
+    bench = await crud_exercise.create_exercise(
+        db, ExerciseCreate(name="Bench", primary_muscles=["chest"], category=ExerciseGroup.PUSH), None
+    )
+    await exercise_catalog.load(db)
+    assert exercise_catalog.by_name == {"Bench": bench.id}
+
+    with count_queries() as statements:
+        ids, missing = await crud_exercise.resolve_exercise_names(db, ["Bench", "Bench"])
+    assert statements == []
+    assert ids == {"Bench": bench.id} and missing == []
+
+    # Unknown names fall back to one IN query.
+    with count_queries() as statements:
+        ids, missing = await crud_exercise.resolve_exercise_names(db, ["Bench", "Nope"])
+    assert len(statements) == 1
+    assert missing == ["Nope"]
+
+async def test_exercise_writes_invalidate_catalog_index(db):
+    await exercise_catalog.load(db)
+    squat = await crud_exercise.create_exercise(
+        db, ExerciseCreate(name="Squat", primary_muscles=["quads"], category=ExerciseGroup.QUADS), None
+    )
+    assert exercise_catalog.version is None
+
+    ids, _ = await crud_exercise.resolve_exercise_names(db, ["Squat"])
+    assert ids == {"Squat": squat.id}
+    assert "Squat" in exercise_catalog.by_name
+
+async def test_catalog_index_notices_writes_from_other_processes(db):
+    await exercise_catalog.load(db)
+    db.add(Exercise(name="Elsewhere", primary_muscles=["m"], category=ExerciseGroup.CUSTOM))
+    await bump_catalog_version(db, EXERCISE_CATALOG)
+    await db.commit()
+
+    exercise_catalog._next_check = 0.0  # refresh interval elapsed
+    await exercise_catalog.ensure_fresh(db)
+    assert "Elsewhere" in exercise_catalog.by_name
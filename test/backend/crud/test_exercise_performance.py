@@ -0,0 +1,76 @@
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import select
+from src.backend.crud import exercise as crud_exercise, logged_exercise as crud_log, workout as crud_workout
+from src.backend.crud.exercise_performance import get_last_performances, rebuild_exercise_performances
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise_performance import ExercisePerformance
+from src.backend.schemas.exercise import ExerciseCreate
+from src.backend.schemas.logged_exercise import LoggedExerciseCreate
+from src.backend.schemas.logged_exercise_set import LoggedExerciseSetCreate
+from src.backend.schemas.workout import WorkoutUpdate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _index(db, user_id):
+    result = await db.execute(
+        select(
+            ExercisePerformance.logged_exercise_id, ExercisePerformance.workout_id,
+            ExercisePerformance.exercise_id, ExercisePerformance.performed_at,
+        )
+        .where(ExercisePerformance.user_id == user_id)
+        .order_by(ExercisePerformance.logged_exercise_id)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def test_last_performances_returns_newest_session_per_exercise(db, test_user, create_test_workout):
+    exercises = await crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name=name, primary_muscles=["m"], category=ExerciseGroup.PUSH) for name in ("Press", "Dip", "Fly")
+    ], None)
+    press, dip, fly = (e.id for e in exercises)
+    await create_test_workout(day=1, entries=[("Press", [(5, 100.0)]), ("Dip", [(10, 0.0)])])
+    latest = await create_test_workout(day=8, entries=[("Press", [(5, 105.0), (4, 105.0)])])
+    await create_test_workout(day=4, entries=[("Press", [(5, 90.0)])])
+
+    performances = await get_last_performances(db, test_user.id, [dip, press, fly])
+    assert [p["exercise_id"] for p in performances] == [dip, press]
+    assert performances[1]["workout_id"] == latest.id
+    assert performances[1]["sets"] == [
+        {"set_number": 1, "reps": 5, "weight": 105.0},
+        {"set_number": 2, "reps": 4, "weight": 105.0},
+    ]
+    assert performances[0]["sets"] == [{"set_number": 1, "reps": 10, "weight": 0.0}]
+    assert await get_last_performances(db, test_user.id, []) == []
+
+
+async def test_workout_writes_keep_index_in_step(db, test_user, test_exercise, create_test_workout, assert_matches_rebuild):
+    first = await create_test_workout([(5, 100.0)], day=1)
+    second = await create_test_workout([(5, 110.0)], day=2)
+    await assert_matches_rebuild(_index, rebuild_exercise_performances)
+
+    # Moving the older workout after the newer one makes it the last performance.
+    await crud_workout.update_workout(db, first.id, WorkoutUpdate(created_time=datetime(2024, 1, 3, tzinfo=timezone.utc)))
+    await assert_matches_rebuild(_index, rebuild_exercise_performances)
+    (performance,) = await get_last_performances(db, test_user.id, [test_exercise.id])
+    assert performance["workout_id"] == first.id
+
+    await crud_log.log_exercise(db, LoggedExerciseCreate(
+        exercise_id=test_exercise.id,
+        sets=[LoggedExerciseSetCreate(set_number=1, reps=3, weight=120.0)]
+    ), second.id)
+    await assert_matches_rebuild(_index, rebuild_exercise_performances)
+
+    await crud_workout.delete_workout(db, first.id)
+    rows = await assert_matches_rebuild(_index, rebuild_exercise_performances)
+    assert {row[1] for row in rows} == {second.id}
+
+
+async def test_latest_session_without_sets_is_still_the_last_performance(db, test_user, test_exercise, create_test_workout):
+    await create_test_workout([(5, 100.0)], day=1)
+    latest = await create_test_workout([], day=2)
+
+    (performance,) = await get_last_performances(db, test_user.id, [test_exercise.id])
+    assert performance["workout_id"] == latest.id
+    assert performance["sets"] == []
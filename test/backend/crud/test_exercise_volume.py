@@ -0,0 +1,89 @@
+import pytest
+from datetime import date, datetime, timezone
+from sqlalchemy import select
+from src.backend.crud import logged_exercise as crud_log, workout as crud_workout
+from src.backend.crud.exercise_volume import get_exercise_history, rebuild_weekly_volume, week_start
+from src.backend.models.exercise_weekly_volume import ExerciseWeeklyVolume
+from src.backend.schemas.logged_exercise import LoggedExerciseCreate
+from src.backend.schemas.logged_exercise_set import LoggedExerciseSetCreate
+from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+
+
+async def _rows(db, user_id):
+    result = await db.execute(
+        select(
+            ExerciseWeeklyVolume.exercise_id, ExerciseWeeklyVolume.week_start, ExerciseWeeklyVolume.set_count,
+            ExerciseWeeklyVolume.rep_count, ExerciseWeeklyVolume.volume, ExerciseWeeklyVolume.top_weight,
+        )
+        .where(ExerciseWeeklyVolume.user_id == user_id)
+        .order_by(ExerciseWeeklyVolume.week_start)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+def test_week_start_is_iso_monday():
+    assert week_start(datetime(2024, 1, 7, 23, tzinfo=timezone.utc)) == date(2024, 1, 1)
+    assert week_start(datetime(2024, 1, 8, 0, tzinfo=timezone.utc)) == date(2024, 1, 8)
+
+
+@pytest.mark.asyncio
+async def test_workout_writes_maintain_weekly_rows(db, test_user, test_exercise, make_logged_exercise, create_test_workout, assert_matches_rebuild):
+    monday = await create_test_workout([(5, 100.0), (5, 120.0)], day=1)
+    await create_test_workout([(8, 90.0)], day=3)
+    nextweek = await create_test_workout([(3, 140.0)], day=9)
+
+    rows = await assert_matches_rebuild(_rows, rebuild_weekly_volume)
+    assert [(r[1], r[2], r[3], r[4], r[5]) for r in rows] == [
+        (date(2024, 1, 1), 3, 18, 5 * 100 + 5 * 120 + 8 * 90, 120.0),
+        (date(2024, 1, 8), 1, 3, 420.0, 140.0),
+    ]
+
+    # Moving a workout to another week and dropping its heaviest set updates both weeks.
+    await crud_workout.update_workout(db, monday.id, WorkoutUpdate(
+        created_time=datetime(2024, 1, 10, tzinfo=timezone.utc),
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])],
+    ))
+    rows = await assert_matches_rebuild(_rows, rebuild_weekly_volume)
+    assert [(r[1], r[2], r[5]) for r in rows] == [(date(2024, 1, 1), 1, 90.0), (date(2024, 1, 8), 2, 140.0)]
+
+    await crud_workout.delete_workout(db, nextweek.id)
+    rows = await assert_matches_rebuild(_rows, rebuild_weekly_volume)
+    assert [(r[1], r[2], r[5]) for r in rows] == [(date(2024, 1, 1), 1, 90.0), (date(2024, 1, 8), 1, 100.0)]
+
+
+@pytest.mark.asyncio
+async def test_logged_exercise_writes_maintain_weekly_rows(db, test_exercise, create_test_workout, assert_matches_rebuild):
+    workout = await create_test_workout([(5, 100.0)], day=2)
+    await crud_log.log_exercise(db, LoggedExerciseCreate(
+        exercise_id=test_exercise.id,
+        sets=[LoggedExerciseSetCreate(set_number=1, reps=2, weight=150.0)]
+    ), workout.id)
+    rows = await assert_matches_rebuild(_rows, rebuild_weekly_volume)
+    assert [(r[2], r[5]) for r in rows] == [(2, 150.0)]
+
+    await crud_log.delete_logged_exercise(db, workout.id, test_exercise.id)
+    await assert_matches_rebuild(_rows, rebuild_weekly_volume)
+
+
+@pytest.mark.asyncio
+async def test_get_exercise_history_buckets_and_range(db, test_user, test_exercise, make_logged_exercise, create_test_workout):
+    for day, weight in [(2, 100.0), (9, 110.0), (16, 120.0), (30, 130.0)]:
+        await create_test_workout([(5, weight)], day=day)
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        created_time=datetime(2024, 2, 6, tzinfo=timezone.utc),
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 140.0)])]
+    ))
+
+    weekly = await get_exercise_history(db, test_user.id, test_exercise.id, date(2024, 1, 10), date(2024, 1, 31))
+    assert [(p["period_start"], p["top_weight"]) for p in weekly] == [
+        (date(2024, 1, 8), 110.0), (date(2024, 1, 15), 120.0), (date(2024, 1, 29), 130.0),
+    ]
+
+    monthly = await get_exercise_history(db, test_user.id, test_exercise.id, bucket="month")
+    assert [(p["period_start"], p["set_count"], p["volume"]) for p in monthly] == [
+        (date(2024, 1, 1), 4, 5 * (100 + 110 + 120 + 130)), (date(2024, 2, 1), 1, 700.0),
+    ]
+
+    with pytest.raises(ValueError):
+        await get_exercise_history(db, test_user.id, test_exercise.id, bucket="day")
@@ -0,0 +1,37 @@
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from uuid import uuid4
+
+from src.backend.crud.pagination import datetime_key, decode_cursor, encode_cursor, str_key, uuid_key
+from src.backend.crud import user as crud_user
+from src.backend.models.workout import Workout
+from src.backend.models.auth_user import AuthUser
+
+
+def test_cursor_round_trip():
+    keys = (datetime_key(Workout.created_time), uuid_key(Workout.id))
+    values = [datetime(2024, 5, 1, 12, 30), uuid4()]
+    assert decode_cursor(encode_cursor(values), keys) == values
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", encode_cursor(["only-one"]), encode_cursor(["x", "not-a-uuid"])])
+def test_decode_cursor_rejects_garbage(cursor):
+    keys = (str_key(AuthUser.username), uuid_key(AuthUser.id))
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor, keys)
+    assert excinfo.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_users_page_walks_every_user_once(db, create_user):
+    for name in ["dana", "al", "cy", "bo", "ed"]:
+        await create_user(username=name, email=f"{name}@example.com")
+
+    seen, cursor = [], None
+    while True:
+        users, cursor = await crud_user.get_users_page(db, cursor, limit=2)
+        seen.extend(u.username for u in users)
+        if cursor is None:
+            break
+    assert seen == ["al", "bo", "cy", "dana", "ed"]
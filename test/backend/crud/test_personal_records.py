@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import select
+from src.backend.crud import logged_exercise as crud_log, workout as crud_workout
+from src.backend.crud.personal_records import estimate_one_rep_max, rebuild_personal_records
+from src.backend.models.personal_record import PersonalRecord, RepRecord
+from src.backend.schemas.logged_exercise import LoggedExerciseCreate
+from src.backend.schemas.logged_exercise_set import LoggedExerciseSetCreate
+from src.backend.schemas.workout import WorkoutUpdate
+
+
+async def _records(db, user_id):
+    result = await db.execute(
+        select(PersonalRecord.exercise_id, PersonalRecord.max_weight, PersonalRecord.best_e1rm,
+               PersonalRecord.best_e1rm_weight, PersonalRecord.best_e1rm_reps)
+        .where(PersonalRecord.user_id == user_id)
+    )
+    reps = await db.execute(
+        select(RepRecord.exercise_id, RepRecord.weight, RepRecord.max_reps)
+        .where(RepRecord.user_id == user_id)
+        .order_by(RepRecord.weight)
+    )
+    return sorted(tuple(r) for r in result.all()), [tuple(r) for r in reps.all()]
+
+
+def _create_with_records(create_test_workout, sets):
+    return create_test_workout(sets, create=crud_workout.create_workout_with_records)
+
+
+def _flagged(workout, records):
+    return [(s.reps, s.weight, records[s.id]) for le in workout.logged_exercises
+            for s in sorted(le.sets, key=lambda s: s.set_number) if s.id in records]
+
+
+def test_estimate_one_rep_max():
+    assert estimate_one_rep_max(100.0, 1) == 100.0
+    assert estimate_one_rep_max(100.0, 10, "epley") == pytest.approx(133.33, abs=0.01)
+    assert estimate_one_rep_max(100.0, 10, "brzycki") == pytest.approx(133.33, abs=0.01)
+    assert estimate_one_rep_max(100.0, 5, "brzycki") == pytest.approx(112.5)
+    assert estimate_one_rep_max(100.0, 0) == 0.0
+    with pytest.raises(ValueError):
+        estimate_one_rep_max(100.0, 5, "lombardi")
+
+
+@pytest.mark.asyncio
+async def test_first_session_is_baseline_and_later_sets_are_flagged(test_exercise, create_test_workout, assert_matches_rebuild):
+    _, records = await _create_with_records(create_test_workout, [(5, 100.0), (3, 120.0)])
+    assert records == {}
+    (record,), _ = await assert_matches_rebuild(_records, rebuild_personal_records)
+    assert record[1:] == (120.0, pytest.approx(132.0), 120.0, 3)
+
+    workout, records = await _create_with_records(create_test_workout, [(10, 100.0), (1, 125.0), (2, 90.0)])
+    assert _flagged(workout, records) == [(10, 100.0, ["reps", "e1rm"]), (1, 125.0, ["weight"])]
+    (record,), reps = await assert_matches_rebuild(_records, rebuild_personal_records)
+    assert record[1:] == (125.0, pytest.approx(100 * (1 + 10 / 30)), 100.0, 10)
+    assert [(weight, max_reps) for _, weight, max_reps in reps] == [(90.0, 2), (100.0, 10), (120.0, 3), (125.0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_deletes_and_edits_recompute_records(db, test_exercise, make_logged_exercise, create_test_workout, assert_matches_rebuild):
+    await _create_with_records(create_test_workout, [(5, 100.0)])
+    heavy, _ = await _create_with_records(create_test_workout, [(2, 150.0)])
+
+    await crud_workout.update_workout(db, heavy.id, WorkoutUpdate(
+        logged_exercises=[make_logged_exercise("Deadlift", [(2, 130.0)])]
+    ))
+    (record,), _ = await assert_matches_rebuild(_records, rebuild_personal_records)
+    assert record[1] == 130.0
+
+    await crud_workout.delete_workout(db, heavy.id)
+    (record,), reps = await assert_matches_rebuild(_records, rebuild_personal_records)
+    assert record[1] == 100.0
+    assert [(weight, max_reps) for _, weight, max_reps in reps] == [(100.0, 5)]
+
+
+@pytest.mark.asyncio
+async def test_logged_exercise_writes_maintain_records(db, test_exercise, create_test_workout, assert_matches_rebuild):
+    workout, _ = await _create_with_records(create_test_workout, [(5, 100.0)])
+    await crud_log.log_exercise(db, LoggedExerciseCreate(
+        exercise_id=test_exercise.id,
+        sets=[LoggedExerciseSetCreate(set_number=1, reps=1, weight=140.0)]
+    ), workout.id)
+    (record,), _ = await assert_matches_rebuild(_records, rebuild_personal_records)
+    assert record[1] == 140.0
+
+    await crud_log.delete_logged_exercise(db, workout.id, test_exercise.id)
+    await assert_matches_rebuild(_records, rebuild_personal_records)
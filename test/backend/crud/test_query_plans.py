@@ -0,0 +1,130 @@
+import pytest
+from contextlib import asynccontextmanager
+from sqlalchemy import create_engine, event, text
+
+from src.backend.crud import workout as crud_workout
+from src.backend.database.configure import Base
+from src.backend.database.create_indexes import create_missing_indexes, create_missing_tables
+from src.backend.models.enums import ExerciseGroup
+from src.backend.schemas.workout import WorkoutCreateSimple
+
+HOT_TABLES = ("workouts", "logged_exercises", "logged_exercise_sets")
+
+
+@pytest.fixture
+def explain_queries(db, async_test_engine):
+    """Capture every statement run in the block, then return SQLite's plan for each."""
+    @asynccontextmanager
+    async def _explain():
+        captured, plans = [], []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        event.listen(async_test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            yield plans
+        finally:
+            event.remove(async_test_engine.sync_engine, "before_cursor_execute", _record)
+        conn = await db.connection()
+        for statement, parameters in captured:
+            result = await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+            plans.append(" | ".join(row[-1] for row in result.all()))
+    return _explain
+
+
+def _assert_indexed(plans):
+    for plan in plans:
+        assert "USE TEMP B-TREE" not in plan, plan
+        for table in HOT_TABLES:
+            assert f"SCAN {table}" not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_hot_workout_queries_use_indexes(db, test_user, test_exercise, make_logged_exercise, explain_queries):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        workout_type=ExerciseGroup.PUSH,
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+    ))
+
+    async with explain_queries() as history_plans:
+        await crud_workout.get_workouts_page_by_name(test_user.username, db, limit=10)
+    async with explain_queries() as by_type_plans:
+        await crud_workout.get_last_workout_based_on_username_and_type(test_user.username, "Push", db)
+
+    _assert_indexed(history_plans + by_type_plans)
+    assert "ix_workouts_user_id_created_time" in history_plans[0]
+    assert "ix_workouts_user_id_type_created_time" in by_type_plans[0]
+    assert any("ix_logged_exercises_workout_id" in plan for plan in history_plans)
+    assert any("ix_logged_exercise_sets_logged_exercise_id" in plan for plan in history_plans)
+
+
+def test_create_missing_indexes_backfills_existing_database():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    assert create_missing_indexes(engine) == []
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_workouts_user_id_created_time"))
+        conn.execute(text("DROP INDEX ix_logged_exercise_sets_logged_exercise_id"))
+
+    assert set(create_missing_indexes(engine)) == {
+        "ix_workouts_user_id_created_time",
+        "ix_logged_exercise_sets_logged_exercise_id",
+    }
+    assert create_missing_indexes(engine) == []
+
+
+
+def test_create_missing_tables_adds_new_tables_without_touching_data():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    assert create_missing_tables(engine) == []
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE user_workout_summary"))
+        conn.execute(text("DROP TABLE exercise_performances"))
+        conn.execute(text("INSERT INTO catalog_versions (name, version) VALUES ('exercises', 7)"))
+
+    assert set(create_missing_tables(engine)) == {"user_workout_summary", "exercise_performances"}
+    assert create_missing_indexes(engine) == []
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT version FROM catalog_versions")).scalar_one() == 7
+
+@pytest.mark.asyncio
+async def test_last_performance_query_uses_user_exercise_time_index(db, test_user, test_exercise, make_logged_exercise, explain_queries):
+    from src.backend.crud.exercise_performance import get_last_performances
+
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+    ))
+
+    async with explain_queries() as plans:
+        await get_last_performances(db, test_user.id, [test_exercise.id])
+
+    assert len(plans) == 1
+    assert "SEARCH exercise_performances USING INDEX ix_exercise_performances_user_exercise_time" in plans[0]
+    assert "ix_logged_exercise_sets_logged_exercise_id" in plans[0]
+    # The window is fed in index order; only the rank-1 rows get sorted for output.
+    assert "RIGHT PART OF ORDER BY" not in plans[0]
+    assert "SCAN logged_exercise_sets" not in plans[0]
+
+
+@pytest.mark.asyncio
+async def test_workout_page_with_cursor_seeks_past_the_cursor(db, test_user, test_exercise, make_logged_exercise, explain_queries):
+    for _ in range(3):
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            workout_type=ExerciseGroup.PUSH,
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+    _, cursor = await crud_workout.get_workouts_page_by_name(test_user.username, db, limit=1)
+
+    async with explain_queries() as plans:
+        page, _ = await crud_workout.get_workouts_page_by_name(test_user.username, db, cursor=cursor, limit=1)
+
+    assert len(page) == 1
+    _assert_indexed(plans)
+    assert "ix_workouts_user_id_created_time (user_id=? AND (created_time,id)<(?,?))" in plans[0], plans[0]
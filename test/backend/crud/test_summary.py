@@ -0,0 +1,108 @@
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import delete, select
+from src.backend.crud import logged_exercise as crud_log, summary as crud_summary, workout as crud_workout
+from src.backend.crud.summary import rebuild_workout_summaries
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.user_workout_summary import UserWorkoutSummary
+from src.backend.schemas.logged_exercise import LoggedExerciseCreate
+from src.backend.schemas.logged_exercise_set import LoggedExerciseSetCreate
+from src.backend.schemas.workout import WorkoutUpdate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _stored(db, user_id):
+    result = await db.execute(
+        select(*(c for c in UserWorkoutSummary.__table__.c)).where(UserWorkoutSummary.user_id == user_id)
+    )
+    row = result.mappings().first()
+    return dict(row) if row is not None else None
+
+
+async def test_new_user_starts_with_zero_summary(db, test_user):
+    stored = await _stored(db, test_user.id)
+    assert stored["total_workouts"] == 0 and stored["total_volume"] == 0.0
+    assert stored["first_workout_time"] is None
+
+
+async def test_workout_writes_keep_summary_in_step(db, test_user, test_exercise, make_logged_exercise, create_test_workout, assert_matches_rebuild):
+    first = await create_test_workout([(5, 100.0), (5, 110.0)], day=1, workout_type=ExerciseGroup.PUSH)
+    await create_test_workout([(8, 60.0)], day=5, workout_type=ExerciseGroup.PULL)
+    last = await create_test_workout(day=9)
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert stored["total_workouts"] == 3
+    assert (stored["push_workouts"], stored["pull_workouts"]) == (1, 1)
+    assert stored["total_volume"] == pytest.approx(5 * 100 + 5 * 110 + 8 * 60 + 5 * 100)
+
+    await crud_workout.update_workout(db, first.id, WorkoutUpdate(
+        workout_type=ExerciseGroup.LOWER,
+        created_time=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        logged_exercises=[make_logged_exercise("Deadlift", [(3, 140.0)])],
+    ))
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert (stored["push_workouts"], stored["lower_workouts"]) == (0, 1)
+    assert stored["first_workout_time"].day == 3
+
+    await crud_workout.delete_workout(db, last.id)
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert stored["total_workouts"] == 2
+    assert stored["last_workout_time"].day == 5
+
+
+async def test_logged_exercise_writes_adjust_set_totals(db, test_user, test_exercise, create_test_workout, assert_matches_rebuild):
+    workout = await create_test_workout()
+    await crud_log.log_exercise(db, LoggedExerciseCreate(
+        exercise_id=test_exercise.id,
+        sets=[LoggedExerciseSetCreate(set_number=1, reps=6, weight=110.0)]
+    ), workout.id)
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert stored["total_sets"] == 2
+
+    await crud_log.delete_logged_exercise(db, workout.id, test_exercise.id)
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert stored["total_sets"] == 1
+
+
+async def test_missing_summary_is_rebuilt_on_next_write(db, test_user, test_exercise, create_test_workout, assert_matches_rebuild):
+    await create_test_workout()
+    await db.execute(delete(UserWorkoutSummary))
+    await db.commit()
+
+    # Reads fall back to the raw tables without writing.
+    stats = await crud_workout.get_workout_stats(test_user.username, db)
+    assert stats["total_workouts"] == 1
+    assert await _stored(db, test_user.id) is None
+
+    await create_test_workout(day=2)
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert stored["total_workouts"] == 2
+
+
+async def test_summary_seeded_by_a_concurrent_write_is_kept(test_exercise, create_test_workout, assert_matches_rebuild, monkeypatch):
+    await create_test_workout()
+    update_summary = crud_summary._update_summary
+    misses = [True]
+
+    async def _racing_update(db, user_id, values):
+        # The first UPDATE runs before another request seeds the row.
+        if misses:
+            misses.pop()
+            return 0
+        return await update_summary(db, user_id, values)
+
+    monkeypatch.setattr(crud_summary, "_update_summary", _racing_update)
+    await create_test_workout(day=2)
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert stored["total_workouts"] == 2
+
+
+async def test_rebuild_workout_summaries_repairs_drift(db, test_user, test_exercise, create_test_workout, assert_matches_rebuild):
+    await create_test_workout([(5, 100.0), (5, 100.0)])
+    await db.execute(UserWorkoutSummary.__table__.update().values(total_sets=999, total_workouts=0))
+    await db.commit()
+
+    assert await rebuild_workout_summaries(db) == 1
+    await db.commit()
+    stored = await assert_matches_rebuild(_stored, rebuild_workout_summaries)
+    assert (stored["total_workouts"], stored["total_sets"]) == (1, 2)
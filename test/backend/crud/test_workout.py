@@ -1,15 +1,23 @@
 import pytest
+from pydantic import TypeAdapter
+from typing import List
+from fastapi import HTTPException
 from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
+from sqlalchemy import select, text
 from src.backend.crud import workout as crud_workout
 from src.backend.models.enums import ExerciseGroup
-from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+from src.backend.models.workout import Workout
+from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutOut, WorkoutUpdate
 from src.backend.schemas.auth_user import AuthUserCreate
 from src.backend.schemas.exercise import ExerciseCreate
 from src.backend.crud import user as crud_user, exercise as crud_exercise
+from src.backend.crud.catalog import exercise_catalog
 
-def test_create_and_get_workout(db, test_user, test_exercise, make_logged_exercise):
-    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+pytestmark = pytest.mark.asyncio
+
+async def test_create_and_get_workout(db, test_user, test_exercise, make_logged_exercise):
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Heavy pulls",
         logged_exercises=[make_logged_exercise("Deadlift", [(5, 180.0)])]
@@ -18,67 +26,67 @@ def test_create_and_get_workout(db, test_user, test_exercise, make_logged_exerci
     assert workout.notes == "Heavy pulls"
     assert len(workout.logged_exercises) == 1
 
-    fetched = crud_workout.get_workout_by_workout_id(db, workout.id)
+    fetched = await crud_workout.get_workout_by_workout_id(db, workout.id)
     assert fetched.id == workout.id
 
-def test_update_workout_notes(db, test_user, test_exercise, make_logged_exercise):
-    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_update_workout_notes(db, test_user, test_exercise, make_logged_exercise):
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         logged_exercises=[make_logged_exercise("Deadlift", [(6, 150.0)])]
     ))
 
-    updated = crud_workout.update_workout(db, workout.id, WorkoutUpdate(notes="Updated note"))
+    updated = await crud_workout.update_workout(db, workout.id, WorkoutUpdate(notes="Updated note"))
     assert updated.notes == "Updated note"
 
-def test_update_workout_logged_exercises(db, test_user, test_exercise, make_logged_exercise):
-    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_update_workout_logged_exercises(db, test_user, test_exercise, make_logged_exercise):
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         logged_exercises=[make_logged_exercise("Deadlift", [(6, 150.0)])]
     ))
 
-    updated = crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=[make_logged_exercise("Deadlift", [(2, 180.0)])]))
+    updated = await crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=[make_logged_exercise("Deadlift", [(2, 180.0)])]))
     assert updated.logged_exercises is not None
     assert len(updated.logged_exercises) == 1
     assert updated.logged_exercises[0].sets[0].reps == 2
     assert updated.logged_exercises[0].sets[0].weight == 180  
 
-def test_delete_workout(db, test_user, test_exercise, make_logged_exercise):
-    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_delete_workout(db, test_user, test_exercise, make_logged_exercise):
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         logged_exercises=[make_logged_exercise("Deadlift", [(10, 100.0)])]
     ))
 
-    deleted = crud_workout.delete_workout(db, workout.id)
+    deleted = await crud_workout.delete_workout(db, workout.id)
     assert deleted is True
-    assert crud_workout.get_workout_by_workout_id(db, workout.id) is None
+    assert await crud_workout.get_workout_by_workout_id(db, workout.id) is None
 
-def test_get_last_workout(db, test_user, test_exercise, make_logged_exercise):
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_get_last_workout(db, test_user, test_exercise, make_logged_exercise):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="First workout",
         logged_exercises=[make_logged_exercise("Deadlift", [(8, 120.0)])]
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Second workout",
         logged_exercises=[make_logged_exercise("Deadlift", [(6, 140.0)])]
     ))
 
-    latest = crud_workout.get_last_workout(test_user.username, db)
+    latest = await crud_workout.get_last_workout(test_user.username, db)
 
     assert latest is not None
     assert latest.notes == "Second workout"
     assert len(latest.logged_exercises) == 1
     assert latest.logged_exercises[0].sets[0].reps == 6
 
-def test_get_last_workout_no_workouts(db):
-    crud_user.create_user(db, AuthUserCreate(email="noworkout@example.com", username="noworkout", password="abc"))
-    latest = crud_workout.get_last_workout("noworkout", db)
+async def test_get_last_workout_no_workouts(db):
+    await crud_user.create_user(db, AuthUserCreate(email="noworkout@example.com", username="noworkout", password="abc"))
+    latest = await crud_workout.get_last_workout("noworkout", db)
     assert latest is None
 
-def test_create_workout_with_workout_type(db, test_user, test_exercise, make_logged_exercise):
-    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_create_workout_with_workout_type(db, test_user, test_exercise, make_logged_exercise):
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Push session",
         workout_type=ExerciseGroup.PUSH,
@@ -89,8 +97,8 @@ def test_create_workout_with_workout_type(db, test_user, test_exercise, make_log
     assert workout.workout_type == ExerciseGroup.PUSH
     assert len(workout.logged_exercises) == 1
 
-def test_create_workout_without_workout_type(db, test_user, test_exercise, make_logged_exercise):
-    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_create_workout_without_workout_type(db, test_user, test_exercise, make_logged_exercise):
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Unspecified workout type",
         logged_exercises=[make_logged_exercise("Deadlift", [(10, 135.0)])]
@@ -100,98 +108,98 @@ def test_create_workout_without_workout_type(db, test_user, test_exercise, make_
     assert workout.workout_type is None
     assert len(workout.logged_exercises) == 1
 
-def test_get_last_workout_by_type_and_username(db, test_user, test_exercise, make_logged_exercise):
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_get_last_workout_by_type_and_username(db, test_user, test_exercise, make_logged_exercise):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Push 1",
         workout_type=ExerciseGroup.PUSH,
         logged_exercises=[make_logged_exercise("Deadlift", [(8, 100.0)])]
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Push 2",
         workout_type=ExerciseGroup.PUSH,
         logged_exercises=[make_logged_exercise("Deadlift", [(6, 120.0)])]
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Pull day",
         workout_type=ExerciseGroup.PULL,
         logged_exercises=[make_logged_exercise("Deadlift", [(5, 130.0)])]
     ))
 
-    result = crud_workout.get_last_workout_based_on_username_and_type(test_user.username, "Push", db)
+    result = await crud_workout.get_last_workout_based_on_username_and_type(test_user.username, "Push", db)
 
     assert result is not None
     assert result.notes == "Push 2"
     assert result.workout_type == ExerciseGroup.PUSH
 
-def test_get_last_workout_by_type_no_matching_type(db, test_user, test_exercise, make_logged_exercise):
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_get_last_workout_by_type_no_matching_type(db, test_user, test_exercise, make_logged_exercise):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Pull day only",
         workout_type=ExerciseGroup.PULL,
         logged_exercises=[make_logged_exercise("Deadlift", [(10, 100.0)])]
     ))
 
-    result = crud_workout.get_last_workout_based_on_username_and_type(test_user.username, "Push", db)
+    result = await crud_workout.get_last_workout_based_on_username_and_type(test_user.username, "Push", db)
 
     assert result is None
 
-def test_get_last_workout_by_type_for_different_user(db, make_logged_exercise):
-    crud_user.create_user(db, AuthUserCreate(email="user1@example.com", username="user1", password="a"))
-    crud_user.create_user(db, AuthUserCreate(email="user2@example.com", username="user2", password="b"))
+async def test_get_last_workout_by_type_for_different_user(db, make_logged_exercise):
+    await crud_user.create_user(db, AuthUserCreate(email="user1@example.com", username="user1", password="a"))
+    await crud_user.create_user(db, AuthUserCreate(email="user2@example.com", username="user2", password="b"))
 
-    crud_exercise.create_exercise(db, ExerciseCreate(
+    await crud_exercise.create_exercise(db, ExerciseCreate(
         name="Deadlift",
         primary_muscles=["back"],
         category=ExerciseGroup.PULL
     ), None)
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username="user2",
         notes="Quads day for user2",
         workout_type=ExerciseGroup.QUADS,
         logged_exercises=[make_logged_exercise("Deadlift", [(8, 90.0)])]
     ))
 
-    result = crud_workout.get_last_workout_based_on_username_and_type("user1", "Quads", db)
+    result = await crud_workout.get_last_workout_based_on_username_and_type("user1", "Quads", db)
     assert result is None
 
-def test_calculate_num_workouts_by_type(db, test_user, test_exercise, make_logged_exercise):
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_calculate_num_workouts_by_type(db, test_user, test_exercise, make_logged_exercise):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Push 1",
         workout_type=ExerciseGroup.PUSH,
         logged_exercises=[make_logged_exercise("Deadlift", [(8, 100.0)])]
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Push 2",
         workout_type=ExerciseGroup.PUSH,
         logged_exercises=[make_logged_exercise("Deadlift", [(6, 120.0)])]
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Pull day",
         workout_type=ExerciseGroup.PULL,
         logged_exercises=[make_logged_exercise("Deadlift", [(5, 130.0)])]
     ))
 
-    push_result = crud_workout.calculate_num_workouts_by_type(test_user.username, "Push", db)
-    pull_result = crud_workout.calculate_num_workouts_by_type(test_user.username, "Pull", db)
-    upper_result = crud_workout.calculate_num_workouts_by_type(test_user.username, "Upper", db)
+    push_result = await crud_workout.calculate_num_workouts_by_type(test_user.username, "Push", db)
+    pull_result = await crud_workout.calculate_num_workouts_by_type(test_user.username, "Pull", db)
+    upper_result = await crud_workout.calculate_num_workouts_by_type(test_user.username, "Upper", db)
 
     assert push_result is 2
     assert pull_result is 1
     assert upper_result is 0
 
-def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logged_exercise):
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+async def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logged_exercise):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Push 1",
         workout_type=ExerciseGroup.PUSH,
@@ -199,7 +207,7 @@ def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logg
         created_time=datetime.now(timezone.utc) - relativedelta(months=2)
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Pull 1",
         workout_type=ExerciseGroup.PULL,
@@ -207,7 +215,7 @@ def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logg
         created_time=datetime.now(timezone.utc)
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Quad 1",
         workout_type=ExerciseGroup.QUADS,
@@ -215,7 +223,7 @@ def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logg
         created_time=datetime.now(timezone.utc) - relativedelta(months=2)
     ))
 
-    crud_workout.create_workout(db, WorkoutCreateSimple(
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
         notes="Ham 1",
         workout_type=ExerciseGroup.HAMS,
@@ -223,5 +231,236 @@ def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logg
         created_time=datetime.now(timezone.utc)
     ))
 
-    result = crud_workout.calculate_num_workouts_by_month(test_user.username, db)
-    assert result == 2.0
\ No newline at end of file
+    result = await crud_workout.calculate_num_workouts_by_month(test_user.username, db)
+    assert result == 2.0
+
+@pytest.mark.parametrize("collection_loading,exercise_loading", [
+    ("selectin", "joined"),
+    ("joined", "joined"),
+    ("subquery", "selectin"),
+])
+async def test_workout_graph_options_load_full_graph(db, test_user, test_exercise, make_logged_exercise, collection_loading, exercise_loading):
+    await crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0), (3, 120.0)])]
+    ))
+    db.expunge_all()
+
+    result = await db.execute(
+        select(Workout).options(*crud_workout.workout_graph_options(collection_loading, exercise_loading))
+    )
+    workout = result.unique().scalars().one()
+    # Attribute access must not trigger IO on an AsyncSession
+    assert workout.logged_exercises[0].exercise.name == "Deadlift"
+    assert [s.reps for s in sorted(workout.logged_exercises[0].sets, key=lambda s: s.set_number)] == [5, 3]
+
+
+async def test_workout_graph_options_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        crud_workout.workout_graph_options("lazy")
+
+
+async def test_create_workout_reports_all_missing_exercises(db, test_user, test_exercise, make_logged_exercise):
+    with pytest.raises(HTTPException) as excinfo:
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            logged_exercises=[
+                make_logged_exercise("Deadlift", [(5, 100.0)]),
+                make_logged_exercise("Nope", [(5, 100.0)]),
+                make_logged_exercise("Also Nope", [(5, 100.0)]),
+            ]
+        ))
+    assert excinfo.value.status_code == 404
+    assert "'Nope'" in excinfo.value.detail and "'Also Nope'" in excinfo.value.detail
+
+
+async def test_create_workout_retries_after_exercise_deleted_elsewhere(db, test_user, make_logged_exercise):
+    await crud_exercise.create_exercise(db, ExerciseCreate(name="Gone", primary_muscles=["m"], category=ExerciseGroup.CUSTOM), None)
+    await exercise_catalog.load(db)
+    # Another worker deletes the exercise; this worker's index has not noticed yet.
+    await db.execute(text("DELETE FROM exercises WHERE name = 'Gone'"))
+    await db.commit()
+    await db.execute(text("PRAGMA foreign_keys = ON"))
+
+    try:
+        with pytest.raises(HTTPException) as excinfo:
+            await crud_workout.create_workout(db, WorkoutCreateSimple(
+                username=test_user.username,
+                logged_exercises=[make_logged_exercise("Gone", [(5, 100.0)])]
+            ))
+    finally:
+        await db.rollback()
+    assert excinfo.value.status_code == 404
+    assert "Gone" not in exercise_catalog.by_name
+
+
+async def test_create_workout_statement_count_is_independent_of_size(db, test_user, make_logged_exercise, count_queries):
+    names = [f"Lift {i}" for i in range(10)]
+    await crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name=name, primary_muscles=["m"], category=ExerciseGroup.CUSTOM) for name in names
+    ], None)
+    await exercise_catalog.load(db)
+
+    with count_queries() as small:
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            logged_exercises=[make_logged_exercise(names[0], [(5, 100.0)])]
+        ))
+    with count_queries() as large:
+        workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            logged_exercises=[make_logged_exercise(name, [(8, 50.0)] * 4) for name in names]
+        ))
+
+    assert len(large) == len(small)
+    assert len(workout.logged_exercises) == 10
+    assert sum(len(le.sets) for le in workout.logged_exercises) == 40
+
+
+def _writes(statements):
+    return [s.split()[0].upper() for s in statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
+
+
+async def test_update_workout_only_writes_changed_rows(db, test_user, make_logged_exercise, count_queries):
+    names = ["Row A", "Row B", "Row C"]
+    await crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name=name, primary_muscles=["m"], category=ExerciseGroup.PULL) for name in names
+    ], None)
+    sets = [(10, 50.0), (8, 55.0), (6, 60.0)]
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[make_logged_exercise(name, sets) for name in names]
+    ))
+    set_ids = {s.id for le in workout.logged_exercises for s in le.sets}
+
+    edited = [make_logged_exercise(name, sets) for name in names]
+    edited[1]["sets"][2]["reps"] = 7
+    with count_queries() as statements:
+        updated = await crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=edited))
+
+    rollups = ("user_workout_summary", "exercise_weekly_volume", "personal_records", "rep_records", "exercise_performances")
+    assert _writes([s for s in statements if not any(table in s for table in rollups)]) == ["UPDATE"]
+    assert {s.id for le in updated.logged_exercises for s in le.sets} == set_ids
+    row_b = next(le for le in updated.logged_exercises if le.exercise.name == "Row B")
+    assert sorted((s.set_number, s.reps) for s in row_b.sets) == [(1, 10), (2, 8), (3, 7)]
+
+
+async def test_update_workout_adds_and_removes_sets_and_exercises(db, test_user, make_logged_exercise):
+    names = ["Keep", "Drop", "Add"]
+    await crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name=name, primary_muscles=["m"], category=ExerciseGroup.PUSH) for name in names
+    ], None)
+    workout = await crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[
+            make_logged_exercise("Keep", [(5, 100.0), (5, 100.0), (5, 100.0)]),
+            make_logged_exercise("Drop", [(12, 20.0)]),
+        ]
+    ))
+    keep_id = next(le.id for le in workout.logged_exercises if le.exercise.name == "Keep")
+
+    updated = await crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=[
+        make_logged_exercise("Keep", [(5, 100.0)]),
+        make_logged_exercise("Add", [(8, 40.0), (8, 45.0)]),
+    ]))
+
+    by_name = {le.exercise.name: le for le in updated.logged_exercises}
+    assert set(by_name) == {"Keep", "Add"}
+    assert by_name["Keep"].id == keep_id
+    assert len(by_name["Keep"].sets) == 1
+    assert sorted(s.weight for s in by_name["Add"].sets) == [40.0, 45.0]
+
+
+async def test_calculate_num_workouts_by_all_types(db, test_user, test_exercise, make_logged_exercise):
+    for workout_type in [ExerciseGroup.PUSH, ExerciseGroup.PUSH, ExerciseGroup.LOWER, None]:
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            workout_type=workout_type,
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+
+    counts = await crud_workout.calculate_num_workouts_by_all_types(test_user.username, db)
+    assert counts == {group.value: 0 for group in ExerciseGroup} | {"Push": 2, "Lower": 1}
+
+
+async def test_frequency_stats_use_single_aggregate_query(db, test_user, test_exercise, make_logged_exercise, count_queries):
+    for _ in range(3):
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            workout_type=ExerciseGroup.PULL,
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+
+    with count_queries() as statements:
+        assert await crud_workout.calculate_num_workouts_by_month(test_user.username, db) == 3.0
+        assert await crud_workout.calculate_num_workouts_by_type(test_user.username, "Pull", db) == 3
+        await crud_workout.calculate_num_workouts_by_all_types(test_user.username, db)
+    assert len(statements) == 3
+    assert all("ORDER BY" not in statement for statement in statements)
+
+
+async def test_workout_payloads_page_matches_orm_serialization(db, test_user, make_logged_exercise, count_queries):
+    names = ["Pay A", "Pay B"]
+    await crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name=name, primary_muscles=["m"], category=ExerciseGroup.PUSH) for name in names
+    ], None)
+    for i in range(3):
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            created_time=datetime(2024, 1, i + 1, tzinfo=timezone.utc),
+            workout_type=ExerciseGroup.PUSH,
+            logged_exercises=[make_logged_exercise(name, [(5, 100.0), (3, 110.0)]) for name in names]
+        ))
+
+    orm_page, orm_cursor = await crud_workout.get_workouts_page_by_name(test_user.username, db, limit=2)
+    with count_queries() as statements:
+        payloads, cursor = await crud_workout.get_workout_payloads_page(db, limit=2, username=test_user.username)
+    assert len(statements) == 2
+    assert cursor == orm_cursor
+
+    adapter = TypeAdapter(List[WorkoutOut])
+    def normalized(items):
+        dumped = adapter.dump_python(adapter.validate_python(items, from_attributes=True), mode="json")
+        for workout in dumped:
+            workout["logged_exercises"].sort(key=lambda le: le["id"])
+            for le in workout["logged_exercises"]:
+                le["sets"].sort(key=lambda s: s["set_number"])
+        return dumped
+    assert normalized(payloads) == normalized(orm_page)
+
+
+async def test_get_workout_stats_aggregates_in_two_queries(db, test_user, make_logged_exercise, count_queries):
+    names = ["Stat A", "Stat B", "Stat C"]
+    await crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name=name, primary_muscles=["m"], category=ExerciseGroup.PUSH) for name in names
+    ], None)
+    sessions = [
+        (ExerciseGroup.PUSH, [("Stat A", [(10, 50.0), (8, 55.0)]), ("Stat B", [(12, 20.0)])]),
+        (ExerciseGroup.PUSH, [("Stat A", [(6, 60.0)])]),
+        (ExerciseGroup.PULL, [("Stat A", [(5, 70.0)]), ("Stat C", [(15, 10.0), (15, 10.0)])]),
+        (None, [("Stat B", [(9, 25.0)])]),
+    ]
+    for workout_type, entries in sessions:
+        await crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            workout_type=workout_type,
+            logged_exercises=[make_logged_exercise(name, sets) for name, sets in entries]
+        ))
+
+    with count_queries() as statements:
+        stats = await crud_workout.get_workout_stats(test_user.username, db, top_exercises=2)
+    assert len(statements) == 2
+
+    assert stats["total_workouts"] == 4
+    assert stats["workouts_by_type"] == {group.value: 0 for group in ExerciseGroup} | {"Push": 2, "Pull": 1}
+    assert stats["avg_sets_per_workout"] == pytest.approx(8 / 4)
+    assert stats["avg_reps_per_set"] == pytest.approx((10 + 8 + 12 + 6 + 5 + 15 + 15 + 9) / 8)
+    assert stats["most_common_exercises"] == ["Stat A", "Stat B"]
+
+
+async def test_get_workout_stats_for_user_without_workouts(db, test_user):
+    stats = await crud_workout.get_workout_stats(test_user.username, db)
+    assert stats["total_workouts"] == 0
+    assert stats["avg_sets_per_workout"] == 0.0
+    assert stats["avg_reps_per_set"] == 0.0
+    assert stats["most_common_exercises"] == []
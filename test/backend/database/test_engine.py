@@ -0,0 +1,121 @@
+import pytest
+from sqlalchemy import event, text
+
+from src.backend.database.engine import (
+    PoolSettings,
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    _engine_kwargs,
+    create_async_db_engine,
+    pool_stats,
+)
+from src.backend.models.base import Base
+from src.backend.models.auth_user import AuthUser
+from src.backend.models.user import User
+
+
+def test_single_declarative_base():
+    assert AuthUser.metadata is Base.metadata
+    assert User.metadata is Base.metadata
+
+
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "1")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "60")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    settings = PoolSettings.from_env("postgresql://u:p@db.example.com/app")
+    assert (settings.pool_size, settings.max_overflow, settings.pool_recycle) == (3, 1, 60)
+    assert settings.pool_pre_ping is False
+    assert settings.transaction_pooler is False
+
+    assert PoolSettings.from_env("postgresql://u:p@ep-x-pooler.us-east-2.aws.neon.tech/app").transaction_pooler
+
+
+class _ConnectAttempted(Exception):
+    pass
+
+
+async def _connect_params(engine) -> dict:
+    """The keyword arguments the dialect passes to the DBAPI connect(), without a server."""
+    captured = {}
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def _capture(dialect, conn_rec, cargs, cparams):
+        captured.update(cparams)
+        raise _ConnectAttempted
+
+    with pytest.raises(_ConnectAttempted):
+        async with engine.connect():
+            pass
+    await engine.dispose()
+    return captured
+
+
+@pytest.mark.asyncio
+async def test_transaction_pooler_disables_statement_caches(monkeypatch):
+    pytest.importorskip("asyncpg")
+    monkeypatch.delenv("DB_TRANSACTION_POOLER", raising=False)
+    engine = create_async_db_engine("postgresql+asyncpg://u:p@ep-x-pooler.us-east-2.aws.neon.tech/app", {"ssl": True})
+    assert engine.dialect.driver == "asyncpg"
+    assert isinstance(engine.sync_engine.pool, TimedAsyncAdaptedQueuePool)
+
+    params = await _connect_params(engine)
+    assert params["statement_cache_size"] == 0
+    assert params["prepared_statement_cache_size"] == 0
+    assert params["prepared_statement_name_func"]() != params["prepared_statement_name_func"]()
+    assert params["ssl"] is True
+
+    direct = create_async_db_engine(
+        "postgresql+asyncpg://u:p@db.example.com/app", settings=PoolSettings(statement_cache_size=50)
+    )
+    params = await _connect_params(direct)
+    assert params["statement_cache_size"] == 50
+    assert "prepared_statement_cache_size" not in params
+
+
+def test_sqlite_keeps_its_own_pool():
+    assert _engine_kwargs("sqlite:///:memory:", {}, PoolSettings(), is_async=False) == {"connect_args": {}}
+
+
+def _timed_sqlite_engine(tmp_path):
+    # create_sync_db_engine leaves SQLite on its default pool, so build the timed pool directly.
+    from sqlalchemy import create_engine
+    from src.backend.database.engine import _count_invalidations
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=2, max_overflow=0)
+    _count_invalidations(engine)
+    return engine
+
+
+def test_sync_pool_stats_track_checkouts_and_waits(tmp_path):
+    engine = _timed_sqlite_engine(tmp_path)
+    with engine.connect() as conn:
+        conn.execute(text("select 1"))
+        assert pool_stats(engine)["checked_out"] == 1
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["wait_count"] == 1
+    assert stats["size"] == 2
+    assert stats["wait_seconds_max"] >= 0
+
+
+def test_invalidations_are_counted(tmp_path):
+    engine = _timed_sqlite_engine(tmp_path)
+    with engine.connect() as conn:
+        conn.invalidate()
+    assert pool_stats(engine)["invalidated"] == 1
+
+    engine.dispose()
+    with engine.connect() as conn:
+        conn.invalidate()
+    assert pool_stats(engine)["invalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_engine_reports_pool_stats():
+    engine = create_async_db_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn:
+        await conn.execute(text("select 1"))
+    assert "status" in pool_stats(engine)
+    await engine.dispose()
@@ -1,4 +1,14 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
+from fastapi.testclient import TestClient
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 def test_root_endpoint(client):
     response = client.get("/api")
@@ -8,4 +18,71 @@ def test_root_endpoint(client):
 def test_custom_docs_endpoint(client):
     response = client.get("/api/custom-docs")
     assert response.status_code == 200
-    assert response.json() == {"message": "Hello from the backend!"}
\ No newline at end of file
+    assert response.json() == {"message": "Hello from the backend!"}
+
+def test_startup_does_not_wait_for_catalog_warmup(client, monkeypatch):
+    from src.backend.main import app
+    from src.backend.crud.catalog import exercise_catalog
+
+    async def _never_finishes(db):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(exercise_catalog, "warm", _never_finishes)
+    with TestClient(app) as fresh:
+        assert fresh.get("/api").status_code == 200
+        assert not app.state.catalog_warmup.done()
+    assert app.state.catalog_warmup.cancelled()
+
+def test_pool_stats_requires_admin(client, test_user):
+    from src.backend.main import app
+    from src.backend.auth.util import get_current_active_user
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        assert client.get("/api/pool-stats").status_code == 403
+        test_user.is_admin = True
+        response = client.get("/api/pool-stats")
+        assert response.status_code == 200
+        assert "pool" in response.json()
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+# Cold-start budget for `import src.backend.main`; generous so slow CI boxes pass.
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "5"))
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import src.backend.main
+elapsed = time.perf_counter() - start
+from src.backend.database import async_configure, configure
+print(json.dumps({
+    "seconds": elapsed,
+    "async_engine_built": async_configure.get_async_engine.cache_info().currsize,
+    "sync_engine_built": configure.get_engine.cache_info().currsize,
+    "boto3": "boto3" in sys.modules,
+    "postgresql_dialect": "sqlalchemy.dialects.postgresql" in sys.modules,
+}))
+"""
+
+def _import_main_in_fresh_process(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k not in ("TESTING", "DATABASE_URL", "DB_SECRET_NAME")}
+    # Run from an empty directory so no .env can supply a database either.
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_import_defers_database_setup(tmp_path):
+    probe = _import_main_in_fresh_process(tmp_path)
+    assert probe["async_engine_built"] == 0
+    assert probe["sync_engine_built"] == 0
+    assert not probe["boto3"]
+    assert not probe["postgresql_dialect"]
+
+def test_import_stays_within_budget(tmp_path):
+    probe = _import_main_in_fresh_process(tmp_path)
+    assert probe["seconds"] < IMPORT_BUDGET_SECONDS